@@ -1,81 +1,351 @@
-from typing import TypedDict, Annotated
+import asyncio
+import operator
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import cached_property
+from typing import TypedDict, Annotated, List
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
+from langgraph.config import get_stream_writer
+from langgraph.types import RetryPolicy, Send
 from models import CandidateProfile, JobDescription, DecisionOutput
 from resume_parser import ResumeParser
 from decision_agent import DecisionAgent
+from screening_agent import CombinedScreeningAgent
+from cache import ProfileCache, DecisionCache, canonical_hash
+from skill_matcher import prescore, build_reject_decision
+from text_preprocessing import count_tokens
+from candidate_index import CandidateIndex
+from ingestion import file_sha256, open_resume
+from checkpoints import get_checkpointer
+from singleflight import SingleFlight
+from metrics import track_node
+import config
+
+
+# Error prefixes by the node that failed
+NODE_ERRORS = {
+    "parse_resume": "Resume parsing failed",
+    "prescore": "Pre-scoring failed",
+    "decision": "Decision making failed",
+    "screen": "Screening failed"
+}
+
+
+def timed_node(node: str, func, afunc=None) -> RunnableLambda:
+    """Runnable for a graph node with latency, in-flight and error metrics"""
+    def run(state):
+        with track_node(node):
+            return func(state)
+    
+    async def arun(state):
+        with track_node(node):
+            return await afunc(state)
+    
+    return RunnableLambda(run, afunc=arun if afunc else None, name=node)
 
 
 class AgentState(TypedDict):
     """State shared between agents"""
-    resume_file: bytes
+    screening_id: str
+    resume_path: str
+    resume_sha256: str
     filename: str
     job_description: JobDescription
+    mode: str
+    # Mode that actually ran: single_call falls back to two_stage for a known profile
+    effective_mode: str | None
     candidate_profile: CandidateProfile | None
     decision: DecisionOutput | None
     error: str | None
 
 
+class MultiJobState(TypedDict):
+    """State of one resume screened against several jobs"""
+    resume_path: str
+    resume_sha256: str
+    filename: str
+    job_descriptions: List[JobDescription]
+    candidate_profile: CandidateProfile | None
+    # (job index, decision, error) per job, appended by the fan-out branches
+    results: Annotated[list, operator.add]
+    error: str | None
+
+
 class ResumeScreeningGraph:
     """LangGraph workflow for resume screening"""
     
     def __init__(self):
-        self.resume_parser = ResumeParser()
-        self.decision_agent = DecisionAgent()
+        self.profile_cache = (
+            ProfileCache(ResumeParser.PROMPT_VERSION) if config.PROFILE_CACHE_ENABLED else None
+        )
+        self.decision_cache = (
+            DecisionCache(DecisionAgent.PROMPT_VERSION) if config.DECISION_CACHE_ENABLED else None
+        )
+        self.candidate_index = (
+            CandidateIndex(config.CANDIDATE_INDEX_DIR) if config.CANDIDATE_INDEX_DIR else None
+        )
+        # Identical concurrent screenings, and concurrent parses of one resume, run once
+        self.screening_flights = SingleFlight("screening", config.SINGLEFLIGHT_ENABLED)
+        self.parse_flights = SingleFlight("parse", config.SINGLEFLIGHT_ENABLED)
+        self.checkpointer = get_checkpointer()
+        self._failed_threads = OrderedDict()
+        self._failed_lock = threading.Lock()
         self.graph = self._build_graph()
+        self.multi_graph = self._build_multi_graph()
     
-    def _parse_resume_node(self, state: AgentState) -> AgentState:
-        """Node 1: Parse resume and extract candidate profile"""
+    # Agents import and connect to the provider SDK, so they are built on first use
+    @cached_property
+    def resume_parser(self) -> ResumeParser:
+        return ResumeParser()
+    
+    @cached_property
+    def decision_agent(self) -> DecisionAgent:
+        return DecisionAgent()
+    
+    @cached_property
+    def screening_agent(self) -> CombinedScreeningAgent:
+        return CombinedScreeningAgent()
+    
+    def warmup(self):
+        """Construct the agents and their chains and load the tokenizer ahead of the first screening"""
+        self.resume_parser.chain
+        self.decision_agent.chain
+        self.screening_agent
+        count_tokens("")
+    
+    def _cached_profile(self, state: AgentState) -> CandidateProfile | None:
+        """Look up a previously parsed profile for these resume bytes"""
+        if self.profile_cache is None:
+            return None
+        return self.profile_cache.get(state["resume_sha256"])
+    
+    def _store_profile(self, state: AgentState, candidate_profile: CandidateProfile):
+        """Remember a parsed profile for later screenings of the same resume"""
+        if self.profile_cache is not None:
+            self.profile_cache.set(state["resume_sha256"], candidate_profile)
+    
+    def _index_profile(self, state: AgentState, candidate_profile: CandidateProfile, replace: bool = True):
+        """Add the profile to the semantic candidate search index (replace=False skips stored resumes)"""
+        if self.candidate_index is None:
+            return
+        if replace or state["resume_sha256"] not in self.candidate_index:
+            self.candidate_index.add(state["resume_sha256"], candidate_profile)
+    
+    async def _aindex_profile(self, state: AgentState, candidate_profile: CandidateProfile, replace: bool = True):
+        """Index the profile off the event loop (embedding plus SQLite and memmap writes)"""
+        if self.candidate_index is None:
+            return
+        if replace or state["resume_sha256"] not in self.candidate_index:
+            await asyncio.to_thread(self.candidate_index.add, state["resume_sha256"], candidate_profile)
+    
+    def _cached_decision(self, state: AgentState) -> DecisionOutput | None:
+        """Look up a memoized decision for this (profile, job) pair"""
+        if self.decision_cache is None:
+            return None
+        return self.decision_cache.get(state["candidate_profile"], state["job_description"])
+    
+    def _store_decision(self, state: AgentState, decision: DecisionOutput):
+        """Memoize a decision for repeat screenings"""
+        if self.decision_cache is not None:
+            self.decision_cache.set(state["candidate_profile"], state["job_description"], decision)
+    
+    def _parse_file(self, state: AgentState) -> CandidateProfile:
+        """Extract and parse the resume file, caching the profile"""
+        file_obj = open_resume(state["resume_path"], state["filename"])
         try:
-            from io import BytesIO
-            file_obj = BytesIO(state["resume_file"])
             candidate_profile = self.resume_parser.parse_resume(
                 file_obj, 
                 state["filename"]
             )
-            state["candidate_profile"] = candidate_profile
-            state["error"] = None
-        except Exception as e:
-            state["error"] = f"Resume parsing failed: {str(e)}"
+        finally:
+            file_obj.close()
+        self._store_profile(state, candidate_profile)
+        self._index_profile(state, candidate_profile)
+        return candidate_profile
+    
+    async def _aparse_file(self, state: AgentState) -> CandidateProfile:
+        """Extract and parse the resume file without blocking the event loop"""
+        resume_text = await self.resume_parser.aextract_text(
+            state["resume_path"],
+            state["filename"]
+        )
+        get_stream_writer()({"stage": "extracted", "characters": len(resume_text)})
+        candidate_profile = await self.resume_parser.aparse_text(resume_text)
+        self._store_profile(state, candidate_profile)
+        await self._aindex_profile(state, candidate_profile)
+        return candidate_profile
+    
+    def _parse_resume_node(self, state: AgentState) -> AgentState:
+        """Node 1: Parse resume and extract candidate profile"""
+        candidate_profile = state["candidate_profile"] or self._cached_profile(state)
+        if candidate_profile is None:
+            candidate_profile = self.parse_flights.do(
+                state["resume_sha256"], lambda: self._parse_file(state)
+            )
+        else:
+            self._index_profile(state, candidate_profile, replace=False)
+        state["candidate_profile"] = candidate_profile
+        state["effective_mode"] = "two_stage"
+        
+        return state
+    
+    async def _aparse_resume_node(self, state: AgentState) -> AgentState:
+        """Node 1 (async): Parse resume without blocking the event loop"""
+        candidate_profile = state["candidate_profile"] or self._cached_profile(state)
+        if candidate_profile is None:
+            candidate_profile = await self.parse_flights.ado(
+                state["resume_sha256"], lambda: self._aparse_file(state)
+            )
+        else:
+            get_stream_writer()({"stage": "profile_cached"})
+            await self._aindex_profile(state, candidate_profile, replace=False)
+        state["candidate_profile"] = candidate_profile
+        state["effective_mode"] = "two_stage"
         
         return state
     
     def _decision_node(self, state: AgentState) -> AgentState:
         """Node 2: Make hiring decision"""
-        try:
-            if state["error"]:
-                return state
-            
+        decision = self._cached_decision(state)
+        if decision is None:
             decision = self.decision_agent.evaluate_candidate(
                 state["candidate_profile"],
                 state["job_description"]
             )
-            state["decision"] = decision
-        except Exception as e:
-            state["error"] = f"Decision making failed: {str(e)}"
+            self._store_decision(state, decision)
+        state["decision"] = decision
+        
+        return state
+    
+    async def _adecision_node(self, state: AgentState) -> AgentState:
+        """Node 2 (async): Make hiring decision"""
+        decision = self._cached_decision(state)
+        if decision is None:
+            get_stream_writer()({"stage": "evaluating"})
+            decision = await self.decision_agent.aevaluate_candidate(
+                state["candidate_profile"],
+                state["job_description"]
+            )
+            self._store_decision(state, decision)
+        state["decision"] = decision
+        
+        return state
+    
+    def _store_screening(self, state: AgentState, screening) -> AgentState:
+        """Record a single-call result in the caches like the two-stage path"""
+        self._store_profile(state, screening.candidate_profile)
+        state["candidate_profile"] = screening.candidate_profile
+        self._store_decision(state, screening.decision)
+        state["decision"] = screening.decision
+        state["effective_mode"] = "single_call"
+        return state
+    
+    def _screen_node(self, state: AgentState) -> AgentState:
+        """Single-call mode: parse and decide in one LLM round trip"""
+        resume_text = self.resume_parser.extract_text_from_path(
+            state["resume_path"],
+            state["filename"]
+        )
+        screening = self.screening_agent.screen(resume_text, state["job_description"])
+        self._index_profile(state, screening.candidate_profile)
+        return self._store_screening(state, screening)
+    
+    async def _ascreen_node(self, state: AgentState) -> AgentState:
+        """Single-call mode (async): parse and decide in one LLM round trip"""
+        resume_text = await self.resume_parser.aextract_text(
+            state["resume_path"],
+            state["filename"]
+        )
+        get_stream_writer()({"stage": "extracted", "characters": len(resume_text)})
+        screening = await self.screening_agent.ascreen(resume_text, state["job_description"])
+        await self._aindex_profile(state, screening.candidate_profile)
+        return self._store_screening(state, screening)
+    
+    def _prescore_node(self, state: AgentState) -> AgentState:
+        """Node 1b: Deterministic skill/experience match, rejecting clear misfits locally"""
+        score = prescore(state["candidate_profile"], state["job_description"])
+        if score.is_clear_reject:
+            state["decision"] = build_reject_decision(score, state["job_description"])
         
         return state
     
-    def _should_continue(self, state: AgentState) -> str:
-        """Conditional edge: check if we should continue to decision agent"""
-        if state["error"]:
+    def _route_mode(self, state: AgentState) -> str:
+        """Entry point: single-call screening, unless the profile is already known"""
+        if (
+            state["mode"] == "single_call"
+            and state["candidate_profile"] is None
+            and self._cached_profile(state) is None
+        ):
+            return "screen"
+        return "parse_resume"
+    
+    def _after_parse(self, state: AgentState) -> str:
+        """Conditional edge: route parsed profiles through pre-scoring when enabled"""
+        return "prescore" if config.PRESCORE_ENABLED else "decision"
+    
+    def _after_prescore(self, state: AgentState) -> str:
+        """Conditional edge: skip the decision agent for pre-scored rejects"""
+        if state["decision"] is not None:
             return "end"
         return "decision"
     
+    def _retry_policy(self) -> RetryPolicy:
+        """LLM nodes retry transient failures (timeouts, 5xx) before the run fails"""
+        return RetryPolicy(
+            max_attempts=config.NODE_RETRY_MAX_ATTEMPTS,
+            initial_interval=config.NODE_RETRY_INITIAL_INTERVAL,
+            backoff_factor=config.NODE_RETRY_BACKOFF_FACTOR,
+            max_interval=config.NODE_RETRY_MAX_INTERVAL
+        )
+    
     def _build_graph(self) -> StateGraph:
         """Build the agent graph"""
         workflow = StateGraph(AgentState)
+        retry_policy = self._retry_policy()
         
-        # Add nodes
-        workflow.add_node("parse_resume", self._parse_resume_node)
-        workflow.add_node("decision", self._decision_node)
+        # Add nodes (sync for run, async for arun), each timed for /metrics
+        workflow.add_node(
+            "parse_resume",
+            timed_node("parse_resume", self._parse_resume_node, afunc=self._aparse_resume_node),
+            retry_policy=retry_policy
+        )
+        workflow.add_node(
+            "decision",
+            timed_node("decision", self._decision_node, afunc=self._adecision_node),
+            retry_policy=retry_policy
+        )
+        workflow.add_node(
+            "screen",
+            timed_node("screen", self._screen_node, afunc=self._ascreen_node),
+            retry_policy=retry_policy
+        )
+        workflow.add_node("prescore", timed_node("prescore", self._prescore_node))
         
-        # Set entry point
-        workflow.set_entry_point("parse_resume")
+        # Set entry point (two-stage parse -> decision, or single-call screen)
+        workflow.set_conditional_entry_point(
+            self._route_mode,
+            {
+                "parse_resume": "parse_resume",
+                "screen": "screen"
+            }
+        )
         
         # Add edges
         workflow.add_conditional_edges(
             "parse_resume",
-            self._should_continue,
+            self._after_parse,
+            {
+                "prescore": "prescore",
+                "decision": "decision"
+            }
+        )
+        
+        workflow.add_conditional_edges(
+            "prescore",
+            self._after_prescore,
             {
                 "decision": "decision",
                 "end": END
@@ -83,24 +353,336 @@ class ResumeScreeningGraph:
         )
         
         workflow.add_edge("decision", END)
+        workflow.add_edge("screen", END)
         
+        # Checkpoints after each node let a retried screening resume where it failed
+        return workflow.compile(checkpointer=self.checkpointer)
+    
+    def _evaluate_job(self, task: dict) -> tuple:
+        """Pre-scored reject or cached decision for one job, else None"""
+        if config.PRESCORE_ENABLED:
+            score = prescore(task["candidate_profile"], task["job_description"])
+            if score.is_clear_reject:
+                return build_reject_decision(score, task["job_description"])
+        return self._cached_decision(task)
+    
+    def _evaluate_job_node(self, task: dict) -> dict:
+        """Fan-out branch: decide one job for the shared profile, recording failures"""
+        try:
+            decision = self._evaluate_job(task)
+            if decision is None:
+                decision = self.decision_agent.evaluate_candidate(
+                    task["candidate_profile"],
+                    task["job_description"]
+                )
+                self._store_decision(task, decision)
+        except Exception as e:
+            return {"results": [(task["index"], None, f"{NODE_ERRORS['decision']}: {str(e)}")]}
+        return {"results": [(task["index"], decision, None)]}
+    
+    async def _aevaluate_job_node(self, task: dict) -> dict:
+        """Fan-out branch (async): decide one job for the shared profile, recording failures"""
+        try:
+            decision = self._evaluate_job(task)
+            if decision is None:
+                decision = await self.decision_agent.aevaluate_candidate(
+                    task["candidate_profile"],
+                    task["job_description"]
+                )
+                self._store_decision(task, decision)
+        except Exception as e:
+            return {"results": [(task["index"], None, f"{NODE_ERRORS['decision']}: {str(e)}")]}
+        return {"results": [(task["index"], decision, None)]}
+    
+    def _fan_out_jobs(self, state: MultiJobState) -> list:
+        """Conditional edge: one evaluate_job branch per job, all run in the same step"""
+        return [
+            Send("evaluate_job", {
+                "index": index,
+                "job_description": job_description,
+                "candidate_profile": state["candidate_profile"]
+            })
+            for index, job_description in enumerate(state["job_descriptions"])
+        ]
+    
+    def _build_multi_graph(self) -> StateGraph:
+        """Build the multi-job graph: parse the resume once, then decide every job in parallel"""
+        workflow = StateGraph(MultiJobState)
+        workflow.add_node(
+            "parse_resume",
+            timed_node("parse_resume", self._parse_resume_node, afunc=self._aparse_resume_node),
+            retry_policy=self._retry_policy()
+        )
+        workflow.add_node(
+            "evaluate_job",
+            timed_node("evaluate_job", self._evaluate_job_node, afunc=self._aevaluate_job_node)
+        )
+        workflow.set_entry_point("parse_resume")
+        workflow.add_conditional_edges("parse_resume", self._fan_out_jobs, ["evaluate_job"])
+        workflow.add_edge("evaluate_job", END)
         return workflow.compile()
     
-    def run(
+    def _initial_state(
         self, 
-        resume_file: bytes, 
+        resume_path: str, 
         filename: str, 
-        job_description: JobDescription
+        job_description: JobDescription,
+        resume_sha256: str | None = None,
+        mode: str | None = None,
+        candidate_profile: CandidateProfile | None = None,
+        screening_id: str | None = None
     ) -> AgentState:
-        """Execute the screening workflow"""
-        initial_state: AgentState = {
-            "resume_file": resume_file,
+        """Build the initial workflow state (a known profile skips parsing)"""
+        return {
+            "screening_id": screening_id or uuid.uuid4().hex,
+            "resume_path": resume_path,
+            "resume_sha256": resume_sha256 or file_sha256(resume_path),
             "filename": filename,
             "job_description": job_description,
-            "candidate_profile": None,
+            "mode": mode or config.SCREENING_MODE,
+            "effective_mode": None,
+            "candidate_profile": candidate_profile,
             "decision": None,
             "error": None
         }
+    
+    def _flight_key(self, initial_state: AgentState) -> str:
+        """Coalescing key: resume bytes, canonical job description and mode"""
+        return ":".join((
+            initial_state["resume_sha256"],
+            canonical_hash(initial_state["job_description"]),
+            initial_state["mode"]
+        ))
+    
+    def _thread_config(self, initial_state: AgentState) -> dict:
+        if self.checkpointer is None:
+            return {}
+        return {"configurable": {"thread_id": initial_state["screening_id"]}}
+    
+    def _run_input(self, snapshot, initial_state: AgentState) -> AgentState | None:
+        """
+        None to resume the failed run saved for this screening ID, else a fresh start
+        
+        A run is resumed only when parsing already succeeded and the resume, job
+        and mode are unchanged, so the stored CandidateProfile is reused.
+        """
+        previous = snapshot.values if snapshot else {}
+        if (
+            snapshot
+            and snapshot.next
+            and previous.get("candidate_profile") is not None
+            and previous.get("resume_sha256") == initial_state["resume_sha256"]
+            and previous.get("job_description") == initial_state["job_description"]
+            and previous.get("mode") == initial_state["mode"]
+        ):
+            return None
+        return initial_state
+    
+    def _failed_state(self, snapshot, initial_state: AgentState, error: Exception) -> AgentState:
+        """Final state for a failed run, naming the node that failed"""
+        state = {**initial_state, **(snapshot.values if snapshot else {})}
+        node = snapshot.next[0] if snapshot and snapshot.next else None
+        state["error"] = f"{NODE_ERRORS.get(node, 'Screening failed')}: {str(error)}"
+        return state
+    
+    def _expired_threads(self, screening_id: str | None = None, failed: bool = False) -> list:
+        """
+        Track failed screenings kept for resumption; return the ones to delete
+        
+        A successful run's thread is deleted right away. Failed threads are kept
+        for CHECKPOINT_TTL_SECONDS (at most CHECKPOINT_MAX_FAILED of them).
+        """
+        now = time.monotonic()
+        with self._failed_lock:
+            if screening_id is not None:
+                self._failed_threads.pop(screening_id, None)
+                if failed:
+                    self._failed_threads[screening_id] = now
+            expired = [] if failed or screening_id is None else [screening_id]
+            while self._failed_threads:
+                oldest, failed_at = next(iter(self._failed_threads.items()))
+                if (
+                    now - failed_at < config.CHECKPOINT_TTL_SECONDS
+                    and len(self._failed_threads) <= config.CHECKPOINT_MAX_FAILED
+                ):
+                    break
+                self._failed_threads.pop(oldest)
+                expired.append(oldest)
+        return expired
+    
+    def _finish(self, screening_id: str, failed: bool):
+        if self.checkpointer is not None:
+            for thread_id in self._expired_threads(screening_id, failed):
+                self.checkpointer.delete_thread(thread_id)
+    
+    async def _afinish(self, screening_id: str, failed: bool):
+        if self.checkpointer is not None:
+            for thread_id in self._expired_threads(screening_id, failed):
+                await self.checkpointer.adelete_thread(thread_id)
+    
+    def run(
+        self, 
+        resume_path: str, 
+        filename: str, 
+        job_description: JobDescription,
+        resume_sha256: str | None = None,
+        mode: str | None = None,
+        screening_id: str | None = None
+    ) -> AgentState:
+        """
+        Execute the screening workflow on a resume file on disk
+        
+        Pass the screening_id of a failed run to resume it from its last
+        successful node. A call identical to one already in flight (same resume
+        bytes, job description and mode) waits for it and returns its state,
+        including its screening_id.
+        """
+        initial_state = self._initial_state(
+            resume_path, filename, job_description, resume_sha256, mode, screening_id=screening_id
+        )
+        state = self.screening_flights.do(
+            self._flight_key(initial_state), lambda: self._run(initial_state)
+        )
+        return {**state}
+    
+    def _run(self, initial_state: AgentState) -> AgentState:
+        thread = self._thread_config(initial_state)
+        snapshot = self.graph.get_state(thread) if thread else None
+        
+        try:
+            result = self.graph.invoke(self._run_input(snapshot, initial_state), thread)
+        except Exception as e:
+            snapshot = self.graph.get_state(thread) if thread else None
+            self._finish(initial_state["screening_id"], failed=True)
+            return self._failed_state(snapshot, initial_state, e)
         
-        result = self.graph.invoke(initial_state)
+        self._finish(initial_state["screening_id"], failed=False)
         return result
+    
+    async def astream(
+        self, 
+        resume_path: str, 
+        filename: str, 
+        job_description: JobDescription,
+        resume_sha256: str | None = None,
+        mode: str | None = None,
+        candidate_profile: CandidateProfile | None = None,
+        stream_mode: list | None = None,
+        screening_id: str | None = None
+    ):
+        """
+        Stream (mode, payload) pairs: node updates, stage events and LLM message chunks
+        
+        A resumed run starts with a ("resumed", state) pair carrying the saved
+        state; a failed run ends with an ("error", state) pair instead of raising.
+        """
+        initial_state = self._initial_state(
+            resume_path, filename, job_description, resume_sha256, mode, candidate_profile, screening_id
+        )
+        thread = self._thread_config(initial_state)
+        snapshot = await self.graph.aget_state(thread) if thread else None
+        
+        run_input = self._run_input(snapshot, initial_state)
+        if run_input is None:
+            yield "resumed", snapshot.values
+        
+        try:
+            async for item in self.graph.astream(
+                run_input,
+                thread,
+                stream_mode=stream_mode or ["updates", "custom", "messages"]
+            ):
+                yield item
+        except Exception as e:
+            snapshot = await self.graph.aget_state(thread) if thread else None
+            await self._afinish(initial_state["screening_id"], failed=True)
+            yield "error", self._failed_state(snapshot, initial_state, e)
+            return
+        
+        await self._afinish(initial_state["screening_id"], failed=False)
+    
+    async def arun(
+        self, 
+        resume_path: str, 
+        filename: str, 
+        job_description: JobDescription,
+        resume_sha256: str | None = None,
+        mode: str | None = None,
+        screening_id: str | None = None
+    ) -> AgentState:
+        """Execute the screening workflow without blocking the event loop (see run)"""
+        initial_state = self._initial_state(
+            resume_path, filename, job_description, resume_sha256, mode, screening_id=screening_id
+        )
+        state = await self.screening_flights.ado(
+            self._flight_key(initial_state), lambda: self._arun(initial_state)
+        )
+        return {**state}
+    
+    async def _arun(self, initial_state: AgentState) -> AgentState:
+        thread = self._thread_config(initial_state)
+        snapshot = await self.graph.aget_state(thread) if thread else None
+        
+        try:
+            result = await self.graph.ainvoke(self._run_input(snapshot, initial_state), thread)
+        except Exception as e:
+            snapshot = await self.graph.aget_state(thread) if thread else None
+            await self._afinish(initial_state["screening_id"], failed=True)
+            return self._failed_state(snapshot, initial_state, e)
+        
+        await self._afinish(initial_state["screening_id"], failed=False)
+        return result
+    
+    def _multi_initial_state(
+        self,
+        resume_path: str,
+        filename: str,
+        job_descriptions: List[JobDescription],
+        resume_sha256: str | None = None
+    ) -> MultiJobState:
+        return {
+            "resume_path": resume_path,
+            "resume_sha256": resume_sha256 or file_sha256(resume_path),
+            "filename": filename,
+            "job_descriptions": job_descriptions,
+            "candidate_profile": None,
+            "results": [],
+            "error": None
+        }
+    
+    def _multi_result(self, state: MultiJobState) -> MultiJobState:
+        """Final multi-job state with results back in job order"""
+        return {**state, "results": sorted(state["results"], key=lambda result: result[0])}
+    
+    def run_many(
+        self,
+        resume_path: str,
+        filename: str,
+        job_descriptions: List[JobDescription],
+        resume_sha256: str | None = None
+    ) -> MultiJobState:
+        """
+        Parse a resume once and evaluate the profile against several jobs
+        
+        results holds one (job index, decision, error) tuple per job; a failed
+        decision is reported in its tuple, a failed parse in error.
+        """
+        initial_state = self._multi_initial_state(resume_path, filename, job_descriptions, resume_sha256)
+        try:
+            return self._multi_result(self.multi_graph.invoke(initial_state))
+        except Exception as e:
+            return {**initial_state, "error": f"{NODE_ERRORS['parse_resume']}: {str(e)}"}
+    
+    async def arun_many(
+        self,
+        resume_path: str,
+        filename: str,
+        job_descriptions: List[JobDescription],
+        resume_sha256: str | None = None
+    ) -> MultiJobState:
+        """Parse a resume once and evaluate it against several jobs concurrently (see run_many)"""
+        initial_state = self._multi_initial_state(resume_path, filename, job_descriptions, resume_sha256)
+        try:
+            return self._multi_result(await self.multi_graph.ainvoke(initial_state))
+        except Exception as e:
+            return {**initial_state, "error": f"{NODE_ERRORS['parse_resume']}: {str(e)}"}
@@ -0,0 +1 @@
+"""Offline benchmarks for the screening pipeline (python -m benchmarks.run)"""
@@ -0,0 +1,371 @@
+"""
+Offline benchmarks for the screening pipeline
+
+Usage (from Backend/): python -m benchmarks.run [--suites imports,extraction,graph,api]
+    [--requests N] [--concurrency 1,8,32] [--llm-latency SECONDS]
+    [--compare benchmarks/results/<earlier run>.json]
+
+LLM calls go to the deterministic fake provider (MODEL_PROVIDER=fake), so
+results measure this service rather than a model. Each run is saved as JSON
+under benchmarks/results/; --compare reports changes against an earlier run
+and exits non-zero when a metric regressed by more than --tolerance.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from io import BytesIO
+from benchmarks.synthetic import SIZES, make_resume
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that importing main should leave for first use or the startup warmup
+DEFERRED_MODULES = (
+    "agent_graph", "langgraph", "langchain_openai", "langchain_ollama", "PyPDF2", "docx", "numpy"
+)
+
+COLD_START_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+eager = [name for name in %r if name in sys.modules]
+main.get_screening_graph().warmup()
+built = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "warmup_ms": (built - imported) * 1000,
+    "eager": eager
+}))
+"""
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+}
+
+JOB = {
+    "title": "Senior Python Developer",
+    "description": "Backend services in Python and FastAPI, deployed on AWS with Docker.",
+    "required_skills": ["Python", "FastAPI", "Docker"],
+    "preferred_skills": ["AWS", "PostgreSQL"],
+    "experience_required": 3
+}
+
+
+def configure_environment(args):
+    """Point the app at the fake LLM before any Backend module reads config"""
+    os.environ["MODEL_PROVIDER"] = "fake"
+    os.environ["FAKE_LLM_LATENCY_SECONDS"] = str(args.llm_latency)
+    os.environ["FAKE_LLM_SECONDS_PER_TOKEN"] = str(args.llm_seconds_per_token)
+    # Caches would turn repeat screenings into lookups; opt back in via the environment
+    os.environ.setdefault("PROFILE_CACHE_ENABLED", "false")
+    os.environ.setdefault("DECISION_CACHE_ENABLED", "false")
+    os.environ.setdefault("CANDIDATE_INDEX_DIR", "")
+    os.environ.setdefault("JOB_QUEUE_DIR", "")
+
+
+def latency_summary(latencies: list) -> dict:
+    """Nearest-rank percentiles in milliseconds"""
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def rank(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))] * 1000
+
+    return {
+        "p50_ms": round(rank(50), 2),
+        "p95_ms": round(rank(95), 2),
+        "p99_ms": round(rank(99), 2),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2)
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+async def run_concurrently(count: int, concurrency: int, task) -> dict:
+    """Run task(i) for i < count with bounded concurrency, timing each call"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = []
+
+    async def timed(index: int):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await task(index)
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                errors.append(str(e))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(index) for index in range(count)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": count,
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "requests_per_second": round(len(latencies) / elapsed, 2),
+        **latency_summary(latencies)
+    }
+
+
+def _cold_start() -> dict:
+    """Import main and warm the graph up in a fresh interpreter"""
+    script = COLD_START_SCRIPT % (DEFERRED_MODULES,)
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(limit: int = 10) -> list:
+    """Direct imports of main by cumulative import time (python -X importtime)"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("   ") and not name.startswith("    "):
+            imports.append([name.strip(), round(int(cumulative) / 1000, 1)])
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def bench_imports(runs: int) -> dict:
+    """Cold start: time to import main and to build and warm the agent graph"""
+    samples = [_cold_start() for _ in range(runs)]
+    results = {
+        "import_main_ms": round(sorted(s["import_ms"] for s in samples)[runs // 2], 1),
+        "warmup_ms": round(sorted(s["warmup_ms"] for s in samples)[runs // 2], 1),
+        # Modules that should be deferred but were imported with main
+        "eagerly_imported": samples[0]["eager"],
+        "slowest_imports_ms": slowest_imports()
+    }
+    print(f"  cold start: {results}")
+    return results
+
+
+def bench_extraction(iterations: int) -> dict:
+    """Text extraction throughput per file format and size"""
+    from resume_parser import ResumeParser
+
+    parser = ResumeParser()
+    results = {}
+    for file_format in ("pdf", "docx"):
+        for size in SIZES:
+            filename, data, pages = make_resume(1, size, file_format)
+            parser.extract_text(BytesIO(data), filename)  # warm up
+            start = time.perf_counter()
+            for _ in range(iterations):
+                parser.extract_text(BytesIO(data), filename)
+            elapsed = time.perf_counter() - start
+            results[f"{file_format}_{size}"] = {
+                "pages": pages,
+                "bytes": len(data),
+                "ms_per_doc": round(elapsed / iterations * 1000, 2),
+                "docs_per_second": round(iterations / elapsed, 2),
+                "pages_per_second": round(iterations * pages / elapsed, 2),
+                "mb_per_second": round(iterations * len(data) / elapsed / 1e6, 2)
+            }
+            print(f"  extraction {file_format}/{size}: {results[f'{file_format}_{size}']}")
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+async def bench_graph(count: int, concurrency: int, size: str, file_format: str) -> dict:
+    """End-to-end ResumeScreeningGraph latency per screening mode"""
+    from agent_graph import ResumeScreeningGraph
+    from models import JobDescription
+    import config
+
+    graph = ResumeScreeningGraph()
+    job = JobDescription(**JOB)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        files = []
+        for seed in range(count):
+            filename, data, _ = make_resume(seed, size, file_format)
+            path = os.path.join(directory, filename)
+            with open(path, "wb") as f:
+                f.write(data)
+            files.append((path, filename))
+
+        for mode in config.SCREENING_MODES:
+            async def screen(index: int):
+                path, filename = files[index]
+                state = await graph.arun(path, filename, job, mode=mode)
+                if state["error"]:
+                    raise RuntimeError(state["error"])
+
+            results[mode] = await run_concurrently(count, concurrency, screen)
+            print(f"  graph {mode}: {results[mode]}")
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+async def bench_api(count: int, concurrency_levels: list, size: str, file_format: str) -> dict:
+    """POST /screen through the ASGI app (middleware included) at each concurrency level"""
+    import httpx
+    import main
+
+    uploads = [make_resume(seed, size, file_format) for seed in range(count)]
+    form = {
+        "job_title": JOB["title"],
+        "job_description": JOB["description"],
+        "required_skills": ", ".join(JOB["required_skills"]),
+        "preferred_skills": ", ".join(JOB["preferred_skills"]),
+        "experience_required": str(JOB["experience_required"])
+    }
+    results = {}
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        for concurrency in concurrency_levels:
+            async def post(index: int):
+                filename, data, _ = uploads[index]
+                response = await client.post(
+                    "/screen",
+                    files={"resume": (filename, data, CONTENT_TYPES[file_format])},
+                    data=form
+                )
+                response.raise_for_status()
+
+            results[f"concurrency_{concurrency}"] = await run_concurrently(count, concurrency, post)
+            print(f"  api concurrency={concurrency}: {results[f'concurrency_{concurrency}']}")
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def _flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Print metric changes against a baseline run and return the regressions"""
+    now = _flatten(current["suites"])
+    before = _flatten(baseline["suites"])
+    regressions = []
+    print(f"\nCompared with {baseline.get('timestamp')} ({baseline.get('git_commit') or 'unknown commit'}):")
+    for name in sorted(now.keys() & before.keys()):
+        if name.endswith(("_ms", "_mb")):
+            worse = now[name] > before[name]
+        elif name.endswith("_per_second"):
+            worse = now[name] < before[name]
+        else:
+            continue
+        change = (now[name] - before[name]) / before[name] if before[name] else 0.0
+        flag = ""
+        if worse and abs(change) > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"  {name}: {before[name]} -> {now[name]} ({change:+.1%}){flag}")
+    return regressions
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline screening benchmarks with a fake LLM")
+    parser.add_argument("--suites", default="imports,extraction,graph,api", help="Comma-separated suites to run")
+    parser.add_argument("--requests", type=int, default=64, help="Screenings per graph/API run")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated API concurrency levels")
+    parser.add_argument("--graph-concurrency", type=int, default=8)
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium", help="Resume size for graph/API runs")
+    parser.add_argument("--format", choices=sorted(CONTENT_TYPES), default="pdf", dest="file_format")
+    parser.add_argument("--extraction-iterations", type=int, default=20)
+    parser.add_argument("--import-runs", type=int, default=5, help="Fresh interpreters for the imports suite")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Fake LLM seconds per call")
+    parser.add_argument("--llm-seconds-per-token", type=float, default=0.0)
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    configure_environment(args)
+    suites = [suite.strip() for suite in args.suites.split(",") if suite.strip()]
+    concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+
+    results = {}
+    if "imports" in suites:
+        print("Imports")
+        results["imports"] = bench_imports(args.import_runs)
+    if "extraction" in suites:
+        print("Extraction")
+        results["extraction"] = bench_extraction(args.extraction_iterations)
+    if "graph" in suites:
+        print("Graph")
+        results["graph"] = asyncio.run(
+            bench_graph(args.requests, args.graph_concurrency, args.size, args.file_format)
+        )
+    if "api" in suites:
+        print("API")
+        results["api"] = asyncio.run(
+            bench_api(args.requests, concurrency_levels, args.size, args.file_format)
+        )
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    report = {
+        "timestamp": timestamp,
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "requests": args.requests,
+            "concurrency": concurrency_levels,
+            "graph_concurrency": args.graph_concurrency,
+            "size": args.size,
+            "format": args.file_format,
+            "llm_latency_seconds": args.llm_latency,
+            "llm_seconds_per_token": args.llm_seconds_per_token
+        },
+        "suites": results
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{timestamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import random
+from io import BytesIO
+import docx
+
+
+# Resume sizes by page count
+SIZES = {"small": 1, "medium": 4, "large": 16}
+
+LINES_PER_PAGE = 45
+
+_SKILLS = (
+    "Python", "FastAPI", "Django", "JavaScript", "TypeScript", "React", "Docker", "Kubernetes",
+    "AWS", "PostgreSQL", "Redis", "Go", "Java", "LangChain", "Machine Learning", "REST APIs"
+)
+_ROLES = ("Software Engineer", "Backend Developer", "Data Engineer", "Platform Engineer", "Tech Lead")
+_COMPANIES = ("Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries")
+_VERBS = ("Built", "Designed", "Scaled", "Migrated", "Maintained", "Optimized", "Led")
+_OBJECTS = (
+    "a payment API", "the data pipeline", "an internal search service", "CI/CD workflows",
+    "a recommendation engine", "the customer portal", "monitoring and alerting"
+)
+
+
+def resume_pages(seed: int, pages: int) -> list:
+    """Deterministic resume text as a list of pages, each a list of lines"""
+    rng = random.Random(seed)
+    skills = rng.sample(_SKILLS, 6)
+    lines = [
+        f"Candidate {seed}",
+        f"candidate{seed}@example.com | +1 (555) {100 + seed % 900:03d}-{seed % 10000:04d}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(_ROLES)} with experience in {', '.join(skills[:3])}.",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+        "",
+        "EXPERIENCE"
+    ]
+    year = 2024
+    while len(lines) < pages * LINES_PER_PAGE - 4:
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(_ROLES)}, {rng.choice(_COMPANIES)} ({start}-{year})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} using {rng.choice(skills)}")
+        year = start
+    lines = lines[:pages * LINES_PER_PAGE - 3]
+    lines.extend(["", "EDUCATION", "BSc Computer Science, State University"])
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: list) -> bytes:
+    """Minimal PDF with one Helvetica text stream per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for number, lines in enumerate(pages, start=1):
+        text = " ".join(f"({_pdf_escape(line)}) Tj T*" for line in lines + [f"Page {number}"])
+        stream = f"BT /F1 10 Tf 40 800 TD 12 TL {text} ET".encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+
+    out = BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def make_docx(pages: list) -> bytes:
+    document = docx.Document()
+    for lines in pages:
+        for line in lines:
+            document.add_paragraph(line)
+    out = BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def make_resume(seed: int, size: str, file_format: str) -> tuple:
+    """(filename, bytes, page count) of a synthetic resume"""
+    pages = resume_pages(seed, SIZES[size])
+    data = make_pdf(pages) if file_format == "pdf" else make_docx(pages)
+    return f"resume_{seed}_{size}.{file_format}", data, len(pages)
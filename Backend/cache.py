@@ -0,0 +1,284 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from pydantic import BaseModel
+from models import CandidateProfile, JobDescription, DecisionOutput
+from metrics import CACHE_LOOKUPS
+from cascade import tiers_key
+from sqlite_store import SQLiteDatabase
+import config
+
+
+def canonical_hash(model: BaseModel) -> str:
+    """Stable hash of a Pydantic model's content, independent of field order"""
+    payload = json.dumps(model.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _model_key(tiers: list) -> str:
+    """Provider and model(s) producing a cached value: the cascade tiers, else MODEL_PROVIDER"""
+    if tiers:
+        return tiers_key(tiers)
+    return f"{config.MODEL_PROVIDER}:{config.MODEL_NAMES.get(config.MODEL_PROVIDER, '')}"
+
+
+class MemoryCache:
+    """In-memory LRU cache with per-entry TTL"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """On-disk cache tier with TTL and size-based (least recently used) eviction"""
+
+    def __init__(self, path: str, max_entries: int, ttl_seconds: float, table: str = "cache"):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.table = table
+        self._lock = threading.Lock()
+        # Shared by every process using the same path (SQLite WAL)
+        self._db = SQLiteDatabase(path, schema=[
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+            f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)"
+        ])
+        self._writes = 0
+
+    @property
+    def _conn(self):
+        return self._db.conn
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            )
+            self._writes += 1
+            # Evict in batches rather than on every write
+            if self._writes % 100 == 1:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used beyond max_entries"""
+        self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at < ?", (now,))
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def delete_prefix(self, prefix: str) -> int:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key LIKE ? ESCAPE '\\'", (escaped + "%",)
+            )
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+
+class TieredCache:
+    """
+    Memory LRU tier in front of an optional SQLite tier, with hit/miss counters
+
+    memory_tier=False reads and writes the SQLite tier only, for values that
+    other processes sharing the database may delete.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        db_path: Optional[str] = None,
+        db_max_entries: int = 100000,
+        memory_tier: bool = True
+    ):
+        self.name = name
+        self.memory = MemoryCache(max_entries, ttl_seconds) if memory_tier or not db_path else None
+        self.disk = SQLiteCache(db_path, db_max_entries, ttl_seconds, table=name) if db_path else None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key) if self.memory is not None else None
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None and self.memory is not None:
+                self.memory.set(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        CACHE_LOOKUPS.inc(cache=self.name, result="miss" if value is None else "hit")
+        return value
+
+    def set(self, key: str, value: str):
+        if self.memory is not None:
+            self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def delete_prefix(self, prefix: str) -> int:
+        removed = self.memory.delete_prefix(prefix) if self.memory is not None else 0
+        if self.disk is not None:
+            removed = max(removed, self.disk.delete_prefix(prefix))
+        return removed
+
+    def clear(self):
+        if self.memory is not None:
+            self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory) if self.memory is not None else 0,
+            "disk_enabled": self.disk is not None
+        }
+
+
+class ProfileCache:
+    """Content-addressed cache of parsed CandidateProfiles"""
+
+    def __init__(self, prompt_version: str):
+        self.prompt_version = prompt_version
+        self.cache = TieredCache(
+            "profiles",
+            max_entries=config.PROFILE_CACHE_MAX_ENTRIES,
+            ttl_seconds=config.PROFILE_CACHE_TTL_SECONDS,
+            db_path=config.PROFILE_CACHE_DB_PATH or None,
+            db_max_entries=config.PROFILE_CACHE_DB_MAX_ENTRIES
+        )
+
+    def key(self, resume_sha256: str) -> str:
+        """Hash of the resume bytes plus the model that parses them"""
+        return f"{resume_sha256}:{_model_key(config.PARSER_MODEL_TIERS)}:{self.prompt_version}"
+
+    def get(self, resume_sha256: str) -> Optional[CandidateProfile]:
+        value = self.cache.get(self.key(resume_sha256))
+        if value is None:
+            return None
+        return CandidateProfile.model_validate_json(value)
+
+    def set(self, resume_sha256: str, candidate_profile: CandidateProfile):
+        self.cache.set(self.key(resume_sha256), candidate_profile.model_dump_json())
+
+
+class DecisionCache:
+    """
+    Memoized decisions for identical (profile, job) pairs
+
+    With a disk tier, decisions are only kept in SQLite so an invalidation
+    takes effect in every process at once.
+    """
+
+    def __init__(self, prompt_version: str):
+        self.prompt_version = prompt_version
+        self.cache = TieredCache(
+            "decisions",
+            max_entries=config.DECISION_CACHE_MAX_ENTRIES,
+            ttl_seconds=config.DECISION_CACHE_TTL_SECONDS,
+            db_path=config.DECISION_CACHE_DB_PATH or None,
+            db_max_entries=config.DECISION_CACHE_DB_MAX_ENTRIES,
+            # Other processes sharing the database (serve.py and worker.py workers) cannot clear
+            # this process's memory tier, so an invalidated decision could still be served from it
+            memory_tier=False
+        )
+
+    def key(self, candidate_profile: CandidateProfile, job_description: JobDescription) -> str:
+        """Job hash first so all decisions for a job share a prefix"""
+        return (
+            f"{canonical_hash(job_description)}:{canonical_hash(candidate_profile)}:"
+            f"{_model_key(config.DECISION_MODEL_TIERS)}:{self.prompt_version}"
+        )
+
+    def get(
+        self,
+        candidate_profile: CandidateProfile,
+        job_description: JobDescription
+    ) -> Optional[DecisionOutput]:
+        value = self.cache.get(self.key(candidate_profile, job_description))
+        if value is None:
+            return None
+        return DecisionOutput.model_validate_json(value)
+
+    def set(
+        self,
+        candidate_profile: CandidateProfile,
+        job_description: JobDescription,
+        decision: DecisionOutput
+    ):
+        self.cache.set(self.key(candidate_profile, job_description), decision.model_dump_json())
+
+    def invalidate_job(self, job_description: JobDescription) -> int:
+        """Drop every cached decision made against this job description"""
+        return self.cache.delete_prefix(canonical_hash(job_description) + ":")
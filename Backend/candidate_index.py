@@ -0,0 +1,387 @@
+import hashlib
+import os
+import re
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from models import CandidateProfile, JobDescription
+from skill_matcher import normalize_skill
+from skill_index import CandidateSkillMatrix, JobIndex, RankScores
+from sqlite_store import SQLiteDatabase
+import config
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+
+
+class HashingEmbedder:
+    """
+    Signed feature-hashing embedder
+
+    Needs no model download or network. Words, word bigrams and normalized
+    skills are hashed into a fixed number of dimensions.
+    """
+
+    name = "hashing"
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dim, 1.0 if (value >> 63) & 1 else -1.0
+
+    def embed(self, text: str, skills: List[str] = ()) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        words = _TOKEN_PATTERN.findall(text.lower())
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for feature in features:
+            bucket, sign = self._bucket(feature)
+            vector[bucket] += sign
+        # Skills carry more signal than free text
+        for skill in skills:
+            bucket, sign = self._bucket("skill:" + normalize_skill(skill))
+            vector[bucket] += 3 * sign
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SentenceTransformerEmbedder:
+    """Local sentence-transformers model (CPU-runnable), used when installed"""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+        self.name = f"st:{model_name}"
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, text: str, skills: List[str] = ()) -> np.ndarray:
+        if skills:
+            text = f"{text}\nSkills: {', '.join(skills)}"
+        vector = self.model.encode(text, normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+
+def get_embedder():
+    """Configured local embedder, falling back to feature hashing"""
+    if config.EMBEDDING_MODEL:
+        try:
+            return SentenceTransformerEmbedder(config.EMBEDDING_MODEL)
+        except ImportError:
+            pass
+    return HashingEmbedder(config.EMBEDDING_DIM)
+
+
+def profile_text(candidate_profile: CandidateProfile) -> str:
+    """Text embedded for a candidate: summary and experience entries"""
+    return "\n".join([candidate_profile.summary] + candidate_profile.experience)
+
+
+def job_text(job_description: JobDescription) -> str:
+    """Text embedded for a job query"""
+    return f"{job_description.title}\n{job_description.description}"
+
+
+class CandidateIndex:
+    """
+    Persistent top-k cosine search index over parsed CandidateProfiles
+
+    Vectors live in a memory-mapped float32 matrix (one row per candidate).
+    Profiles, the id -> row mapping and row allocation (the high-water mark
+    and a free list of deleted rows) live in SQLite and change in one
+    transaction with the vector write, so several processes can add to and
+    search the same directory. Each process keeps a view of the active rows
+    and reloads it when the stored generation counter moves. A
+    CandidateSkillMatrix over the stored profiles is built on the first
+    rank() and then kept up to date, so ranking only compiles the job.
+    """
+
+    def __init__(self, directory: str, embedder=None):
+        os.makedirs(directory, exist_ok=True)
+        self.embedder = embedder or get_embedder()
+        self.dim = self.embedder.dim
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self._lock = threading.Lock()
+
+        self._db = SQLiteDatabase(os.path.join(directory, "profiles.db"), schema=[
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            "candidate_id TEXT PRIMARY KEY, row INTEGER UNIQUE NOT NULL, profile TEXT NOT NULL, "
+            "generation INTEGER NOT NULL DEFAULT 0)",
+            "CREATE TABLE IF NOT EXISTS free_rows (row INTEGER PRIMARY KEY)",
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        ])
+
+        # This process's view of the stored rows, refreshed by _sync()
+        self._generation = -1
+        self._rows: Dict[str, int] = {}
+        self._ids: Dict[int, str] = {}
+        self._size = 0
+        self._capacity = 0
+        self._active = np.zeros(0, dtype=bool)
+
+        # Skill matrix for rank(): rows are appended, replaced rows are marked dead
+        self._skills: Optional[CandidateSkillMatrix] = None
+        self._skill_ids: List[str] = []
+        self._skill_names: List[str] = []
+        self._skill_rows: Dict[str, int] = {}
+        self._skill_live = np.zeros(0, dtype=bool)
+        self._skill_pending: Dict[str, CandidateProfile] = {}
+
+        def setup(conn):
+            meta = self._meta(conn)
+            if "size" not in meta:
+                # Index written before row allocation moved into SQLite
+                columns = {column[1] for column in conn.execute("PRAGMA table_info(candidates)")}
+                if "generation" not in columns:
+                    conn.execute("ALTER TABLE candidates ADD COLUMN generation INTEGER NOT NULL DEFAULT 0")
+                used = {row for (row,) in conn.execute("SELECT row FROM candidates")}
+                size = max(used) + 1 if used else 0
+                conn.executemany(
+                    "INSERT OR IGNORE INTO free_rows (row) VALUES (?)",
+                    [(row,) for row in range(size) if row not in used]
+                )
+                self._set_meta(conn, "size", size)
+                self._set_meta(conn, "generation", 0)
+            self._open_vectors(max(int(self._meta(conn).get("size", 0)), 1024))
+            if meta.get("embedder") != f"{self.embedder.name}:{self.dim}":
+                self._reembed_all(conn)
+
+        self._transaction(setup)
+
+    @property
+    def _conn(self):
+        return self._db.conn
+
+    def _transaction(self, work):
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    @staticmethod
+    def _meta(conn) -> Dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+    @staticmethod
+    def _set_meta(conn, key: str, value):
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    @staticmethod
+    def _bump_generation(conn) -> int:
+        conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'generation'")
+        return int(conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0])
+
+    def _open_vectors(self, capacity: int):
+        """Open (or grow) the memory-mapped vector matrix; the file never shrinks"""
+        mode = "r+" if os.path.exists(self.vectors_path) else "w+"
+        if mode == "r+":
+            existing = os.path.getsize(self.vectors_path) // (4 * self.dim)
+            capacity = max(capacity, existing)
+            if existing < capacity:
+                with open(self.vectors_path, "r+b") as f:
+                    f.truncate(capacity * 4 * self.dim)
+        if getattr(self, "_vectors", None) is not None:
+            self._vectors.flush()
+            del self._vectors
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode=mode, shape=(capacity, self.dim))
+        self._capacity = capacity
+
+    def _ensure_capacity(self, size: int):
+        """Remap when rows beyond the mapped matrix exist (grown here or by another process)"""
+        if size > self._capacity:
+            self._open_vectors(max(size, self._capacity * 2))
+
+    def _reembed_all(self, conn):
+        """Rebuild every vector after the embedder or dimension changed"""
+        if os.path.getsize(self.vectors_path) != self._capacity * 4 * self.dim:
+            self._vectors.flush()
+            del self._vectors
+            os.remove(self.vectors_path)
+            self._open_vectors(self._capacity)
+        for candidate_id, row, profile in conn.execute(
+            "SELECT candidate_id, row, profile FROM candidates"
+        ).fetchall():
+            self._vectors[row] = self._embed_profile(CandidateProfile.model_validate_json(profile))
+        self._vectors.flush()
+        self._set_meta(conn, "embedder", f"{self.embedder.name}:{self.dim}")
+        self._bump_generation(conn)
+
+    def _sync(self):
+        """Reload the active rows if any process changed the index since the last call (lock held)"""
+        conn = self._conn
+        generation = int(conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0])
+        if generation == self._generation:
+            return
+        # One read transaction, so the rows, size and generation are a consistent snapshot
+        conn.execute("BEGIN")
+        try:
+            meta = self._meta(conn)
+            rows = dict(conn.execute("SELECT candidate_id, row FROM candidates").fetchall())
+            changed = []
+            if self._skills is not None:
+                changed = conn.execute(
+                    "SELECT candidate_id, profile FROM candidates WHERE generation > ?", (self._generation,)
+                ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        generation = int(meta["generation"])
+        self._size = int(meta["size"])
+        self._ensure_capacity(self._size)
+        self._active = np.zeros(self._capacity, dtype=bool)
+        self._active[list(rows.values())] = True
+
+        if self._skills is not None:
+            for candidate_id in self._rows.keys() - rows.keys():
+                self._skill_pending.pop(candidate_id, None)
+                skill_row = self._skill_rows.pop(candidate_id, None)
+                if skill_row is not None:
+                    self._skill_live[skill_row] = False
+            for candidate_id, profile in changed:
+                self._skill_pending[candidate_id] = CandidateProfile.model_validate_json(profile)
+
+        self._rows = rows
+        self._ids = {row: candidate_id for candidate_id, row in rows.items()}
+        self._generation = generation
+
+    def _embed_profile(self, candidate_profile: CandidateProfile) -> np.ndarray:
+        return self.embedder.embed(
+            profile_text(candidate_profile),
+            candidate_profile.skills + candidate_profile.certifications
+        )
+
+    def add(self, candidate_id: str, candidate_profile: CandidateProfile):
+        """Insert or replace a candidate"""
+        vector = self._embed_profile(candidate_profile)
+
+        def work(conn):
+            existing = conn.execute(
+                "SELECT row FROM candidates WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            if existing:
+                row = existing[0]
+            else:
+                free = conn.execute("SELECT row FROM free_rows ORDER BY row LIMIT 1").fetchone()
+                if free:
+                    row = free[0]
+                    conn.execute("DELETE FROM free_rows WHERE row = ?", (row,))
+                else:
+                    row = int(conn.execute("SELECT value FROM meta WHERE key = 'size'").fetchone()[0])
+                    self._set_meta(conn, "size", row + 1)
+            self._ensure_capacity(row + 1)
+            # The vector is written before the commit that makes the row visible to other processes
+            self._vectors[row] = vector
+            conn.execute(
+                "INSERT OR REPLACE INTO candidates (candidate_id, row, profile, generation) VALUES (?, ?, ?, ?)",
+                (candidate_id, row, candidate_profile.model_dump_json(), self._bump_generation(conn))
+            )
+
+        self._transaction(work)
+
+    def delete(self, candidate_id: str) -> bool:
+        """Remove a candidate; its row is reused by later inserts"""
+        def work(conn):
+            existing = conn.execute(
+                "SELECT row FROM candidates WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            if existing is None:
+                return False
+            conn.execute("DELETE FROM candidates WHERE candidate_id = ?", (candidate_id,))
+            conn.execute("INSERT INTO free_rows (row) VALUES (?)", existing)
+            self._ensure_capacity(existing[0] + 1)
+            self._vectors[existing[0]] = 0
+            self._bump_generation(conn)
+            return True
+
+        return self._transaction(work)
+
+    def get(self, candidate_id: str) -> Optional[CandidateProfile]:
+        row = self._conn.execute(
+            "SELECT profile FROM candidates WHERE candidate_id = ?", (candidate_id,)
+        ).fetchone()
+        return CandidateProfile.model_validate_json(row[0]) if row else None
+
+    def search(self, job_description: JobDescription, top_k: int = 10) -> List[Tuple[str, float, CandidateProfile]]:
+        """Top-k candidates by cosine similarity to the job description"""
+        query = self.embedder.embed(
+            job_text(job_description),
+            job_description.required_skills + job_description.preferred_skills
+        )
+        with self._lock:
+            self._sync()
+            size = self._size
+            if size == 0:
+                return []
+            scores = self._vectors[:size] @ query
+            scores = np.where(self._active[:size], scores, -np.inf)
+            k = min(top_k, len(self._rows))
+            if k <= 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k] if k < size else np.arange(size)
+            top = top[np.argsort(-scores[top], kind="stable")][:k]
+            ids = [self._ids[int(row)] for row in top]
+
+        results = []
+        for candidate_id, row in zip(ids, top):
+            candidate_profile = self.get(candidate_id)
+            if candidate_profile is not None:
+                results.append((candidate_id, float(scores[row]), candidate_profile))
+        return results
+
+    def _update_skills(self):
+        """Build the skill matrix, or append the profiles added since the last call"""
+        if self._skills is not None and np.count_nonzero(~self._skill_live) > max(1024, len(self._skill_live) // 2):
+            self._skills = None  # mostly replaced rows: rebuild compactly
+        if self._skills is None:
+            self._skills = CandidateSkillMatrix()
+            self._skill_ids, self._skill_names, self._skill_rows = [], [], {}
+            self._skill_live = np.zeros(0, dtype=bool)
+            self._skill_pending = {}
+            # Makes _sync() load every stored profile
+            self._generation = -1
+        self._sync()
+        if not self._skill_pending:
+            return
+
+        pending = list(self._skill_pending.items())
+        self._skill_pending = {}
+        for candidate_id, _ in pending:
+            replaced = self._skill_rows.get(candidate_id)
+            if replaced is not None:
+                self._skill_live[replaced] = False
+        first_row = len(self._skills)
+        self._skills.extend([candidate_profile for _, candidate_profile in pending])
+        self._skill_live = np.concatenate([self._skill_live, np.ones(len(pending), dtype=bool)])
+        for offset, (candidate_id, candidate_profile) in enumerate(pending):
+            self._skill_rows[candidate_id] = first_row + offset
+            self._skill_ids.append(candidate_id)
+            self._skill_names.append(candidate_profile.name)
+
+    def rank(
+        self,
+        job_description: JobDescription,
+        top_k: Optional[int] = None
+    ) -> Tuple[List[Tuple[str, str]], RankScores]:
+        """Stored candidates ranked by skill-match fit: (candidate id, name) pairs and their scores, best first"""
+        with self._lock:
+            self._update_skills()
+            live = np.flatnonzero(self._skill_live)
+            scores = JobIndex(job_description, self._skills.vocabulary).score(self._skills, live)
+            order = scores.top_k(top_k)
+            rows = live[order]
+            candidates = [(self._skill_ids[row], self._skill_names[row]) for row in rows]
+        return candidates, scores.take(order)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM candidates WHERE candidate_id = ?", (candidate_id,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
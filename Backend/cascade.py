@@ -0,0 +1,96 @@
+import logging
+import time
+from typing import Callable, List, Optional, Tuple
+from pydantic import BaseModel
+from llm_clients import get_llm
+from metrics import CASCADE_OUTCOMES, CASCADE_LATENCY
+from resilience import CircuitOpenError
+import config
+
+
+logger = logging.getLogger(__name__)
+
+
+def tiers_key(tiers: List[Tuple[str, str]]) -> str:
+    """Provider and model of every tier, for cache keys"""
+    return ",".join(f"{provider}:{model}" for provider, model in tiers)
+
+
+class ModelCascade:
+    """
+    Tiered model routing: the cheapest model answers first
+
+    Each tier is a (provider, model) pair, cheapest first. A result is kept
+    unless is_uncertain(result) says otherwise; an uncertain result or a
+    failed call (invalid output after repairs, timeout, provider error) moves
+    on to the next tier. The last tier's answer or error is final. A tier's
+    client and chain are only created once a call reaches it, then reused.
+    """
+
+    def __init__(
+        self,
+        agent: str,
+        tiers: List[Tuple[str, str]],
+        temperature: float,
+        build_chain: Callable,
+        is_uncertain: Optional[Callable[[BaseModel], bool]] = None
+    ):
+        self.agent = agent
+        self.tiers = tiers
+        self.temperature = temperature
+        self.build_chain = build_chain
+        self.is_uncertain = is_uncertain
+        self._chains = {}
+        if config.HEDGE_PROVIDER:
+            logger.warning(
+                "%s uses a model cascade, so HEDGE_PROVIDER is ignored for it; tiers fail over instead",
+                agent
+            )
+
+    def _chain(self, provider: str, model: str):
+        chain = self._chains.get((provider, model))
+        if chain is None:
+            chain = self._chains[(provider, model)] = self.build_chain(
+                get_llm(self.temperature, provider, model), provider
+            )
+        return chain
+
+    def _settle(self, tier: str, start: float, last: bool, result=None, error: Exception = None) -> bool:
+        """Record a tier's outcome; True when its result is final"""
+        CASCADE_LATENCY.observe(time.perf_counter() - start, agent=self.agent, tier=tier)
+        if error is not None:
+            CASCADE_OUTCOMES.inc(agent=self.agent, tier=tier, outcome="failed")
+            if not last and not isinstance(error, CircuitOpenError):
+                logger.warning("%s tier %s failed, escalating: %s", self.agent, tier, error)
+            return last
+        if last or self.is_uncertain is None or not self.is_uncertain(result):
+            CASCADE_OUTCOMES.inc(agent=self.agent, tier=tier, outcome="accepted")
+            return True
+        CASCADE_OUTCOMES.inc(agent=self.agent, tier=tier, outcome="escalated")
+        return False
+
+    def invoke(self, inputs: dict) -> BaseModel:
+        for index, (provider, model) in enumerate(self.tiers):
+            tier, last = f"{provider}:{model}", index == len(self.tiers) - 1
+            start = time.perf_counter()
+            try:
+                result = self._chain(provider, model).invoke(inputs)
+            except Exception as e:
+                if self._settle(tier, start, last, error=e):
+                    raise
+                continue
+            if self._settle(tier, start, last, result):
+                return result
+
+    async def ainvoke(self, inputs: dict) -> BaseModel:
+        for index, (provider, model) in enumerate(self.tiers):
+            tier, last = f"{provider}:{model}", index == len(self.tiers) - 1
+            start = time.perf_counter()
+            try:
+                result = await self._chain(provider, model).ainvoke(inputs)
+            except Exception as e:
+                if self._settle(tier, start, last, error=e):
+                    raise
+                continue
+            if self._settle(tier, start, last, result):
+                return result
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Optional, Sequence
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite import SqliteSaver
+from models import CandidateProfile, DecisionOutput, JobDescription
+from sqlite_store import SQLiteDatabase
+import config
+
+
+# Pydantic models stored in the graph state
+STATE_MODELS = [CandidateProfile, DecisionOutput, JobDescription]
+
+
+class TTLSqliteSaver(SqliteSaver):
+    """
+    langgraph-checkpoint-sqlite's SqliteSaver with TTL eviction
+
+    Threads untouched for ttl_seconds are evicted in batches as new
+    checkpoints are written. The connection is reopened after a fork (serve.py
+    workers), and the async methods run the sync ones in a thread, since one
+    graph serves the event loop and threadpool callers alike.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, serde=None):
+        self.ttl_seconds = ttl_seconds
+        self._db = SQLiteDatabase(path, schema=[
+            "CREATE TABLE IF NOT EXISTS thread_activity ("
+            "thread_id TEXT PRIMARY KEY, updated_at REAL NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS thread_activity_updated ON thread_activity (updated_at)"
+        ])
+        self._drop_legacy_tables()
+        super().__init__(self._db.conn, serde=serde)
+        self._puts = 0
+
+    @property
+    def conn(self):
+        return self._db.conn
+
+    @conn.setter
+    def conn(self, _conn):
+        """SqliteSaver assigns its connection; this saver always uses the process's own"""
+
+    def _drop_legacy_tables(self):
+        """Checkpoints written by the previous hand-rolled saver are short-lived; drop them"""
+        columns = {row[1] for row in self._db.conn.execute("PRAGMA table_info(checkpoints)")}
+        if "created_at" in columns:
+            self._db.conn.execute("DROP TABLE IF EXISTS checkpoints")
+            self._db.conn.execute("DROP TABLE IF EXISTS writes")
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        now = time.time()
+        with self.cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO thread_activity (thread_id, updated_at) VALUES (?, ?)",
+                (str(config["configurable"]["thread_id"]), now)
+            )
+            self._puts += 1
+            # Evict stale threads in batches rather than on every write
+            if self._puts % 100 == 1:
+                self._evict(cur, now)
+        return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        with self.cursor() as cur:
+            cur.execute("DELETE FROM thread_activity WHERE thread_id = ?", (str(thread_id),))
+
+    def _evict(self, cur, now: float):
+        """Drop threads whose latest checkpoint is older than the TTL"""
+        stale = "SELECT thread_id FROM thread_activity WHERE updated_at < ?"
+        cutoff = (now - self.ttl_seconds,)
+        cur.execute(f"DELETE FROM writes WHERE thread_id IN ({stale})", cutoff)
+        cur.execute(f"DELETE FROM checkpoints WHERE thread_id IN ({stale})", cutoff)
+        cur.execute("DELETE FROM thread_activity WHERE updated_at < ?", cutoff)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        tuples = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint_tuple in tuples:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def get_checkpointer() -> Optional[BaseCheckpointSaver]:
+    """Checkpointer for the screening graph from CHECKPOINT_BACKEND (None disables)"""
+    serde = JsonPlusSerializer(allowed_msgpack_modules=STATE_MODELS)
+    if config.CHECKPOINT_BACKEND == "sqlite":
+        return TTLSqliteSaver(config.CHECKPOINT_DB_PATH, config.CHECKPOINT_TTL_SECONDS, serde=serde)
+    if config.CHECKPOINT_BACKEND == "memory":
+        return InMemorySaver(serde=serde)
+    return None
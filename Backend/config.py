@@ -4,7 +4,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Model configuration+9*50002/-;p.,ī
-MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "openai")  # openai, openrouter, ollama
+MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "openai")  # openai, openrouter, ollama, fake (benchmarks)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
@@ -13,3 +13,198 @@ OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
 OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "microsoft/wizardlm-2-8x22b")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "qwen3:8b")
+
+MODEL_NAMES = {
+    "openai": OPENAI_MODEL,
+    "openrouter": OPENROUTER_MODEL,
+    "ollama": OLLAMA_MODEL,
+    "fake": "fake",
+}
+
+# Deterministic local fake LLM for benchmarks (MODEL_PROVIDER=fake)
+FAKE_LLM_LATENCY_SECONDS = float(os.getenv("FAKE_LLM_LATENCY_SECONDS", "0.5"))  # per call
+FAKE_LLM_SECONDS_PER_TOKEN = float(os.getenv("FAKE_LLM_SECONDS_PER_TOKEN", "0"))  # per output token
+
+# Multi-process serving (python serve.py): state shared by all API workers lives in SQLite here
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", "")  # serve.py defaults it to "state" with several workers
+
+
+def _shared_path(filename: str) -> str:
+    """Default database path under SHARED_STATE_DIR ("" when it is unset)"""
+    return os.path.join(SHARED_STATE_DIR, filename) if SHARED_STATE_DIR else ""
+
+
+# Upload ingestion
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))  # per resume file
+MAX_FORM_OVERHEAD_BYTES = int(os.getenv("MAX_FORM_OVERHEAD_BYTES", str(1024 * 1024)))  # non-file form fields
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR", "")  # empty uses the system temp directory
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+
+# Async pipeline
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "4"))  # worker threads for PDF/DOCX extraction
+
+# Text extraction budgets
+EXTRACTION_MAX_PAGES = int(os.getenv("EXTRACTION_MAX_PAGES", "20"))
+EXTRACTION_MAX_CHARS = int(os.getenv("EXTRACTION_MAX_CHARS", "60000"))
+# Time budget checked between pages: no new page is started after it, but a page in progress is not
+# interrupted (EXTRACTION_TIMEOUT_SECONDS is the old name)
+EXTRACTION_TIME_BUDGET_SECONDS = float(
+    os.getenv("EXTRACTION_TIME_BUDGET_SECONDS", os.getenv("EXTRACTION_TIMEOUT_SECONDS", "10"))
+)
+EXTRACTION_PROCESSES = int(os.getenv("EXTRACTION_PROCESSES", "0"))  # 0 disables parallel PDF pages
+EXTRACTION_PARALLEL_MIN_PAGES = int(os.getenv("EXTRACTION_PARALLEL_MIN_PAGES", "8"))
+
+# Structured output: provider-native JSON schema / tool calling instead of prompt format instructions
+STRUCTURED_OUTPUT_ENABLED = os.getenv("STRUCTURED_OUTPUT_ENABLED", "true").lower() == "true"
+STRUCTURED_OUTPUT_METHODS = {
+    "openai": "json_schema",
+    "openrouter": "function_calling",  # widest support across routed models
+    "ollama": "json_schema",  # sent as Ollama's format parameter
+    "fake": "json_schema"
+}
+STRUCTURED_OUTPUT_REPAIR_ATTEMPTS = int(os.getenv("STRUCTURED_OUTPUT_REPAIR_ATTEMPTS", "1"))  # short re-prompts on invalid output
+
+# Screening mode: "two_stage" (parse, then decide) or "single_call" (one combined LLM call)
+SCREENING_MODE = os.getenv("SCREENING_MODE", "two_stage")
+SCREENING_MODES = ("two_stage", "single_call")
+
+# Model cascade: "provider:model" tiers, cheapest first (e.g. "ollama:qwen3:8b,openai:gpt-4o").
+# A result escalates to the next tier when it fails or, for decisions, its
+# confidence_score falls in the uncertain band. Empty uses MODEL_PROVIDER alone.
+def _model_tiers(value: str) -> list:
+    tiers = []
+    for entry in value.split(","):
+        provider, _, model = entry.strip().partition(":")
+        if provider:
+            tiers.append((provider, model or MODEL_NAMES.get(provider)))
+    return tiers
+
+
+PARSER_MODEL_TIERS = _model_tiers(os.getenv("PARSER_MODEL_TIERS", ""))
+DECISION_MODEL_TIERS = _model_tiers(os.getenv("DECISION_MODEL_TIERS", ""))
+CASCADE_UNCERTAIN_MIN = float(os.getenv("CASCADE_UNCERTAIN_MIN", "40"))  # confidence scores in
+CASCADE_UNCERTAIN_MAX = float(os.getenv("CASCADE_UNCERTAIN_MAX", "75"))  # [min, max] escalate
+
+# Resume text preprocessing before the parsing prompt
+PREPROCESS_ENABLED = os.getenv("PREPROCESS_ENABLED", "true").lower() == "true"
+RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_TOKEN_BUDGET", "3000"))  # section-aware truncation target
+
+# Batch screening
+BATCH_DEFAULT_CONCURRENCY = int(os.getenv("BATCH_DEFAULT_CONCURRENCY", "8"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "64"))
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "500"))
+
+# Multi-job screening: one resume parsed once and evaluated against several jobs
+MULTI_MAX_JOBS = int(os.getenv("MULTI_MAX_JOBS", "50"))
+
+# Parsed profile cache (memory LRU tier plus optional SQLite tier)
+PROFILE_CACHE_ENABLED = os.getenv("PROFILE_CACHE_ENABLED", "true").lower() == "true"
+PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "1024"))
+PROFILE_CACHE_TTL_SECONDS = int(os.getenv("PROFILE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+PROFILE_CACHE_DB_PATH = os.getenv("PROFILE_CACHE_DB_PATH", _shared_path("profile_cache.db"))  # empty disables the disk tier
+PROFILE_CACHE_DB_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_DB_MAX_ENTRIES", "100000"))
+
+# Decision cache (opt-in; memory LRU tier plus optional SQLite tier)
+DECISION_CACHE_ENABLED = os.getenv("DECISION_CACHE_ENABLED", "false").lower() == "true"
+DECISION_CACHE_MAX_ENTRIES = int(os.getenv("DECISION_CACHE_MAX_ENTRIES", "4096"))
+DECISION_CACHE_TTL_SECONDS = int(os.getenv("DECISION_CACHE_TTL_SECONDS", str(24 * 3600)))
+DECISION_CACHE_DB_PATH = os.getenv("DECISION_CACHE_DB_PATH", _shared_path("decision_cache.db"))  # empty disables the disk tier
+DECISION_CACHE_DB_MAX_ENTRIES = int(os.getenv("DECISION_CACHE_DB_MAX_ENTRIES", "100000"))
+
+# Request coalescing: identical concurrent screenings (and resume parses) share one execution
+SINGLEFLIGHT_ENABLED = os.getenv("SINGLEFLIGHT_ENABLED", "true").lower() == "true"
+
+# Workflow checkpoints: a failed screening retried with its screening_id resumes after parsing
+CHECKPOINT_BACKEND = os.getenv("CHECKPOINT_BACKEND", "sqlite" if SHARED_STATE_DIR else "memory")  # memory, sqlite or none
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", _shared_path("checkpoints.db") or "checkpoints.db")  # sqlite backend
+CHECKPOINT_TTL_SECONDS = float(os.getenv("CHECKPOINT_TTL_SECONDS", "3600"))  # how long failed runs stay resumable
+CHECKPOINT_MAX_FAILED = int(os.getenv("CHECKPOINT_MAX_FAILED", "10000"))  # failed runs kept per process
+
+# Node-level retries for the LLM nodes (parse_resume, decision, screen)
+NODE_RETRY_MAX_ATTEMPTS = int(os.getenv("NODE_RETRY_MAX_ATTEMPTS", "2"))  # 1 disables
+NODE_RETRY_INITIAL_INTERVAL = float(os.getenv("NODE_RETRY_INITIAL_INTERVAL", "1"))
+NODE_RETRY_BACKOFF_FACTOR = float(os.getenv("NODE_RETRY_BACKOFF_FACTOR", "2"))
+NODE_RETRY_MAX_INTERVAL = float(os.getenv("NODE_RETRY_MAX_INTERVAL", "10"))
+
+# Durable job queue and background workers (run: python worker.py)
+JOB_QUEUE_DIR = os.getenv("JOB_QUEUE_DIR", "")  # empty disables /jobs and background screening
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BACKOFF_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "10"))  # doubles per attempt
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "600"))  # jobs of dead workers are retried after this
+JOB_WORKER_PROCESSES = int(os.getenv("JOB_WORKER_PROCESSES", "2"))
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", "4"))  # jobs in flight per worker process
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1"))
+
+# Deterministic pre-scoring (opt-in): clear rejects skip the decision LLM call
+PRESCORE_ENABLED = os.getenv("PRESCORE_ENABLED", "false").lower() == "true"
+PRESCORE_MIN_REQUIRED_MATCH = float(os.getenv("PRESCORE_MIN_REQUIRED_MATCH", "20"))  # % of required skills
+PRESCORE_MAX_EXPERIENCE_GAP = int(os.getenv("PRESCORE_MAX_EXPERIENCE_GAP", "5"))  # years short of requirement
+
+# /rank tokenizes profiles sent in the body on every request; larger pools belong in the search index
+RANK_MAX_INLINE_CANDIDATES = int(os.getenv("RANK_MAX_INLINE_CANDIDATES", "5000"))
+
+# Semantic candidate search index
+CANDIDATE_INDEX_DIR = os.getenv("CANDIDATE_INDEX_DIR", "")  # empty disables indexing and /search
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "")  # local sentence-transformers model; empty uses feature hashing
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1024"))  # feature hashing dimensions
+
+# Shared LLM HTTP clients
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))  # seconds
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "10"))  # seconds
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))  # retried with exponential backoff
+LLM_TIMEOUTS = {  # per-request read timeout in seconds
+    "openai": float(os.getenv("OPENAI_TIMEOUT", "60")),
+    "openrouter": float(os.getenv("OPENROUTER_TIMEOUT", "90")),
+    "ollama": float(os.getenv("OLLAMA_TIMEOUT", "180")),
+    "fake": 60.0,
+}
+
+# Startup warmup: build the graph and agents and pre-open LLM connections before serving traffic
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_CONNECTIONS = int(os.getenv("WARMUP_CONNECTIONS", "4"))  # kept alive for LLM_KEEPALIVE_EXPIRY
+
+# Hedged LLM calls: a call slower than HEDGE_PERCENTILE of its recent latencies is duplicated
+# to HEDGE_PROVIDER/HEDGE_MODEL and the first valid answer wins (empty provider disables)
+HEDGE_PROVIDER = os.getenv("HEDGE_PROVIDER", "")
+HEDGE_MODEL = os.getenv("HEDGE_MODEL", "") or MODEL_NAMES.get(HEDGE_PROVIDER)
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "1"))
+HEDGE_INITIAL_DELAY_SECONDS = float(os.getenv("HEDGE_INITIAL_DELAY_SECONDS", "15"))  # until HEDGE_MIN_SAMPLES
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_WINDOW = int(os.getenv("HEDGE_WINDOW", "500"))  # recent latencies kept per agent and provider
+
+# Circuit breakers: consecutive failed calls to a provider stop traffic to it for a while
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))  # 0 disables
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "30"))  # then one trial call is let through
+
+# LLM rate limits per provider (0 disables a limit)
+RATE_LIMIT_DB_PATH = os.getenv("RATE_LIMIT_DB_PATH", _shared_path("rate_limits.db"))  # empty keeps limits per process
+RATE_LIMIT_LEASE_SECONDS = float(os.getenv("RATE_LIMIT_LEASE_SECONDS", "600"))  # in-flight slots of dead workers expire
+LLM_EXPECTED_COMPLETION_TOKENS = int(os.getenv("LLM_EXPECTED_COMPLETION_TOKENS", "800"))
+RATE_LIMITS = {
+    "openai": {
+        "requests_per_minute": float(os.getenv("OPENAI_RPM", "500")),
+        "tokens_per_minute": float(os.getenv("OPENAI_TPM", "150000")),
+        "max_in_flight": int(os.getenv("OPENAI_MAX_IN_FLIGHT", "32")),
+    },
+    "openrouter": {
+        "requests_per_minute": float(os.getenv("OPENROUTER_RPM", "200")),
+        "tokens_per_minute": float(os.getenv("OPENROUTER_TPM", "0")),
+        "max_in_flight": int(os.getenv("OPENROUTER_MAX_IN_FLIGHT", "16")),
+    },
+    "ollama": {
+        "requests_per_minute": float(os.getenv("OLLAMA_RPM", "0")),
+        "tokens_per_minute": float(os.getenv("OLLAMA_TPM", "0")),
+        "max_in_flight": int(os.getenv("OLLAMA_MAX_IN_FLIGHT", "2")),
+    },
+    "fake": {
+        "requests_per_minute": 0,
+        "tokens_per_minute": 0,
+        "max_in_flight": int(os.getenv("FAKE_LLM_MAX_IN_FLIGHT", "256")),
+    },
+}
@@ -1,48 +1,53 @@
-from langchain_openai import ChatOpenAI
-from langchain_ollama import ChatOllama
+from functools import cached_property
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from models import CandidateProfile, JobDescription, DecisionOutput
+from llm_clients import get_llm
+from structured_output import StructuredChain
+from cascade import ModelCascade
+from resilience import with_hedging
 import config
 
 
 class DecisionAgent:
     """Agent for making hiring decisions based on candidate profile and job description"""
 
-    def __init__(self):
-        self.llm = self._get_llm()
+    # Bump when the evaluation prompt changes so cached decisions are not reused
+    PROMPT_VERSION = "2"
 
-    def _get_llm(self):
-        """Get the appropriate LLM based on configuration"""
-        if config.MODEL_PROVIDER == "openai":
-            return ChatOpenAI(
-                model=config.OPENAI_MODEL,
-                temperature=0.3,
-                openai_api_key=config.OPENAI_API_KEY
-            )
-        elif config.MODEL_PROVIDER == "openrouter":
-            return ChatOpenAI(
-                model=config.OPENROUTER_MODEL,
-                temperature=0.3,
-                openai_api_key=config.OPENROUTER_API_KEY,
-                openai_api_base="https://openrouter.ai/api/v1"
-            )
-        elif config.MODEL_PROVIDER == "ollama":
-            return ChatOllama(
-                model=config.OLLAMA_MODEL,
-                temperature=0.3,
-                base_url=config.OLLAMA_BASE_URL
-            )
-        else:
-            raise ValueError(f"Unsupported model provider: {config.MODEL_PROVIDER}")
+    TEMPERATURE = 0.3
 
-    def evaluate_candidate(
-        self,
-        candidate_profile: CandidateProfile,
-        job_description: JobDescription
-    ) -> DecisionOutput:
-        """Evaluate candidate against job description"""
+    def __init__(self):
+        self.cascade = self._get_cascade()
+        self.llm = None if self.cascade else self._get_llm()
 
+    def _get_llm(self):
+        """Get the shared LLM client for the configured provider"""
+        return get_llm(temperature=self.TEMPERATURE)
+
+    def _get_cascade(self):
+        """Model cascade over DECISION_MODEL_TIERS, or None for the single configured model"""
+        if not config.DECISION_MODEL_TIERS:
+            return None
+        return ModelCascade(
+            "decision",
+            config.DECISION_MODEL_TIERS,
+            self.TEMPERATURE,
+            self._build_chain,
+            is_uncertain=self._is_uncertain
+        )
+
+    @staticmethod
+    def _is_uncertain(decision: DecisionOutput) -> bool:
+        """Borderline confidence scores are re-evaluated by the next cascade tier"""
+        return config.CASCADE_UNCERTAIN_MIN <= decision.confidence_score <= config.CASCADE_UNCERTAIN_MAX
+
+    @cached_property
+    def chain(self):
+        """The model cascade when configured, else the (optionally hedged) single-model chain"""
+        return self.cascade or with_hedging("decision", self._build_chain, self.TEMPERATURE)
+
+    def _build_chain(self, llm=None, provider: str = None):
+        """Build the structured-output chain for candidate evaluation"""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert HR recruiter and hiring manager.
             Analyze the candidate profile against the job description and provide a detailed evaluation.
@@ -78,12 +83,15 @@ Analyze this candidate's fit for the position.
             """)
         ])
 
-        chain = prompt | self.llm
+        return StructuredChain(prompt, llm or self.llm, DecisionOutput, provider=provider, agent="decision")
 
-        format_instructions = self.parser.get_format_instructions()
-
-        response = chain.invoke({
-            "format_instructions": format_instructions,
+    def _build_inputs(
+        self,
+        candidate_profile: CandidateProfile,
+        job_description: JobDescription
+    ) -> dict:
+        """Build prompt inputs for the evaluation chain"""
+        return {
             "job_title": job_description.title,
             "job_description": job_description.description,
             "required_skills": ", ".join(job_description.required_skills),
@@ -96,28 +104,22 @@ Analyze this candidate's fit for the position.
             "candidate_education": "\n".join(candidate_profile.education),
             "candidate_certifications": ", ".join(candidate_profile.certifications) if candidate_profile.certifications else "None",
             "years_of_experience": candidate_profile.years_of_experience or "Not specified"
-        })
-
-        # Parse the response into DecisionOutput
-        try:
-            decision = self.parser.parse(response.content)
-            return decision
-        except Exception as e:
-            # Fallback: try to extract JSON from response
-            import json
-            import re
-
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                data = json.loads(json_str)
-                return DecisionOutput(**data)
-            else:
-                raise ValueError(f"Failed to parse decision: {str(e)}")
-
-    @property
-    def parser(self):
-        """Lazy initialization of parser"""
-        if not hasattr(self, '_parser'):
-            self._parser = PydanticOutputParser(pydantic_object=DecisionOutput)
-        return self._parser
+        }
+
+    def evaluate_candidate(
+        self,
+        candidate_profile: CandidateProfile,
+        job_description: JobDescription
+    ) -> DecisionOutput:
+        """Evaluate candidate against job description"""
+        inputs = self._build_inputs(candidate_profile, job_description)
+        return self.chain.invoke(inputs)
+
+    async def aevaluate_candidate(
+        self,
+        candidate_profile: CandidateProfile,
+        job_description: JobDescription
+    ) -> DecisionOutput:
+        """Async variant of evaluate_candidate using ainvoke"""
+        inputs = self._build_inputs(candidate_profile, job_description)
+        return await self.chain.ainvoke(inputs)
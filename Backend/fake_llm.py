@@ -0,0 +1,146 @@
+import asyncio
+import hashlib
+import json
+import re
+import time
+from typing import Any, List, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+
+# Skills recognized in the prompt when building a fake profile
+SKILL_VOCABULARY = (
+    "Python", "FastAPI", "Django", "Flask", "JavaScript", "TypeScript", "React", "Node.js",
+    "Docker", "Kubernetes", "AWS", "GCP", "PostgreSQL", "SQL", "Redis", "Go", "Java",
+    "LangChain", "Machine Learning", "REST APIs"
+)
+
+
+def _prompt_text(messages: List[BaseMessage]) -> str:
+    return "\n".join(
+        message.content if isinstance(message.content, str) else json.dumps(message.content)
+        for message in messages
+    )
+
+
+def _seed(prompt: str) -> int:
+    return int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _profile(prompt: str) -> dict:
+    skills = [
+        skill for skill in SKILL_VOCABULARY
+        if re.search(rf"(?<!\w){re.escape(skill)}(?!\w)", prompt, re.IGNORECASE)
+    ]
+    email = re.search(r"[\w.+-]+@[\w-]+\.[\w.]+", prompt)
+    years = re.findall(r"\b(?:19|20)\d{2}\b", prompt)
+    return {
+        "name": "Synthetic Candidate",
+        "email": email.group(0) if email else None,
+        "phone": None,
+        "summary": f"Engineer with experience in {', '.join(skills[:3]) or 'software development'}.",
+        "skills": skills or ["Communication"],
+        "experience": ["Software Engineer at Example Corp"],
+        "education": ["BSc Computer Science"],
+        "certifications": [],
+        "years_of_experience": (int(max(years)) - int(min(years))) if len(years) > 1 else 3
+    }
+
+
+def _decision(prompt: str) -> dict:
+    score = 40 + _seed(prompt) % 60
+    return {
+        "confidence_score": score,
+        "recommendation": "hire" if score >= 85 else "interview" if score >= 60 else "reject",
+        "advantages": ["Relevant technical skills"],
+        "disadvantages": ["Limited leadership experience"],
+        "skill_match_percentage": score,
+        "experience_match": "Meets the requirement" if score >= 60 else "Below the requirement",
+        "summary": "Deterministic assessment generated by the fake LLM."
+    }
+
+
+def fake_payload(schema_name: str, prompt: str) -> dict:
+    """Valid output for one of the agents' schemas, derived deterministically from the prompt"""
+    if schema_name == "CandidateProfile":
+        return _profile(prompt)
+    if schema_name == "DecisionOutput":
+        return _decision(prompt)
+    if schema_name == "ScreeningResponse":
+        return {"candidate_profile": _profile(prompt), "decision": _decision(prompt), "status": "success"}
+    raise ValueError(f"Fake LLM has no output for schema {schema_name}")
+
+
+def _schema_from_prompt(prompt: str) -> str:
+    """Which schema a prompt with format instructions asks for"""
+    if "candidate_profile" in prompt and "recommendation" in prompt:
+        return "ScreeningResponse"
+    if "recommendation" in prompt:
+        return "DecisionOutput"
+    return "CandidateProfile"
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic local stand-in for an LLM provider (MODEL_PROVIDER=fake)
+
+    Waits a fixed latency plus a per-output-token delay, then answers with
+    valid JSON for the requested schema, so benchmarks exercise the whole
+    pipeline without network calls or provider rate limits.
+    """
+
+    latency_seconds: float = 0.5
+    seconds_per_token: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _message(self, messages: List[BaseMessage], schema_name: Optional[str] = None) -> tuple:
+        prompt = _prompt_text(messages)
+        content = json.dumps(fake_payload(schema_name or _schema_from_prompt(prompt), prompt))
+        output_tokens = len(content) // 4
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": len(prompt) // 4,
+                "output_tokens": output_tokens,
+                "total_tokens": len(prompt) // 4 + output_tokens
+            }
+        )
+        return message, self.latency_seconds + output_tokens * self.seconds_per_token
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        message, delay = self._message(messages)
+        time.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any
+    ) -> ChatResult:
+        message, delay = self._message(messages)
+        await asyncio.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def with_structured_output(self, schema, *, method: str = None, include_raw: bool = False, **kwargs):
+        """Native-style structured output returning {"raw", "parsed", "parsing_error"}"""
+        def wrap(message: AIMessage):
+            parsed = schema(**json.loads(message.content))
+            return {"raw": message, "parsed": parsed, "parsing_error": None} if include_raw else parsed
+
+        def messages_of(prompt_value) -> List[BaseMessage]:
+            return prompt_value.to_messages() if hasattr(prompt_value, "to_messages") else prompt_value
+
+        def run(prompt_value):
+            message, delay = self._message(messages_of(prompt_value), schema.__name__)
+            time.sleep(delay)
+            return wrap(message)
+
+        async def arun(prompt_value):
+            message, delay = self._message(messages_of(prompt_value), schema.__name__)
+            await asyncio.sleep(delay)
+            return wrap(message)
+
+        return RunnableLambda(run, afunc=arun, name=f"fake_{schema.__name__}")
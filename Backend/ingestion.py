@@ -0,0 +1,89 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass
+from fastapi import HTTPException, UploadFile
+import config
+
+
+@dataclass
+class SpooledResume:
+    """An uploaded resume spooled to a temp file, hashed while it streamed in"""
+    path: str
+    filename: str
+    size: int
+    sha256: str
+
+    def cleanup(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def too_large_detail() -> str:
+    return f"File too large. Maximum upload size: {config.MAX_UPLOAD_BYTES / (1024 * 1024):.1f} MB"
+
+
+async def spool_upload(upload: UploadFile) -> SpooledResume:
+    """
+    Stream an upload to disk in chunks, enforcing MAX_UPLOAD_BYTES
+
+    Peak memory per upload is one chunk regardless of file size. The SHA-256
+    computed here keys the profile cache and candidate index.
+    """
+    if upload.size is not None and upload.size > config.MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=too_large_detail())
+
+    suffix = os.path.splitext(upload.filename or "")[1].lower()
+    spool = tempfile.NamedTemporaryFile(
+        prefix="resume-", suffix=suffix, dir=config.UPLOAD_SPOOL_DIR or None, delete=False
+    )
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while True:
+            chunk = await upload.read(config.UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > config.MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail=too_large_detail())
+            digest.update(chunk)
+            await asyncio.to_thread(spool.write, chunk)
+        spool.close()
+    except BaseException:
+        spool.close()
+        os.remove(spool.name)
+        raise
+
+    return SpooledResume(path=spool.name, filename=upload.filename, size=size, sha256=digest.hexdigest())
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file on disk, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(config.UPLOAD_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def open_mapped(path: str) -> mmap.mmap:
+    """Read-only memory map of a spooled file, handed to extractors without copying"""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def open_resume(path: str, filename: str):
+    """
+    Open a spooled resume for extraction
+
+    PDFs are memory-mapped (the PDF reader seeks around the whole file); DOCX
+    is opened as a regular file because zipfile needs a seekable() stream.
+    """
+    if filename.lower().endswith(".pdf"):
+        return open_mapped(path)
+    return open(path, "rb")
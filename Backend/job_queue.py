@@ -0,0 +1,189 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Optional
+from models import CandidateProfile, DecisionOutput, JobDescription
+from sqlite_store import SQLiteDatabase
+import config
+
+
+# Job states; "running" jobs whose lease expired are picked up again
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_COLUMNS = (
+    "id, status, filename, resume_path, resume_sha256, job_description, mode, "
+    "attempts, max_attempts, candidate_profile, decision, error, created_at, updated_at"
+)
+
+
+class JobQueue:
+    """
+    Durable screening job queue in a SQLite database (WAL, shared across processes)
+
+    Resumes are moved into the queue directory on enqueue so jobs survive
+    API and worker restarts. Workers claim jobs under a lease; a job whose
+    worker died is claimed again once its lease expires.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.files_dir = os.path.join(directory, "files")
+        os.makedirs(self.files_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = SQLiteDatabase(os.path.join(directory, "jobs.db"), schema=[
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, filename TEXT NOT NULL, "
+            "resume_path TEXT NOT NULL, resume_sha256 TEXT NOT NULL, "
+            "job_description TEXT NOT NULL, mode TEXT, "
+            "attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL, "
+            "candidate_profile TEXT, decision TEXT, error TEXT, "
+            "available_at REAL NOT NULL, lease_expires REAL, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at, created_at)"
+        ])
+
+    @property
+    def _conn(self):
+        return self._db.conn
+
+    def enqueue(
+        self,
+        resume_path: str,
+        filename: str,
+        resume_sha256: str,
+        job_description: JobDescription,
+        mode: Optional[str] = None
+    ) -> str:
+        """Take ownership of a spooled resume file and queue a screening job for it"""
+        job_id = uuid.uuid4().hex
+        stored_path = os.path.join(self.files_dir, job_id + os.path.splitext(filename)[1].lower())
+        shutil.move(resume_path, stored_path)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, filename, resume_path, resume_sha256, "
+                "job_description, mode, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id, QUEUED, filename, stored_path, resume_sha256,
+                    job_description.model_dump_json(), mode, config.JOB_MAX_ATTEMPTS,
+                    now, now, now
+                )
+            )
+        return job_id
+
+    def claim(self) -> Optional[dict]:
+        """Atomically lease the next ready job (queued, or running with an expired lease)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Expired leases on a final attempt are not retried again
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = COALESCE(error, 'Worker lease expired'), "
+                    "updated_at = ? WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                    (FAILED, now, RUNNING, now)
+                )
+                row = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM jobs "
+                    "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (QUEUED, now, RUNNING, now)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, "
+                        "lease_expires = ?, updated_at = ? WHERE id = ?",
+                        (RUNNING, now + config.JOB_LEASE_SECONDS, now, row[0])
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = self._to_dict(row)
+        job["attempts"] += 1
+        return job
+
+    def checkpoint(self, job_id: str, candidate_profile: CandidateProfile):
+        """Store the parsed profile so a retried job skips straight to the decision"""
+        self._update(job_id, candidate_profile=candidate_profile.model_dump_json())
+
+    def complete(self, job_id: str, candidate_profile: CandidateProfile, decision: DecisionOutput):
+        self._update(
+            job_id,
+            status=SUCCEEDED,
+            candidate_profile=candidate_profile.model_dump_json(),
+            decision=decision.model_dump_json(),
+            error=None,
+            lease_expires=None
+        )
+        self._remove_file(job_id)
+
+    def fail(self, job_id: str, error: str, attempts: int, max_attempts: int):
+        """Requeue with exponential backoff, or mark failed after the last attempt"""
+        if attempts < max_attempts:
+            backoff = config.JOB_RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+            self._update(
+                job_id, status=QUEUED, error=error,
+                available_at=time.time() + backoff, lease_expires=None
+            )
+        else:
+            self._update(job_id, status=FAILED, error=error, lease_expires=None)
+            self._remove_file(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def _update(self, job_id: str, **fields):
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id)
+            )
+
+    def _remove_file(self, job_id: str):
+        job = self.get(job_id)
+        if job:
+            try:
+                os.remove(job["resume_path"])
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        job = dict(zip([column.strip() for column in _COLUMNS.split(",")], row))
+        job["job_description"] = JobDescription(**json.loads(job["job_description"]))
+        if job["candidate_profile"]:
+            job["candidate_profile"] = CandidateProfile(**json.loads(job["candidate_profile"]))
+        if job["decision"]:
+            job["decision"] = DecisionOutput(**json.loads(job["decision"]))
+        return job
+
+
+_job_queue = None
+
+
+def get_job_queue() -> Optional[JobQueue]:
+    """Process-wide job queue (None when JOB_QUEUE_DIR is unset)"""
+    global _job_queue
+    if _job_queue is None and config.JOB_QUEUE_DIR:
+        _job_queue = JobQueue(config.JOB_QUEUE_DIR)
+    return _job_queue
@@ -0,0 +1,153 @@
+import asyncio
+import importlib.util
+import threading
+import httpx
+import config
+
+
+# Shared LLM clients keyed by (provider, model, temperature)
+_llms = {}
+_lock = threading.Lock()
+
+# One pooled HTTP client pair for all OpenAI-compatible providers
+_http_client = None
+_async_http_client = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.LLM_KEEPALIVE_EXPIRY
+    )
+
+
+def _timeout(provider: str) -> httpx.Timeout:
+    return httpx.Timeout(config.LLM_TIMEOUTS[provider], connect=config.LLM_CONNECT_TIMEOUT)
+
+
+def get_http_client() -> httpx.Client:
+    """Shared sync HTTP pool, created on first use"""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(limits=_pool_limits(), http2=_http2_available())
+        return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Shared async HTTP pool, created on first use"""
+    global _async_http_client
+    with _lock:
+        if _async_http_client is None:
+            _async_http_client = httpx.AsyncClient(limits=_pool_limits(), http2=_http2_available())
+        return _async_http_client
+
+
+# Endpoints whose connections warm_connections() opens ahead of the first LLM call
+PROVIDER_BASE_URLS = {
+    "openai": "https://api.openai.com/v1",
+    "openrouter": "https://openrouter.ai/api/v1"
+}
+
+
+async def warm_connections(provider: str = None) -> int:
+    """
+    Open WARMUP_CONNECTIONS pooled connections to the provider, returning how many succeeded
+
+    The requests are unauthenticated and their responses ignored; only the
+    TCP/TLS connections they leave in the keep-alive pool matter. Ollama's
+    SDK owns its clients (and is usually local), so it is not warmed.
+    """
+    provider = provider or config.MODEL_PROVIDER
+    url = PROVIDER_BASE_URLS.get(provider)
+    if url is None or config.WARMUP_CONNECTIONS <= 0:
+        return 0
+
+    client = get_async_http_client()
+
+    async def touch() -> bool:
+        try:
+            await client.get(url, timeout=config.LLM_CONNECT_TIMEOUT)
+            return True
+        except httpx.HTTPError:
+            return False
+
+    results = await asyncio.gather(*(touch() for _ in range(config.WARMUP_CONNECTIONS)))
+    return sum(results)
+
+
+def _build_llm(provider: str, model: str, temperature: float):
+    """Construct a chat model for a provider on the shared HTTP pool"""
+    if provider in ("openai", "openrouter"):
+        from langchain_openai import ChatOpenAI
+
+        kwargs = {}
+        if provider == "openrouter":
+            kwargs["openai_api_base"] = PROVIDER_BASE_URLS["openrouter"]
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            openai_api_key=config.OPENAI_API_KEY if provider == "openai" else config.OPENROUTER_API_KEY,
+            timeout=_timeout(provider),
+            max_retries=config.LLM_MAX_RETRIES,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
+            **kwargs
+        )
+    elif provider == "ollama":
+        from langchain_ollama import ChatOllama
+
+        # The Ollama SDK owns its httpx clients; give them the same tuning
+        return ChatOllama(
+            model=model,
+            temperature=temperature,
+            base_url=config.OLLAMA_BASE_URL,
+            client_kwargs={"timeout": _timeout(provider), "limits": _pool_limits()}
+        )
+    elif provider == "fake":
+        from fake_llm import FakeChatModel
+
+        return FakeChatModel(
+            latency_seconds=config.FAKE_LLM_LATENCY_SECONDS,
+            seconds_per_token=config.FAKE_LLM_SECONDS_PER_TOKEN
+        )
+    else:
+        raise ValueError(f"Unsupported model provider: {provider}")
+
+
+def get_llm(temperature: float, provider: str = None, model: str = None):
+    """Shared chat model for (provider, model, temperature), defaulting to config"""
+    provider = provider or config.MODEL_PROVIDER
+    model = model or config.MODEL_NAMES.get(provider)
+    key = (provider, model, temperature)
+
+    llm = _llms.get(key)
+    if llm is None:
+        llm = _build_llm(provider, model, temperature)
+        llm = _llms.setdefault(key, llm)
+    return llm
+
+
+def with_retries(llm, provider: str = None):
+    """
+    Exponential-backoff retries for providers whose SDK does not retry
+
+    The OpenAI SDK already retries with backoff (max_retries above).
+    """
+    provider = provider or config.MODEL_PROVIDER
+    if provider != "ollama" or config.LLM_MAX_RETRIES <= 0:
+        return llm
+
+    from ollama import ResponseError
+
+    return llm.with_retry(
+        retry_if_exception_type=(httpx.TransportError, ResponseError),
+        wait_exponential_jitter=True,
+        stop_after_attempt=config.LLM_MAX_RETRIES + 1
+    )
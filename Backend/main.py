@@ -1,17 +1,135 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from fastapi.responses import StreamingResponse, JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional, List
+import asyncio
 import json
-from models import JobDescription, ScreeningResponse
-from agent_graph import ResumeScreeningGraph
+import logging
+import threading
+import time
+import uuid
+from models import (
+    JobDescription,
+    ScreeningResponse,
+    BatchScreeningResult,
+    BatchScreeningSummary,
+    JobScreeningResult,
+    MultiScreeningResponse,
+    RankRequest,
+    RankedCandidate,
+    RankResponse,
+    SearchRequest,
+    SearchResult,
+    SearchResponse,
+    JobStatus,
+    JobsEnqueued
+)
+from ingestion import spool_upload
+from job_queue import JobQueue, get_job_queue, SUCCEEDED, FAILED
+from streaming import screening_events, encode_sse
+from rate_limiter import llm_priority, governor_stats, BATCH
+from metrics import render_metrics, REQUEST_LATENCY, REQUESTS_IN_PROGRESS, CONTENT_TYPE
+from llm_clients import warm_connections
+from resilience import circuit_stats
+import config
+
+if TYPE_CHECKING:
+    from agent_graph import ResumeScreeningGraph, AgentState
+
+logger = logging.getLogger("main")
+
+# The agent graph pulls in LangGraph, the agents and the provider SDK, so it is
+# built on first use (or by the startup warmup) rather than at import
+_screening_graph = None
+_screening_graph_lock = threading.Lock()
+
+
+def get_screening_graph() -> "ResumeScreeningGraph":
+    """Shared agent graph, built on first use"""
+    global _screening_graph
+    if _screening_graph is None:
+        with _screening_graph_lock:
+            if _screening_graph is None:
+                from agent_graph import ResumeScreeningGraph
+
+                _screening_graph = ResumeScreeningGraph()
+    return _screening_graph
+
+
+async def aget_screening_graph() -> "ResumeScreeningGraph":
+    """get_screening_graph for async handlers: a first build, and its agents, run in the threadpool"""
+    if _screening_graph is not None:
+        return _screening_graph
+    graph = await asyncio.to_thread(get_screening_graph)
+    await asyncio.to_thread(graph.warmup)
+    return graph
+
+
+async def warmup():
+    """Build the graph and agents and open LLM connections before serving traffic"""
+    start = time.perf_counter()
+    graph = await asyncio.to_thread(get_screening_graph)
+    await asyncio.to_thread(graph.warmup)
+    providers = {config.MODEL_PROVIDER}
+    providers.update(provider for provider, _ in config.PARSER_MODEL_TIERS + config.DECISION_MODEL_TIERS)
+    if config.HEDGE_PROVIDER:
+        providers.add(config.HEDGE_PROVIDER)
+    connections = sum(await asyncio.gather(*(warm_connections(provider) for provider in providers)))
+    logger.info(
+        "Warmed up in %.2fs (%d LLM connections opened)", time.perf_counter() - start, connections
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if config.WARMUP_ENABLED:
+        await warmup()
+    yield
+
 
 app = FastAPI(
     title="Resume Screening API",
     description="AI-powered resume screening with parsing and decision agents",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Reject oversize uploads from Content-Length before the body is read"""
+    content_length = request.headers.get("content-length")
+    is_upload = request.headers.get("content-type", "").startswith("multipart/form-data")
+    if is_upload and content_length and content_length.isdigit():
+        max_files = config.BATCH_MAX_FILES if request.url.path in ("/screen-batch", "/jobs") else 1
+        limit = config.MAX_UPLOAD_BYTES * max_files + config.MAX_FORM_OVERHEAD_BYTES
+        if int(content_length) > limit:
+            return JSONResponse(status_code=413, content={"detail": "Request body too large"})
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Request latency by route template (response start for streamed responses)"""
+    start = time.perf_counter()
+    status = 500
+    with REQUESTS_IN_PROGRESS.track_in_progress(method=request.method):
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - start,
+                method=request.method,
+                path=route.path if route else "unmatched",
+                status=status
+            )
+
+
+# Add CORS middleware (added last so it also wraps early rejections)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -20,8 +138,97 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize the agent graph
-screening_graph = ResumeScreeningGraph()
+ALLOWED_EXTENSIONS = ['.pdf', '.doc', '.docx']
+
+
+def validate_resume_file(resume: UploadFile):
+    """Reject uploads with an unsupported file extension"""
+    file_ext = '.' + resume.filename.split('.')[-1].lower()
+
+    if file_ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
+        )
+
+
+def validate_mode(mode: Optional[str]):
+    """Reject unknown screening modes (None uses config.SCREENING_MODE)"""
+    if mode is not None and mode not in config.SCREENING_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid mode. Allowed modes: {', '.join(config.SCREENING_MODES)}"
+        )
+
+
+async def screen_upload(
+    resume: UploadFile,
+    job_desc: JobDescription,
+    mode: Optional[str] = None,
+    screening_id: Optional[str] = None
+) -> "AgentState":
+    """Spool an upload to disk, run the screening workflow on it and clean up"""
+    spooled = await spool_upload(resume)
+    try:
+        if spooled.size == 0:
+            raise HTTPException(status_code=400, detail="Empty file uploaded")
+
+        graph = await aget_screening_graph()
+        return await graph.arun(
+            resume_path=spooled.path,
+            filename=resume.filename,
+            job_description=job_desc,
+            resume_sha256=spooled.sha256,
+            mode=mode,
+            screening_id=screening_id
+        )
+    finally:
+        spooled.cleanup()
+
+
+def get_queue() -> JobQueue:
+    """The durable job queue, or 503 when it is not configured"""
+    queue = get_job_queue()
+    if queue is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Background screening is disabled. Set JOB_QUEUE_DIR to enable it"
+        )
+    return queue
+
+
+def job_status(job: dict) -> JobStatus:
+    return JobStatus(
+        job_id=job["id"],
+        filename=job["filename"],
+        status=job["status"],
+        attempts=job["attempts"],
+        candidate_profile=job["candidate_profile"],
+        decision=job["decision"],
+        error=job["error"],
+        created_at=job["created_at"],
+        updated_at=job["updated_at"]
+    )
+
+
+async def enqueue_upload(
+    resume: UploadFile,
+    job_desc: JobDescription,
+    mode: Optional[str] = None
+) -> JobStatus:
+    """Spool an upload and hand it to the durable job queue"""
+    queue = get_queue()
+    spooled = await spool_upload(resume)
+    try:
+        if spooled.size == 0:
+            raise HTTPException(status_code=400, detail="Empty file uploaded")
+
+        job_id = await asyncio.to_thread(
+            queue.enqueue, spooled.path, resume.filename, spooled.sha256, job_desc, mode
+        )
+    finally:
+        spooled.cleanup()
+    return job_status(queue.get(job_id))
 
 
 @app.get("/")
@@ -31,7 +238,20 @@ async def root():
         "message": "Resume Screening API",
         "endpoints": {
             "POST /screen": "Screen a resume against job description",
-            "GET /health": "Health check"
+            "POST /screen-stream": "Screen a resume, streaming progress and partial results (SSE)",
+            "POST /jobs": "Queue resumes for background screening, returning job IDs",
+            "GET /jobs/{job_id}": "Status and result of a queued screening",
+            "GET /jobs/{job_id}/events": "Subscribe to a queued screening's status changes (SSE)",
+            "POST /screen-batch": "Screen many resumes against one job description (streamed)",
+            "POST /screen-multi": "Screen one resume against several job descriptions, ranked",
+            "POST /rank": "Rank candidate profiles against a job description without an LLM",
+            "POST /search": "Semantic search of stored candidates for a job description",
+            "DELETE /candidates/{candidate_id}": "Remove a candidate from the search index",
+            "GET /health": "Health check",
+            "GET /cache/stats": "Profile and decision cache hit/miss counters",
+            "GET /llm/stats": "LLM rate limiter queue depth, in-flight calls and circuit breakers",
+            "GET /metrics": "Prometheus metrics (latency, tokens, cache hits, errors)",
+            "POST /cache/decisions/invalidate": "Drop cached decisions for an edited job description"
         }
     }
 
@@ -42,14 +262,60 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters for the profile and decision caches"""
+    graph = await aget_screening_graph()
+    profile_cache = graph.profile_cache
+    decision_cache = graph.decision_cache
+    return {
+        "profiles": profile_cache.cache.stats() if profile_cache else {"enabled": False},
+        "decisions": decision_cache.cache.stats() if decision_cache else {"enabled": False}
+    }
+
+
+@app.get("/llm/stats")
+async def llm_stats():
+    """Queue depth, in-flight calls and circuit breaker state per LLM provider"""
+    return {"providers": governor_stats(), "circuits": circuit_stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus metrics in the text exposition format
+
+    Under serve.py with several workers the samples of every worker are
+    aggregated (PROMETHEUS_MULTIPROC_DIR), so any worker answers for all.
+    """
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+
+@app.post("/cache/decisions/invalidate")
+async def invalidate_decisions(job_description: JobDescription):
+    """
+    Drop cached decisions for a job description
+    
+    Send the job description as it was before being edited.
+    """
+    decision_cache = (await aget_screening_graph()).decision_cache
+    if decision_cache is None:
+        return {"invalidated": 0}
+    return {"invalidated": decision_cache.invalidate_job(job_description)}
+
+
 @app.post("/screen", response_model=ScreeningResponse)
 async def screen_resume(
+    response: Response,
     resume: UploadFile = File(..., description="Resume file (PDF, DOC, or DOCX)"),
     job_title: str = Form(..., description="Job title"),
     job_description: str = Form(..., description="Full job description"),
     required_skills: str = Form(..., description="Comma-separated required skills"),
     preferred_skills: Optional[str] = Form(None, description="Comma-separated preferred skills"),
-    experience_required: Optional[int] = Form(None, description="Years of experience required")
+    experience_required: Optional[int] = Form(None, description="Years of experience required"),
+    mode: Optional[str] = Form(None, description="two_stage or single_call (defaults to SCREENING_MODE)"),
+    background: bool = Form(False, description="Queue the screening and return a job (202)"),
+    screening_id: Optional[str] = Form(None, description="Retry a failed screening (X-Screening-ID)")
 ):
     """
     Screen a resume against a job description
@@ -57,23 +323,21 @@ async def screen_resume(
     Returns:
     - Candidate profile extracted from resume
     - Decision output with recommendations
+    
+    mode=single_call parses and evaluates in one LLM call for lower latency;
+    when the profile is already cached it takes the two-stage path instead,
+    and the response's mode names the path that ran.
+    background=true queues the screening and returns a JobStatus (202);
+    poll GET /jobs/{job_id} for the result.
+    
+    The X-Screening-ID response header identifies the run; resending it
+    after a failure resumes from the parsed profile instead of re-parsing.
     """
+    screening_id = screening_id or uuid.uuid4().hex
     try:
-        # Validate file type
-        allowed_extensions = ['.pdf', '.doc', '.docx']
-        file_ext = '.' + resume.filename.split('.')[-1].lower()
-        
-        if file_ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
-            )
-        
-        # Read file content
-        file_content = await resume.read()
-        
-        if len(file_content) == 0:
-            raise HTTPException(status_code=400, detail="Empty file uploaded")
+        # Validate file type and mode
+        validate_resume_file(resume)
+        validate_mode(mode)
         
         # Parse skills
         required_skills_list = [s.strip() for s in required_skills.split(',') if s.strip()]
@@ -90,21 +354,29 @@ async def screen_resume(
             experience_required=experience_required
         )
         
-        # Run the screening workflow
-        result = screening_graph.run(
-            resume_file=file_content,
-            filename=resume.filename,
-            job_description=job_desc
-        )
+        if background:
+            job = await enqueue_upload(resume, job_desc, mode)
+            return JSONResponse(status_code=202, content=job.model_dump())
+        
+        # Spool the upload to disk and run the screening workflow
+        result = await screen_upload(resume, job_desc, mode, screening_id)
+        # A duplicate of an in-flight screening shares that run and its ID
+        screening_id = result["screening_id"]
         
-        # Check for errors
+        # Check for errors (the screening ID lets the client resume the run)
         if result["error"]:
-            raise HTTPException(status_code=500, detail=result["error"])
+            raise HTTPException(
+                status_code=500,
+                detail=result["error"],
+                headers={"X-Screening-ID": screening_id}
+            )
         
         # Return response
+        response.headers["X-Screening-ID"] = screening_id
         return ScreeningResponse(
             candidate_profile=result["candidate_profile"],
             decision=result["decision"],
+            mode=result.get("effective_mode"),
             status="success"
         )
         
@@ -116,8 +388,11 @@ async def screen_resume(
 
 @app.post("/screen-json", response_model=ScreeningResponse)
 async def screen_resume_json(
+    response: Response,
     resume: UploadFile = File(..., description="Resume file (PDF, DOC, or DOCX)"),
-    job_data: str = Form(..., description="Job description as JSON string")
+    job_data: str = Form(..., description="Job description as JSON string"),
+    mode: Optional[str] = Form(None, description="two_stage or single_call (defaults to SCREENING_MODE)"),
+    screening_id: Optional[str] = Form(None, description="Retry a failed screening (X-Screening-ID)")
 ):
     """
     Alternative endpoint that accepts job description as JSON
@@ -131,42 +406,35 @@ async def screen_resume_json(
         "experience_required": 5
     }
     """
+    screening_id = screening_id or uuid.uuid4().hex
     try:
         # Parse job data JSON
         job_dict = json.loads(job_data)
         job_desc = JobDescription(**job_dict)
         
-        # Validate file type
-        allowed_extensions = ['.pdf', '.doc', '.docx']
-        file_ext = '.' + resume.filename.split('.')[-1].lower()
+        # Validate file type and mode
+        validate_resume_file(resume)
+        validate_mode(mode)
         
-        if file_ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
-            )
-        
-        # Read file content
-        file_content = await resume.read()
-        
-        if len(file_content) == 0:
-            raise HTTPException(status_code=400, detail="Empty file uploaded")
-        
-        # Run the screening workflow
-        result = screening_graph.run(
-            resume_file=file_content,
-            filename=resume.filename,
-            job_description=job_desc
-        )
+        # Spool the upload to disk and run the screening workflow
+        result = await screen_upload(resume, job_desc, mode, screening_id)
+        # A duplicate of an in-flight screening shares that run and its ID
+        screening_id = result["screening_id"]
         
-        # Check for errors
+        # Check for errors (the screening ID lets the client resume the run)
         if result["error"]:
-            raise HTTPException(status_code=500, detail=result["error"])
+            raise HTTPException(
+                status_code=500,
+                detail=result["error"],
+                headers={"X-Screening-ID": screening_id}
+            )
         
         # Return response
+        response.headers["X-Screening-ID"] = screening_id
         return ScreeningResponse(
             candidate_profile=result["candidate_profile"],
             decision=result["decision"],
+            mode=result.get("effective_mode"),
             status="success"
         )
         
@@ -178,6 +446,445 @@ async def screen_resume_json(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post("/screen-stream")
+async def screen_resume_stream(
+    resume: UploadFile = File(..., description="Resume file (PDF, DOC, or DOCX)"),
+    job_data: str = Form(..., description="Job description as JSON string"),
+    mode: Optional[str] = Form(None, description="two_stage or single_call (defaults to SCREENING_MODE)"),
+    screening_id: Optional[str] = Form(None, description="Retry a failed screening")
+):
+    """
+    Screen a resume, streaming progress as Server-Sent Events
+    
+    Emits stage events (upload received, text extracted, node finished),
+    profile_partial/decision_partial events with the fields parsed so far,
+    decision token events, then profile, decision and a final result (a
+    ScreeningResponse) or error event. The received event carries the
+    screening_id to resend when retrying a failed stream.
+    """
+    screening_id = screening_id or uuid.uuid4().hex
+    try:
+        job_desc = JobDescription(**json.loads(job_data))
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in job_data")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid job description: {str(e)}")
+
+    validate_resume_file(resume)
+    validate_mode(mode)
+
+    spooled = await spool_upload(resume)
+    if spooled.size == 0:
+        spooled.cleanup()
+        raise HTTPException(status_code=400, detail="Empty file uploaded")
+
+    async def stream_events():
+        try:
+            yield encode_sse("stage", {
+                "stage": "received",
+                "filename": resume.filename,
+                "size": spooled.size,
+                "screening_id": screening_id
+            })
+            graph = await aget_screening_graph()
+            graph_stream = graph.astream(
+                resume_path=spooled.path,
+                filename=resume.filename,
+                job_description=job_desc,
+                resume_sha256=spooled.sha256,
+                mode=mode,
+                screening_id=screening_id
+            )
+            async for event, data in screening_events(graph_stream):
+                yield encode_sse(event, data)
+        except Exception as e:
+            yield encode_sse("error", {"detail": f"Internal server error: {str(e)}"})
+        finally:
+            spooled.cleanup()
+
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _screen_batch_item(
+    index: int,
+    resume: UploadFile,
+    job_desc: JobDescription,
+    semaphore: asyncio.Semaphore
+) -> BatchScreeningResult:
+    """Screen one file of a batch, reporting failures instead of raising"""
+    # Batch LLM calls queue behind interactive /screen calls
+    with llm_priority(BATCH):
+        async with semaphore:
+            try:
+                validate_resume_file(resume)
+
+                result = await screen_upload(resume, job_desc)
+
+                if result["error"]:
+                    error = result["error"]
+                else:
+                    return BatchScreeningResult(
+                        index=index,
+                        filename=resume.filename,
+                        status="success",
+                        candidate_profile=result["candidate_profile"],
+                        decision=result["decision"]
+                    )
+            except HTTPException as e:
+                error = e.detail
+            except Exception as e:
+                error = f"Internal server error: {str(e)}"
+
+    return BatchScreeningResult(
+        index=index,
+        filename=resume.filename,
+        status="error",
+        error=error
+    )
+
+
+@app.post("/screen-batch")
+async def screen_resume_batch(
+    resumes: List[UploadFile] = File(..., description="Resume files (PDF, DOC, or DOCX)"),
+    job_data: str = Form(..., description="Job description as JSON string"),
+    concurrency: Optional[int] = Form(None, description="Maximum resumes screened at once"),
+    stream_format: str = Form("ndjson", description="Stream format: ndjson or sse")
+):
+    """
+    Screen many resumes against a single job description
+    
+    Results are streamed back as each file finishes (NDJSON lines or SSE
+    "result" events), followed by a final summary record. A failing file is
+    reported in its own result and does not stop the batch.
+    """
+    try:
+        job_desc = JobDescription(**json.loads(job_data))
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in job_data")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid job description: {str(e)}")
+
+    if len(resumes) > config.BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files. Maximum per batch: {config.BATCH_MAX_FILES}"
+        )
+
+    if stream_format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="stream_format must be ndjson or sse")
+
+    concurrency = concurrency or config.BATCH_DEFAULT_CONCURRENCY
+    if not 1 <= concurrency <= config.BATCH_MAX_CONCURRENCY:
+        raise HTTPException(
+            status_code=400,
+            detail=f"concurrency must be between 1 and {config.BATCH_MAX_CONCURRENCY}"
+        )
+
+    def encode(event: str, record) -> str:
+        if stream_format == "sse":
+            return f"event: {event}\ndata: {record.model_dump_json()}\n\n"
+        return record.model_dump_json() + "\n"
+
+    async def stream_results():
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [
+            asyncio.create_task(_screen_batch_item(index, resume, job_desc, semaphore))
+            for index, resume in enumerate(resumes)
+        ]
+        succeeded = 0
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                item = await next_result
+                if item.status == "success":
+                    succeeded += 1
+                yield encode("result", item)
+
+            yield encode("summary", BatchScreeningSummary(
+                total=len(tasks),
+                succeeded=succeeded,
+                failed=len(tasks) - succeeded
+            ))
+        finally:
+            # Client went away: stop any screenings still in flight
+            for task in tasks:
+                task.cancel()
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(stream_results(), media_type=media_type)
+
+
+def rank_job_results(results: list, job_descriptions: List[JobDescription]) -> List[JobScreeningResult]:
+    """Per-job results ranked by confidence, then skill match; failed jobs last"""
+    items = [
+        JobScreeningResult(
+            index=index,
+            job_title=job_descriptions[index].title,
+            status="error" if error else "success",
+            decision=decision,
+            error=error
+        )
+        for index, decision, error in results
+    ]
+    ranked = sorted(
+        (item for item in items if item.decision is not None),
+        key=lambda item: (item.decision.confidence_score, item.decision.skill_match_percentage),
+        reverse=True
+    )
+    for rank, item in enumerate(ranked, start=1):
+        item.rank = rank
+    return ranked + [item for item in items if item.decision is None]
+
+
+@app.post("/screen-multi", response_model=MultiScreeningResponse)
+async def screen_resume_multi(
+    resume: UploadFile = File(..., description="Resume file (PDF, DOC, or DOCX)"),
+    jobs_data: str = Form(..., description="Job descriptions as a JSON array")
+):
+    """
+    Screen one resume against several job descriptions
+    
+    The resume is extracted and parsed once, then the profile is evaluated
+    against every job concurrently. Results are ranked best fit first; a job
+    whose decision failed is reported with its error after the ranked ones.
+    """
+    try:
+        jobs = json.loads(jobs_data)
+        if not isinstance(jobs, list):
+            raise ValueError("jobs_data must be a JSON array")
+        job_descs = [JobDescription(**job) for job in jobs]
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in jobs_data")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid job description: {str(e)}")
+
+    if not 1 <= len(job_descs) <= config.MULTI_MAX_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"jobs_data must contain between 1 and {config.MULTI_MAX_JOBS} jobs"
+        )
+
+    validate_resume_file(resume)
+    spooled = await spool_upload(resume)
+    try:
+        if spooled.size == 0:
+            raise HTTPException(status_code=400, detail="Empty file uploaded")
+        graph = await aget_screening_graph()
+        result = await graph.arun_many(
+            resume_path=spooled.path,
+            filename=resume.filename,
+            job_descriptions=job_descs,
+            resume_sha256=spooled.sha256
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    finally:
+        spooled.cleanup()
+
+    if result["error"]:
+        raise HTTPException(status_code=500, detail=result["error"])
+
+    results = rank_job_results(result["results"], job_descs)
+    succeeded = sum(1 for item in results if item.status == "success")
+    return MultiScreeningResponse(
+        candidate_profile=result["candidate_profile"],
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded
+    )
+
+
+@app.post("/jobs", response_model=JobsEnqueued, status_code=202)
+async def enqueue_jobs(
+    resumes: List[UploadFile] = File(..., description="Resume files (PDF, DOC, or DOCX)"),
+    job_data: str = Form(..., description="Job description as JSON string"),
+    mode: Optional[str] = Form(None, description="two_stage or single_call (defaults to SCREENING_MODE)")
+):
+    """
+    Queue one or more resumes for background screening
+    
+    Jobs are stored durably and run by worker processes (python worker.py)
+    with retries; poll GET /jobs/{job_id} or subscribe to
+    GET /jobs/{job_id}/events for results.
+    """
+    try:
+        job_desc = JobDescription(**json.loads(job_data))
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in job_data")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid job description: {str(e)}")
+
+    if len(resumes) > config.BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files. Maximum per request: {config.BATCH_MAX_FILES}"
+        )
+
+    validate_mode(mode)
+    for resume in resumes:
+        validate_resume_file(resume)
+
+    jobs = [await enqueue_upload(resume, job_desc, mode) for resume in resumes]
+    return JobsEnqueued(jobs=jobs)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """Status of a queued screening, with the result once it has succeeded"""
+    job = await asyncio.to_thread(get_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status(job)
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """Server-Sent Events: a "status" event on every change until the job finishes"""
+    queue = get_queue()
+    job = await asyncio.to_thread(queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def stream_status():
+        current = job
+        last_seen = None
+        while True:
+            if (current["status"], current["updated_at"]) != last_seen:
+                last_seen = (current["status"], current["updated_at"])
+                yield encode_sse("status", json.loads(job_status(current).model_dump_json()))
+            if current["status"] in (SUCCEEDED, FAILED):
+                return
+            await asyncio.sleep(config.JOB_POLL_INTERVAL_SECONDS)
+            current = await asyncio.to_thread(queue.get, job_id)
+
+    return StreamingResponse(
+        stream_status(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/rank", response_model=RankResponse)
+def rank(request: RankRequest):
+    """
+    Rank candidate profiles against a job description
+    
+    Uses the vectorized skill-match engine only; no LLM calls are made.
+    Without candidates in the body the stored candidates in the search index
+    are ranked, and only the job is compiled per request: that is the path
+    for large pools. Profiles in the body are tokenized on every request, so
+    at most RANK_MAX_INLINE_CANDIDATES are accepted. Scoring is CPU bound, so
+    this runs in the threadpool.
+    """
+    from skill_index import rank_candidates
+
+    if request.candidates is None:
+        candidate_index = get_candidate_index(get_screening_graph())
+        stored, scores = candidate_index.rank(request.job_description, request.top_k)
+        results = [
+            RankedCandidate(
+                candidate_id=candidate_id,
+                name=name,
+                fit_score=float(scores.fit_score[position]),
+                skill_match_percentage=float(scores.skill_match_percentage[position]),
+                required_coverage=float(scores.required_coverage[position]),
+                experience_gap=float(scores.experience_gap[position])
+            )
+            for position, (candidate_id, name) in enumerate(stored)
+        ]
+        return RankResponse(results=results, total=len(candidate_index))
+
+    if len(request.candidates) > config.RANK_MAX_INLINE_CANDIDATES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Too many candidates. Maximum per request: {config.RANK_MAX_INLINE_CANDIDATES}; "
+                "index larger pools and omit candidates to rank them"
+            )
+        )
+
+    order, scores = rank_candidates(
+        request.job_description,
+        request.candidates,
+        request.top_k
+    )
+
+    results = [
+        RankedCandidate(
+            index=int(row),
+            name=request.candidates[row].name,
+            fit_score=float(scores.fit_score[row]),
+            skill_match_percentage=float(scores.skill_match_percentage[row]),
+            required_coverage=float(scores.required_coverage[row]),
+            experience_gap=float(scores.experience_gap[row])
+        )
+        for row in order
+    ]
+    return RankResponse(results=results, total=len(request.candidates))
+
+
+def get_candidate_index(graph: "ResumeScreeningGraph"):
+    """The graph's candidate search index, or 503 when it is not configured"""
+    candidate_index = graph.candidate_index
+    if candidate_index is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Candidate search is disabled. Set CANDIDATE_INDEX_DIR to enable it"
+        )
+    return candidate_index
+
+
+@app.post("/search", response_model=SearchResponse)
+async def search_candidates(request: SearchRequest):
+    """
+    Find stored candidates that fit a job description
+    
+    Candidates are ranked by embedding similarity. With evaluate=true only the
+    top-k results are sent on to the decision agent.
+    """
+    graph = await aget_screening_graph()
+    candidate_index = get_candidate_index(graph)
+    matches = await asyncio.to_thread(candidate_index.search, request.job_description, request.top_k)
+
+    results = [
+        SearchResult(candidate_id=candidate_id, similarity=similarity, candidate_profile=profile)
+        for candidate_id, similarity, profile in matches
+    ]
+
+    if request.evaluate and results:
+        decisions = await asyncio.gather(
+            *(
+                graph.decision_agent.aevaluate_candidate(
+                    result.candidate_profile,
+                    request.job_description
+                )
+                for result in results
+            ),
+            return_exceptions=True
+        )
+        for result, decision in zip(results, decisions):
+            if isinstance(decision, Exception):
+                result.error = f"Decision making failed: {str(decision)}"
+            else:
+                result.decision = decision
+
+    return SearchResponse(results=results, total_indexed=len(candidate_index))
+
+
+@app.delete("/candidates/{candidate_id}")
+async def delete_candidate(candidate_id: str):
+    """Remove a candidate from the search index"""
+    candidate_index = get_candidate_index(await aget_screening_graph())
+    if not await asyncio.to_thread(candidate_index.delete, candidate_id):
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    return {"deleted": candidate_id}
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host=config.SERVER_HOST, port=config.SERVER_PORT)
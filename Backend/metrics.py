@@ -0,0 +1,203 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Sequence
+import prometheus_client
+from prometheus_client import CONTENT_TYPE_LATEST as CONTENT_TYPE, CollectorRegistry, generate_latest
+from prometheus_client import multiprocess
+
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow LLM calls
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Set by serve.py for several workers: each process writes its samples there and a
+# scrape aggregates them (prometheus_client multiprocess mode)
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR", "")
+
+REGISTRY = CollectorRegistry()
+
+
+def _child(metric, labels: dict):
+    return metric.labels(**labels) if labels else metric
+
+
+class Counter:
+    """prometheus_client Counter taking label values as keyword arguments"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self._metric = prometheus_client.Counter(name, documentation, labelnames, registry=REGISTRY)
+
+    def inc(self, amount: float = 1, **labels):
+        _child(self._metric, labels).inc(amount)
+
+
+class Gauge:
+    """
+    prometheus_client Gauge taking label values as keyword arguments
+
+    multiprocess_mode says how worker values combine in a scrape, e.g.
+    "livesum" for in-progress counts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        multiprocess_mode: str = "livesum"
+    ):
+        self._metric = prometheus_client.Gauge(
+            name, documentation, labelnames, registry=REGISTRY, multiprocess_mode=multiprocess_mode
+        )
+
+    def set(self, value: float, **labels):
+        _child(self._metric, labels).set(value)
+
+    def inc(self, amount: float = 1, **labels):
+        _child(self._metric, labels).inc(amount)
+
+    def dec(self, amount: float = 1, **labels):
+        _child(self._metric, labels).dec(amount)
+
+    @contextmanager
+    def track_in_progress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram:
+    """prometheus_client Histogram taking label values as keyword arguments"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self._metric = prometheus_client.Histogram(
+            name, documentation, labelnames, registry=REGISTRY, buckets=buckets
+        )
+
+    def observe(self, value: float, **labels):
+        _child(self._metric, labels).observe(value)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+def render_metrics() -> bytes:
+    """Text exposition of every metric, summed over all worker processes in multiprocess mode"""
+    if not MULTIPROC_DIR:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=MULTIPROC_DIR)
+    return generate_latest(registry)
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency (to response start for streams)", ("method", "path", "status")
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being handled", ("method",)
+)
+EXTRACTION_LATENCY = Histogram(
+    "resume_extraction_duration_seconds", "Resume text extraction time by file format", ("format",)
+)
+NODE_LATENCY = Histogram(
+    "graph_node_duration_seconds", "Screening graph node execution time", ("node",)
+)
+NODE_ERRORS = Counter(
+    "graph_node_errors_total", "Screening graph node failures (each retry attempt counts)", ("node",)
+)
+NODES_IN_PROGRESS = Gauge(
+    "graph_nodes_in_progress", "Screening graph nodes currently executing", ("node",)
+)
+LLM_LATENCY = Histogram(
+    "llm_request_duration_seconds", "LLM call latency (excluding rate limiter wait)", ("agent", "provider")
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "LLM tokens used, by kind (prompt or completion)", ("agent", "provider", "kind")
+)
+LLM_ERRORS = Counter(
+    "llm_errors_total", "LLM calls that raised after client retries", ("agent", "provider")
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight", "LLM calls holding a rate limiter slot", ("provider",)
+)
+LLM_QUEUE_DEPTH = Gauge(
+    "llm_queue_depth", "LLM calls waiting for a rate limiter slot", ("provider",)
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Profile/decision cache lookups by result (hit or miss)", ("cache", "result")
+)
+
+CASCADE_OUTCOMES = Counter(
+    "model_cascade_results_total",
+    "Model cascade results per tier: accepted, escalated (uncertain) or failed",
+    ("agent", "tier", "outcome")
+)
+CASCADE_LATENCY = Histogram(
+    "model_cascade_tier_duration_seconds", "Time spent in each model cascade tier", ("agent", "tier")
+)
+
+HEDGED_CALLS = Counter(
+    "llm_hedged_calls_total",
+    "LLM calls duplicated to the hedge provider, by the call that answered (primary, secondary or none)",
+    ("agent", "winner")
+)
+CIRCUIT_OPEN = Gauge(
+    "llm_circuit_open",
+    "1 while a provider's circuit breaker is open or half-open (in any worker)",
+    ("provider",),
+    multiprocess_mode="livemax"
+)
+
+COALESCED_CALLS = Counter(
+    "coalesced_calls_total", "Calls that joined an identical call already in flight", ("flight",)
+)
+
+
+@contextmanager
+def track_llm_call(agent: str, provider: str):
+    """Time one LLM call and count it as an error if it raises"""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        LLM_ERRORS.inc(agent=agent, provider=provider)
+        raise
+    finally:
+        LLM_LATENCY.observe(time.perf_counter() - start, agent=agent, provider=provider)
+
+
+def record_llm_usage(agent: str, provider: str, response):
+    """Count prompt/completion tokens from a chat model response's usage metadata"""
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return
+    LLM_TOKENS.inc(usage.get("input_tokens", 0), agent=agent, provider=provider, kind="prompt")
+    LLM_TOKENS.inc(usage.get("output_tokens", 0), agent=agent, provider=provider, kind="completion")
+
+
+@contextmanager
+def track_node(node: str):
+    """Time one graph node execution, counting in-flight runs and failures"""
+    NODES_IN_PROGRESS.inc(node=node)
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        NODE_ERRORS.inc(node=node)
+        raise
+    finally:
+        NODE_LATENCY.observe(time.perf_counter() - start, node=node)
+        NODES_IN_PROGRESS.dec(node=node)
@@ -44,4 +44,112 @@ class ScreeningResponse(BaseModel):
     """API response model"""
     candidate_profile: CandidateProfile
     decision: DecisionOutput
+    mode: Optional[str] = Field(
+        default=None,
+        description="Mode that ran (single_call falls back to two_stage when the profile is cached)"
+    )
     status: str = "success"
+
+
+class BatchScreeningResult(BaseModel):
+    """Per-file result streamed back by the batch endpoint"""
+    index: int = Field(description="Position of the file in the upload")
+    filename: str = Field(description="Uploaded file name")
+    status: str = Field(description="success/error")
+    candidate_profile: Optional[CandidateProfile] = None
+    decision: Optional[DecisionOutput] = None
+    error: Optional[str] = None
+
+
+class BatchScreeningSummary(BaseModel):
+    """Final record of a batch screening stream"""
+    total: int
+    succeeded: int
+    failed: int
+    status: str = "complete"
+
+
+class JobScreeningResult(BaseModel):
+    """Decision for one job of a multi-job screening"""
+    index: int = Field(description="Position of the job in the request")
+    job_title: str
+    rank: Optional[int] = Field(default=None, description="1 for the best fit; None when the decision failed")
+    status: str = Field(description="success/error")
+    decision: Optional[DecisionOutput] = None
+    error: Optional[str] = None
+
+
+class MultiScreeningResponse(BaseModel):
+    """One parsed profile evaluated against several jobs, best fit first"""
+    candidate_profile: CandidateProfile
+    results: List[JobScreeningResult]
+    succeeded: int
+    failed: int
+    status: str = "success"
+
+
+class RankRequest(BaseModel):
+    """Rank candidate profiles (or the stored candidates) against a job description"""
+    job_description: JobDescription
+    candidates: Optional[List[CandidateProfile]] = Field(
+        default=None,
+        description="Profiles to rank (at most RANK_MAX_INLINE_CANDIDATES); omit to rank the candidates in the search index"
+    )
+    top_k: Optional[int] = Field(default=None, description="Number of results to return", ge=1)
+
+
+class RankedCandidate(BaseModel):
+    """One ranked candidate"""
+    index: Optional[int] = Field(default=None, description="Position of the candidate in the request")
+    candidate_id: Optional[str] = Field(default=None, description="Search index id of a stored candidate")
+    name: str
+    fit_score: float
+    skill_match_percentage: float
+    required_coverage: float
+    experience_gap: float
+
+
+class RankResponse(BaseModel):
+    """Ranked candidates, best fit first"""
+    results: List[RankedCandidate]
+    total: int
+
+
+class SearchRequest(BaseModel):
+    """Semantic search of stored candidates for a job description"""
+    job_description: JobDescription
+    top_k: int = Field(default=10, description="Number of candidates to return", ge=1, le=500)
+    evaluate: bool = Field(default=False, description="Run the decision agent on the top-k results")
+
+
+class SearchResult(BaseModel):
+    """One stored candidate matched by semantic search"""
+    candidate_id: str
+    similarity: float
+    candidate_profile: CandidateProfile
+    decision: Optional[DecisionOutput] = None
+    error: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    """Search results, most similar first"""
+    results: List[SearchResult]
+    total_indexed: int
+
+
+class JobStatus(BaseModel):
+    """State of a queued screening job"""
+    job_id: str
+    filename: str
+    status: str  # queued, running, succeeded or failed
+    attempts: int = 0
+    candidate_profile: Optional[CandidateProfile] = None
+    decision: Optional[DecisionOutput] = None
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+
+
+class JobsEnqueued(BaseModel):
+    """Jobs created by one enqueue request"""
+    jobs: List[JobStatus]
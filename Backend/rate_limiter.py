@@ -0,0 +1,437 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from sqlite_store import SQLiteDatabase
+from metrics import LLM_IN_FLIGHT, LLM_QUEUE_DEPTH
+import config
+
+
+# Request priorities: lower values are served first
+INTERACTIVE = 0
+BATCH = 1
+
+# How often a waiter re-checks limits shared with other processes (they cannot wake it)
+SHARED_POLL_SECONDS = 0.05
+
+# _try_grant result: the waiter may take a lease from the shared store
+_SHARED = "shared"
+
+_priority = contextvars.ContextVar("llm_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def llm_priority(level: int):
+    """Run LLM calls made in this context (and tasks it spawns) at a priority"""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def estimate_tokens(inputs: dict) -> int:
+    """Rough prompt + completion token estimate (~4 characters per token)"""
+    prompt_chars = sum(len(str(value)) for value in inputs.values())
+    return prompt_chars // 4 + config.LLM_EXPECTED_COMPLETION_TOKENS
+
+
+class TokenBucket:
+    """Continuous-refill token bucket; a rate of 0 means unlimited"""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` can be consumed"""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        if self.rate > 0:
+            self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        """Give back (positive) or charge (negative) tokens after the fact"""
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + delta)
+
+
+class _Waiter:
+    """A queued acquire, woken from any thread"""
+
+    def __init__(self, priority: int, seq: int, tokens: int, loop=None):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.loop = loop
+        self.lease_id = None
+        self.cancelled = False
+        self.event = asyncio.Event() if loop else threading.Event()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def wake(self):
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.event.set)
+        else:
+            self.event.set()
+
+
+class Lease:
+    """A granted LLM call slot; record actual usage once the call returns"""
+
+    def __init__(self, tokens: int, lease_id: str = None):
+        self.tokens = tokens
+        self.lease_id = lease_id
+        self.actual_tokens = None
+
+    def record(self, response):
+        usage = getattr(response, "usage_metadata", None)
+        if usage and usage.get("total_tokens"):
+            self.actual_tokens = usage["total_tokens"]
+
+
+class SharedLimits:
+    """
+    Request/token buckets and in-flight leases in SQLite, shared by all processes
+
+    Lets every API worker draw from one provider quota. Leases held by a
+    process that died expire after RATE_LIMIT_LEASE_SECONDS.
+    """
+
+    def __init__(self, path: str, lease_seconds: float):
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._db = SQLiteDatabase(path, schema=[
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "provider TEXT NOT NULL, kind TEXT NOT NULL, level REAL NOT NULL, updated REAL NOT NULL, "
+            "PRIMARY KEY (provider, kind))",
+            "CREATE TABLE IF NOT EXISTS leases ("
+            "id TEXT PRIMARY KEY, provider TEXT NOT NULL, expires REAL NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS leases_provider ON leases (provider, expires)"
+        ])
+
+    @staticmethod
+    def _load(conn, provider: str, kind: str, bucket: TokenBucket, now: float):
+        """Copy the shared bucket state into a TokenBucket (wall-clock based)"""
+        row = conn.execute(
+            "SELECT level, updated FROM buckets WHERE provider = ? AND kind = ?", (provider, kind)
+        ).fetchone()
+        bucket.tokens, bucket.updated = row if row else (bucket.capacity, now)
+
+    @staticmethod
+    def _store(conn, provider: str, kind: str, bucket: TokenBucket):
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (provider, kind, level, updated) VALUES (?, ?, ?, ?)",
+            (provider, kind, bucket.tokens, bucket.updated)
+        )
+
+    def _transaction(self, work):
+        with self._lock:
+            conn = self._db.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def try_acquire(self, governor: "ProviderGovernor", tokens: int):
+        """A lease ID when granted, else seconds to wait before trying again"""
+        def work(conn):
+            now = time.time()
+            conn.execute("DELETE FROM leases WHERE expires < ?", (now,))
+            in_flight = conn.execute(
+                "SELECT COUNT(*) FROM leases WHERE provider = ?", (governor.provider,)
+            ).fetchone()[0]
+            if in_flight >= governor.max_in_flight:
+                return SHARED_POLL_SECONDS
+            self._load(conn, governor.provider, "requests", governor.requests, now)
+            self._load(conn, governor.provider, "tokens", governor.tokens, now)
+            wait = max(governor.requests.wait_time(1, now), governor.tokens.wait_time(tokens, now))
+            if wait > 0:
+                return max(wait, SHARED_POLL_SECONDS)
+            governor.requests.consume(1)
+            governor.tokens.consume(tokens)
+            self._store(conn, governor.provider, "requests", governor.requests)
+            self._store(conn, governor.provider, "tokens", governor.tokens)
+            lease_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO leases (id, provider, expires) VALUES (?, ?, ?)",
+                (lease_id, governor.provider, now + self.lease_seconds)
+            )
+            return lease_id
+
+        return self._transaction(work)
+
+    def release(self, governor: "ProviderGovernor", lease: Lease):
+        """Free the lease and settle the token estimate against actual usage"""
+        def work(conn):
+            conn.execute("DELETE FROM leases WHERE id = ?", (lease.lease_id,))
+            if lease.actual_tokens is not None:
+                self._load(conn, governor.provider, "tokens", governor.tokens, time.time())
+                governor.tokens.adjust(lease.tokens - lease.actual_tokens)
+                self._store(conn, governor.provider, "tokens", governor.tokens)
+
+        self._transaction(work)
+
+
+class ProviderGovernor:
+    """
+    Request/token rate limits plus a max in-flight semaphore for one provider
+
+    Waiters are served strictly in (priority, arrival) order, so interactive
+    screenings overtake queued batch work. Usable from async code and threads.
+    With shared limits the buckets and in-flight count span all processes; their
+    SQLite transactions run outside the lock, and in a thread for async callers.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_in_flight: int,
+        shared: SharedLimits = None
+    ):
+        self.provider = provider
+        self.shared = shared
+        self.max_in_flight = max_in_flight
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.in_flight = 0
+        self.granted = 0
+        self.wait_seconds = 0.0
+        self._waiters = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def _publish(self):
+        """Export the in-flight and queued counts to /metrics (lock held)"""
+        LLM_IN_FLIGHT.set(self.in_flight, provider=self.provider)
+        LLM_QUEUE_DEPTH.set(sum(1 for waiter in self._waiters if not waiter.cancelled), provider=self.provider)
+
+    def _head(self):
+        while self._waiters and self._waiters[0].cancelled:
+            heapq.heappop(self._waiters)
+        return self._waiters[0] if self._waiters else None
+
+    def _take(self, waiter: _Waiter, lease_id: str = None):
+        """Dequeue a granted waiter (caller holds the lock); returns the next head"""
+        waiter.lease_id = lease_id
+        if self._head() is waiter:
+            heapq.heappop(self._waiters)
+        else:
+            # Overtaken by a higher-priority waiter or abandoned while taking its shared lease
+            waiter.cancelled = True
+        self.in_flight += 1
+        self.granted += 1
+        head = self._head()
+        self._publish()
+        return head
+
+    def _try_grant(self, waiter: _Waiter):
+        """True when granted, _SHARED to take a shared lease, else seconds to sleep (None: until woken)"""
+        with self._lock:
+            if self._head() is not waiter or self.in_flight >= self.max_in_flight:
+                return None
+            if self.shared is not None:
+                return _SHARED
+            now = time.monotonic()
+            wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(waiter.tokens, now))
+            if wait > 0:
+                return wait
+            self.requests.consume(1)
+            self.tokens.consume(waiter.tokens)
+            following = self._take(waiter)
+        if following is not None:
+            following.wake()
+        return True
+
+    def _lease_shared(self, waiter: _Waiter):
+        """Take a lease from the shared store, outside the lock; same results as _try_grant"""
+        granted = self.shared.try_acquire(self, waiter.tokens)
+        if not isinstance(granted, str):
+            return granted
+        with self._lock:
+            following = self._take(waiter, granted)
+        if following is not None:
+            following.wake()
+        return True
+
+    async def _alease_shared(self, waiter: _Waiter):
+        # The SQLite transaction can wait on other processes, so it runs in a thread
+        task = asyncio.ensure_future(asyncio.to_thread(self._lease_shared, waiter))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            task.add_done_callback(lambda done: self._release_abandoned(done, waiter))
+            raise
+
+    def _release_abandoned(self, done: asyncio.Future, waiter: _Waiter):
+        """Give back a lease granted to an acquire that was cancelled meanwhile"""
+        if not done.cancelled() and done.exception() is None and done.result() is True:
+            asyncio.get_running_loop().run_in_executor(None, self.release, Lease(waiter.tokens, waiter.lease_id))
+
+    def _enqueue(self, tokens: int, loop=None) -> _Waiter:
+        with self._lock:
+            waiter = _Waiter(_priority.get(), next(self._seq), tokens, loop)
+            heapq.heappush(self._waiters, waiter)
+            head = self._head()
+            self._publish()
+        if head is not waiter and head is not None:
+            head.wake()
+        return waiter
+
+    def _abandon(self, waiter: _Waiter):
+        with self._lock:
+            waiter.cancelled = True
+            head = self._head()
+            self._publish()
+        if head is not None:
+            head.wake()
+
+    async def acquire(self, tokens: int) -> Lease:
+        started = time.monotonic()
+        waiter = self._enqueue(tokens, asyncio.get_running_loop())
+        try:
+            while True:
+                result = self._try_grant(waiter)
+                if result is _SHARED:
+                    result = await self._alease_shared(waiter)
+                if result is True:
+                    break
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), timeout=result)
+                except asyncio.TimeoutError:
+                    pass
+                waiter.event.clear()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        self.wait_seconds += time.monotonic() - started
+        return Lease(tokens, waiter.lease_id)
+
+    def acquire_sync(self, tokens: int) -> Lease:
+        started = time.monotonic()
+        waiter = self._enqueue(tokens)
+        try:
+            while True:
+                result = self._try_grant(waiter)
+                if result is _SHARED:
+                    result = self._lease_shared(waiter)
+                if result is True:
+                    break
+                waiter.event.wait(timeout=result)
+                waiter.event.clear()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        self.wait_seconds += time.monotonic() - started
+        return Lease(tokens, waiter.lease_id)
+
+    def release(self, lease: Lease):
+        if self.shared is not None:
+            self.shared.release(self, lease)
+        with self._lock:
+            self.in_flight -= 1
+            if self.shared is None and lease.actual_tokens is not None:
+                self.tokens.adjust(lease.tokens - lease.actual_tokens)
+            head = self._head()
+            self._publish()
+        if head is not None:
+            head.wake()
+
+    async def arelease(self, lease: Lease):
+        if self.shared is None:
+            self.release(lease)
+        else:
+            # Shielded so a cancelled caller still frees the slot
+            await asyncio.shield(asyncio.to_thread(self.release, lease))
+
+    @asynccontextmanager
+    async def slot(self, tokens: int):
+        lease = await self.acquire(tokens)
+        try:
+            yield lease
+        finally:
+            await self.arelease(lease)
+
+    @contextmanager
+    def slot_sync(self, tokens: int):
+        lease = self.acquire_sync(tokens)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def stats(self) -> dict:
+        with self._lock:
+            queued = [waiter for waiter in self._waiters if not waiter.cancelled]
+            return {
+                "provider": self.provider,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "shared": self.shared is not None,
+                "queue_depth": len(queued),
+                "queue_depth_interactive": sum(1 for w in queued if w.priority == INTERACTIVE),
+                "queue_depth_batch": sum(1 for w in queued if w.priority != INTERACTIVE),
+                "granted": self.granted,
+                "wait_seconds_total": round(self.wait_seconds, 3)
+            }
+
+
+_governors = {}
+_governors_lock = threading.Lock()
+_shared_limits = None
+
+
+def _get_shared_limits() -> SharedLimits:
+    """Cross-process limit store (None when RATE_LIMIT_DB_PATH is unset)"""
+    global _shared_limits
+    if _shared_limits is None and config.RATE_LIMIT_DB_PATH:
+        _shared_limits = SharedLimits(config.RATE_LIMIT_DB_PATH, config.RATE_LIMIT_LEASE_SECONDS)
+    return _shared_limits
+
+
+def get_governor(provider: str = None) -> ProviderGovernor:
+    """Process-wide governor for a provider, configured from config.RATE_LIMITS"""
+    provider = provider or config.MODEL_PROVIDER
+    with _governors_lock:
+        governor = _governors.get(provider)
+        if governor is None:
+            limits = config.RATE_LIMITS.get(provider, {})
+            governor = ProviderGovernor(
+                provider,
+                requests_per_minute=limits.get("requests_per_minute", 0),
+                tokens_per_minute=limits.get("tokens_per_minute", 0),
+                max_in_flight=limits.get("max_in_flight", 8),
+                shared=_get_shared_limits()
+            )
+            _governors[provider] = governor
+        return governor
+
+
+def governor_stats() -> list:
+    with _governors_lock:
+        return [governor.stats() for governor in _governors.values()]
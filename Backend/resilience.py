@@ -0,0 +1,204 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Tuple
+from llm_clients import get_llm
+from metrics import HEDGED_CALLS, CIRCUIT_OPEN
+import config
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker
+
+    BREAKER_FAILURE_THRESHOLD consecutive failures open the circuit: calls
+    fail fast with CircuitOpenError. After BREAKER_RESET_SECONDS one trial
+    call is let through (half-open); its success closes the circuit, its
+    failure opens it again, and if it is cancelled the next call becomes the
+    trial. State is per process.
+    """
+
+    def __init__(self, provider: str, failure_threshold: int, reset_seconds: float):
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self._trial else "open"
+
+    def check(self) -> bool:
+        """Raise CircuitOpenError unless a call may go through now; True for the half-open trial call"""
+        if self.failure_threshold <= 0:
+            return False
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            if not self._trial and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self._trial = True
+                return True
+        raise CircuitOpenError(f"Circuit breaker open for provider {self.provider}")
+
+    def record_cancelled(self, trial: bool):
+        """A call ended without an outcome (e.g. cancelled): nothing is counted, but a trial may run again"""
+        if trial:
+            with self._lock:
+                self._trial = False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            if self.opened_at is not None:
+                self.opened_at = None
+                self._trial = False
+                CIRCUIT_OPEN.set(0, provider=self.provider)
+
+    def record_failure(self):
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._trial = False
+                CIRCUIT_OPEN.set(1, provider=self.provider)
+
+    def stats(self) -> dict:
+        return {"provider": self.provider, "state": self.state, "consecutive_failures": self.failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """Shared circuit breaker for a provider"""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = _breakers[provider] = CircuitBreaker(
+                provider, config.BREAKER_FAILURE_THRESHOLD, config.BREAKER_RESET_SECONDS
+            )
+        return breaker
+
+
+def circuit_stats() -> list:
+    with _breakers_lock:
+        return [breaker.stats() for breaker in _breakers.values()]
+
+
+class LatencyTracker:
+    """Recent call latencies, for the percentile that triggers a hedge"""
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def hedge_delay(self) -> float:
+        """HEDGE_PERCENTILE of recent latencies (HEDGE_INITIAL_DELAY_SECONDS until there are enough)"""
+        with self._lock:
+            if len(self.samples) < config.HEDGE_MIN_SAMPLES:
+                return config.HEDGE_INITIAL_DELAY_SECONDS
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(config.HEDGE_PERCENTILE / 100 * len(ordered)) - 1))
+        return max(config.HEDGE_MIN_DELAY_SECONDS, ordered[index])
+
+
+_trackers: Dict[Tuple[str, str], LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(agent: str, provider: str) -> LatencyTracker:
+    with _trackers_lock:
+        tracker = _trackers.get((agent, provider))
+        if tracker is None:
+            tracker = _trackers[(agent, provider)] = LatencyTracker(config.HEDGE_WINDOW)
+        return tracker
+
+
+class HedgedChain:
+    """
+    A primary chain backed by a delayed duplicate on a secondary chain
+
+    ainvoke starts the primary call; if it has not answered within its hedge
+    delay, or fails first, the same inputs go to the secondary chain and the
+    first valid result wins while the other call is cancelled. Only the slow
+    tail is duplicated, so spend grows by about (100 - HEDGE_PERCENTILE)%.
+    invoke (sync) cannot cancel a call, so it only fails over on error.
+    """
+
+    def __init__(self, agent: str, primary, secondary):
+        self.agent = agent
+        self.primary = primary
+        self.secondary = secondary
+        self.tracker = get_latency_tracker(agent, primary.provider)
+
+    def invoke(self, inputs: dict):
+        start = time.perf_counter()
+        try:
+            result = self.primary.invoke(inputs)
+        except Exception:
+            HEDGED_CALLS.inc(agent=self.agent, winner="secondary")
+            return self.secondary.invoke(inputs)
+        self.tracker.observe(time.perf_counter() - start)
+        return result
+
+    async def ainvoke(self, inputs: dict):
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self.primary.ainvoke(inputs))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.tracker.hedge_delay())
+            if done and primary.exception() is None:
+                self.tracker.observe(time.perf_counter() - start)
+                return primary.result()
+
+            tasks.add(asyncio.ensure_future(self.secondary.ainvoke(inputs)))
+            error = None
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        HEDGED_CALLS.inc(agent=self.agent, winner="primary" if task is primary else "secondary")
+                        return task.result()
+                    error = error or task.exception()
+            HEDGED_CALLS.inc(agent=self.agent, winner="none")
+            raise error
+        finally:
+            # A primary still running gives a lower bound, but keeps the slow tail in the percentile
+            hedged = len(tasks) > 1
+            if hedged and (not primary.done() or (not primary.cancelled() and primary.exception() is None)):
+                self.tracker.observe(time.perf_counter() - start)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # a losing call's error counts as retrieved
+
+
+def with_hedging(agent: str, build_chain: Callable, temperature: float):
+    """The agent's chain, hedged onto HEDGE_PROVIDER/HEDGE_MODEL when one is configured"""
+    primary = build_chain()
+    if not config.HEDGE_PROVIDER:
+        return primary
+    secondary = build_chain(
+        get_llm(temperature, config.HEDGE_PROVIDER, config.HEDGE_MODEL), config.HEDGE_PROVIDER
+    )
+    return HedgedChain(agent, primary, secondary)
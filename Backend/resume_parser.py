@@ -1,61 +1,66 @@
-import PyPDF2
-import docx
-from typing import BinaryIO
-from langchain_openai import ChatOpenAI
-from langchain_ollama import ChatOllama
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import BinaryIO, Optional
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from models import CandidateProfile
+from text_extraction import extract_pdf_text, extract_docx_text
+from ingestion import open_resume
+from llm_clients import get_llm
+from structured_output import StructuredChain
+from cascade import ModelCascade
+from resilience import with_hedging
+from text_preprocessing import ContactInfo, preprocess_resume
+from metrics import EXTRACTION_LATENCY
 import config
 
 
+# Shared worker pool so document extraction never runs on the event loop
+_extraction_pool = None
+
+
+def get_extraction_pool() -> ThreadPoolExecutor:
+    """Lazy initialization of the extraction worker pool"""
+    global _extraction_pool
+    if _extraction_pool is None:
+        _extraction_pool = ThreadPoolExecutor(
+            max_workers=config.EXTRACTION_WORKERS,
+            thread_name_prefix="resume-extract"
+        )
+    return _extraction_pool
+
+
 class ResumeParser:
     """Agent for parsing resumes and extracting candidate profiles"""
 
+    # Bump when the parsing prompt changes so cached profiles are not reused
+    PROMPT_VERSION = "3"
+
     def __init__(self):
-        self.llm = self._get_llm()
+        self.cascade = self._get_cascade()
+        self.llm = None if self.cascade else self._get_llm()
 
     def _get_llm(self):
-        """Get the appropriate LLM based on configuration"""
-        if config.MODEL_PROVIDER == "openai":
-            return ChatOpenAI(
-                model=config.OPENAI_MODEL,
-                temperature=0,
-                openai_api_key=config.OPENAI_API_KEY
-            )
-        elif config.MODEL_PROVIDER == "openrouter":
-            return ChatOpenAI(
-                model=config.OPENROUTER_MODEL,
-                temperature=0,
-                openai_api_key=config.OPENROUTER_API_KEY,
-                openai_api_base="https://openrouter.ai/api/v1"
-            )
-        elif config.MODEL_PROVIDER == "ollama":
-            return ChatOllama(
-                model=config.OLLAMA_MODEL,
-                temperature=0,
-                base_url=config.OLLAMA_BASE_URL
-            )
-        else:
-            raise ValueError(f"Unsupported model provider: {config.MODEL_PROVIDER}")
+        """Get the shared LLM client for the configured provider"""
+        return get_llm(temperature=0)
 
-    def extract_text_from_pdf(self, file: BinaryIO) -> str:
+    def _get_cascade(self):
+        """Model cascade over PARSER_MODEL_TIERS (escalating on failure only), or None"""
+        if not config.PARSER_MODEL_TIERS:
+            return None
+        return ModelCascade("resume_parser", config.PARSER_MODEL_TIERS, 0, self._build_chain)
+
+    def extract_text_from_pdf(self, file: BinaryIO, path: Optional[str] = None) -> str:
         """Extract text from PDF file"""
         try:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return extract_pdf_text(file, path)
         except Exception as e:
             raise ValueError(f"Error reading PDF: {str(e)}")
 
     def extract_text_from_docx(self, file: BinaryIO) -> str:
         """Extract text from DOCX file"""
         try:
-            doc = docx.Document(file)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text.strip()
+            return extract_docx_text(file)
         except Exception as e:
             raise ValueError(f"Error reading DOCX: {str(e)}")
 
@@ -65,10 +70,15 @@ class ResumeParser:
         # For now, we'll raise an error suggesting conversion
         raise ValueError("Legacy .doc format not fully supported. Please convert to .docx or PDF")
 
-    def extract_text(self, file: BinaryIO, filename: str) -> str:
-        """Extract text based on file extension"""
+    def extract_text(self, file: BinaryIO, filename: str, path: Optional[str] = None) -> str:
+        """Extract text based on file extension, timing each format"""
+        file_format = filename.rsplit('.', 1)[-1].lower() if '.' in filename else "unknown"
+        with EXTRACTION_LATENCY.time(format=file_format):
+            return self._extract_text(file, filename, path)
+
+    def _extract_text(self, file: BinaryIO, filename: str, path: Optional[str] = None) -> str:
         if filename.lower().endswith('.pdf'):
-            return self.extract_text_from_pdf(file)
+            return self.extract_text_from_pdf(file, path)
         elif filename.lower().endswith('.docx'):
             return self.extract_text_from_docx(file)
         elif filename.lower().endswith('.doc'):
@@ -76,54 +86,81 @@ class ResumeParser:
         else:
             raise ValueError("Unsupported file format. Please upload PDF, DOC, or DOCX")
 
-    def parse_resume(self, file: BinaryIO, filename: str) -> CandidateProfile:
-        """Parse resume and create candidate profile"""
-        # Extract text from document
-        resume_text = self.extract_text(file, filename)
-
-        if not resume_text or len(resume_text.strip()) < 50:
-            raise ValueError("Resume appears to be empty or too short")
-
-        # Create prompt for LLM
+    def extract_text_from_path(self, path: str, filename: str) -> str:
+        """Extract text from a spooled file without reading it into memory first"""
+        file = open_resume(path, filename)
+        try:
+            return self.extract_text(file, filename, path)
+        finally:
+            file.close()
+
+    async def aextract_text(self, path: str, filename: str) -> str:
+        """Extract text in the worker pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_extraction_pool(),
+            self.extract_text_from_path,
+            path,
+            filename
+        )
+
+    @cached_property
+    def chain(self):
+        """The model cascade when configured, else the (optionally hedged) single-model chain"""
+        return self.cascade or with_hedging("resume_parser", self._build_chain, 0)
+
+    def _build_chain(self, llm=None, provider: str = None):
+        """Build the structured-output chain for resume parsing"""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert resume parser. Extract structured information from the resume text.
             Be thorough and accurate. If information is not available, use appropriate defaults.
 
             {format_instructions}"""),
-            ("user", "Resume Text:\n\n{resume_text}")
+            ("user", "Contact details (pre-extracted):\n{contact_hints}\n\nResume Text:\n\n{resume_text}")
         ])
 
-        # Parse resume using LLM
-        chain = prompt | self.llm
+        return StructuredChain(prompt, llm or self.llm, CandidateProfile, provider=provider, agent="resume_parser")
+
+    def _build_inputs(self, resume_text: str) -> dict:
+        """Build prompt inputs for the parsing chain"""
+        if not resume_text or len(resume_text.strip()) < 50:
+            raise ValueError("Resume appears to be empty or too short")
 
-        format_instructions = self.parser.get_format_instructions()
+        contacts = ContactInfo()
+        if config.PREPROCESS_ENABLED:
+            preprocessed = preprocess_resume(resume_text)
+            resume_text, contacts = preprocessed.text, preprocessed.contacts
 
-        response = chain.invoke({
+        return {
             "resume_text": resume_text,
-            "format_instructions": format_instructions
-        })
+            "contact_hints": contacts.as_prompt_text(),
+            "contacts": contacts
+        }
+
+    def parse_text(self, resume_text: str) -> CandidateProfile:
+        """Parse already extracted resume text using the LLM"""
+        inputs = self._build_inputs(resume_text)
+        contacts = inputs.pop("contacts")
+        return contacts.apply_to(self.chain.invoke(inputs))
+
+    async def aparse_text(self, resume_text: str) -> CandidateProfile:
+        """Async variant of parse_text using ainvoke"""
+        inputs = self._build_inputs(resume_text)
+        contacts = inputs.pop("contacts")
+        return contacts.apply_to(await self.chain.ainvoke(inputs))
 
-        # Parse the response into CandidateProfile
-        try:
-            candidate_profile = self.parser.parse(response.content)
-            return candidate_profile
-        except Exception as e:
-            # Fallback: try to extract JSON from response
-            import json
-            import re
-
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                data = json.loads(json_str)
-                return CandidateProfile(**data)
-            else:
-                raise ValueError(f"Failed to parse resume: {str(e)}")
-
-    @property
-    def parser(self):
-        """Lazy initialization of parser"""
-        if not hasattr(self, '_parser'):
-            self._parser = PydanticOutputParser(pydantic_object=CandidateProfile)
-        return self._parser
+    def parse_resume(self, file: BinaryIO, filename: str) -> CandidateProfile:
+        """Parse resume and create candidate profile"""
+        # Extract text from document
+        resume_text = self.extract_text(file, filename)
+
+        # Parse resume using LLM
+        return self.parse_text(resume_text)
+
+    async def aparse_resume(self, path: str, filename: str) -> CandidateProfile:
+        """Async variant of parse_resume using the worker pool and ainvoke"""
+        # Extract text from document off the event loop
+        resume_text = await self.aextract_text(path, filename)
+
+        # Parse resume using LLM
+        return await self.aparse_text(resume_text)
@@ -0,0 +1,91 @@
+from langchain_core.prompts import ChatPromptTemplate
+from models import JobDescription, ScreeningResponse
+from llm_clients import get_llm
+from structured_output import StructuredChain
+from text_preprocessing import ContactInfo, preprocess_resume
+import config
+
+
+class CombinedScreeningAgent:
+    """Agent that parses a resume and evaluates it against a job in one LLM call"""
+
+    # Bump when the combined prompt changes
+    PROMPT_VERSION = "2"
+
+    def __init__(self):
+        self.llm = self._get_llm()
+
+    def _get_llm(self):
+        """Get the shared LLM client for the configured provider"""
+        return get_llm(temperature=0)
+
+    def _build_chain(self):
+        """Build the structured-output chain for single-call screening"""
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are an expert resume parser and HR recruiter.
+            First extract the candidate profile from the resume text, then evaluate that
+            profile against the job description.
+
+            For the profile, be thorough and accurate. If information is not available,
+            use appropriate defaults.
+
+            For the decision, consider skills match (required vs preferred), experience
+            level and relevance, education, certifications and overall fit. Provide a
+            confidence score (0-100), recommendation (hire/interview/reject), advantages,
+            disadvantages, skill match percentage, and a comprehensive summary.
+
+            {format_instructions}"""),
+            ("user", """
+Job Title: {job_title}
+Job Description: {job_description}
+Required Skills: {required_skills}
+Preferred Skills: {preferred_skills}
+Experience Required: {experience_required} years
+
+Contact details (pre-extracted):
+{contact_hints}
+
+Resume Text:
+
+{resume_text}
+            """)
+        ])
+
+        return StructuredChain(prompt, self.llm, ScreeningResponse, agent="screening")
+
+    def _build_inputs(self, resume_text: str, job_description: JobDescription) -> tuple:
+        """Build prompt inputs, returning them with the pre-extracted contacts"""
+        if not resume_text or len(resume_text.strip()) < 50:
+            raise ValueError("Resume appears to be empty or too short")
+
+        contacts = ContactInfo()
+        if config.PREPROCESS_ENABLED:
+            preprocessed = preprocess_resume(resume_text)
+            resume_text, contacts = preprocessed.text, preprocessed.contacts
+
+        inputs = {
+            "job_title": job_description.title,
+            "job_description": job_description.description,
+            "required_skills": ", ".join(job_description.required_skills),
+            "preferred_skills": ", ".join(job_description.preferred_skills) if job_description.preferred_skills else "None",
+            "experience_required": job_description.experience_required or "Not specified",
+            "contact_hints": contacts.as_prompt_text(),
+            "resume_text": resume_text
+        }
+        return inputs, contacts
+
+    def _finish(self, screening: ScreeningResponse, contacts: ContactInfo) -> ScreeningResponse:
+        """Backfill contacts and mark the validated result successful"""
+        contacts.apply_to(screening.candidate_profile)
+        screening.status = "success"
+        return screening
+
+    def screen(self, resume_text: str, job_description: JobDescription) -> ScreeningResponse:
+        """Extract the profile and decide on the candidate in one call"""
+        inputs, contacts = self._build_inputs(resume_text, job_description)
+        return self._finish(self._build_chain().invoke(inputs), contacts)
+
+    async def ascreen(self, resume_text: str, job_description: JobDescription) -> ScreeningResponse:
+        """Async variant of screen using ainvoke"""
+        inputs, contacts = self._build_inputs(resume_text, job_description)
+        return self._finish(await self._build_chain().ainvoke(inputs), contacts)
@@ -0,0 +1,128 @@
+"""
+Production launcher: several uvicorn worker processes on one listening socket
+
+Usage: python serve.py [--workers N] [--host HOST] [--port PORT]
+
+The app and its agent graph, with the LangGraph/LangChain stack and the
+agents, are built once before forking, so workers start immediately and share
+those pages copy-on-write; each worker then only opens its own LLM connections
+during startup warmup. With more than one worker, caches, rate limits and checkpoints
+default to SQLite databases under SHARED_STATE_DIR ("state") so the workers
+share them, and /metrics aggregates every worker's samples (prometheus_client
+multiprocess mode under SHARED_STATE_DIR/metrics). /cache/stats, circuit
+breakers and hedge latency windows stay per worker.
+Dead workers are restarted; SIGTERM/SIGINT stop them gracefully.
+"""
+import argparse
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+
+logger = logging.getLogger("serve")
+
+
+def run_worker(app, sock: socket.socket, log_level: str):
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, log_level=log_level))
+    server.run(sockets=[sock])
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def reset_metrics_dir(path: str):
+    """Drop samples left by a previous run; counters restart with the server"""
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.remove(os.path.join(path, name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API with several worker processes")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("SERVER_WORKERS", "1")))
+    parser.add_argument("--host", default=os.getenv("SERVER_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("SERVER_PORT", "8000")))
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(message)s")
+
+    # Must be set before config is first imported
+    if args.workers > 1:
+        os.environ.setdefault("SHARED_STATE_DIR", "state")
+
+    import config
+
+    # Workers write metric samples to files that any worker's /metrics aggregates.
+    # Must be set before metrics (prometheus_client) is first imported.
+    if args.workers > 1 and config.SHARED_STATE_DIR:
+        metrics_dir = os.environ.setdefault(
+            "PROMETHEUS_MULTIPROC_DIR", os.path.join(config.SHARED_STATE_DIR, "metrics")
+        )
+        reset_metrics_dir(metrics_dir)
+
+    # Preload the application and its graph before forking
+    server_app = importlib.import_module("main")
+    server_app.get_screening_graph().warmup()
+    app = server_app.app
+
+    if args.workers <= 1:
+        import uvicorn
+
+        uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
+        return
+
+    sock = bind_socket(args.host, args.port)
+    context = multiprocessing.get_context("fork")
+    stopping = False
+
+    def start_worker() -> multiprocessing.Process:
+        process = context.Process(target=run_worker, args=(app, sock, args.log_level))
+        process.start()
+        return process
+
+    def stop(signum, _frame):
+        nonlocal stopping
+        stopping = True
+        for process in workers:
+            if process.is_alive():
+                os.kill(process.pid, signum)
+
+    workers = [start_worker() for _ in range(args.workers)]
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info(
+        "Serving on %s:%d with %d workers (shared state in %s)",
+        args.host, args.port, args.workers, config.SHARED_STATE_DIR or "process memory"
+    )
+
+    while not stopping:
+        for index, process in enumerate(workers):
+            if not process.is_alive() and not stopping:
+                logger.warning("Worker %d exited with code %s, restarting", process.pid, process.exitcode)
+                if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+                    from prometheus_client import multiprocess
+
+                    # Its in-progress gauges no longer count; counters and histograms are kept
+                    multiprocess.mark_process_dead(process.pid)
+                workers[index] = start_worker()
+        time.sleep(0.5)
+
+    for process in workers:
+        process.join()
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
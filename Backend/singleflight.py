@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Awaitable, Callable, Dict, Tuple, TypeVar
+from metrics import COALESCED_CALLS
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Request coalescing: concurrent calls with the same key share one execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and get the same result or exception. Nothing is
+    remembered once the call finishes (the caches do that). If the running
+    caller is cancelled, a waiting caller takes over and runs it again.
+    Works across threads and event loops, but not across processes.
+    """
+
+    def __init__(self, name: str, enabled: bool = True):
+        self.name = name
+        self.enabled = enabled
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """The in-flight call for key and whether this caller must run it"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                COALESCED_CALLS.inc(flight=self.name)
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _settle(self, key: str, future: Future, result=None, error: BaseException | None = None):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # Cancelled or interrupted: waiting callers retry on their own
+            future.cancel()
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """Run func() once for all concurrent callers with this key"""
+        if not self.enabled:
+            return func()
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except CancelledError:
+                continue
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    async def ado(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Await func() once for all concurrent callers with this key"""
+        if not self.enabled:
+            return await func()
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # Shielded so a waiter's own cancellation leaves the shared call alone
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        try:
+            result = await func()
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, result)
+        return result
@@ -0,0 +1,188 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+from models import CandidateProfile, JobDescription
+from skill_matcher import (
+    normalize_skill,
+    normalize_skills,
+    REQUIRED_WEIGHT,
+    PREFERRED_WEIGHT,
+    EXPERIENCE_GAP_PENALTY
+)
+
+
+class SkillVocabulary:
+    """Normalized skill name -> column id, grown as profiles are encoded"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def add(self, skill: str) -> int:
+        return self.ids.setdefault(skill, len(self.ids))
+
+    def get(self, skill: str) -> int:
+        return self.ids.get(skill, -1)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class CandidateSkillMatrix:
+    """
+    Sparse (CSR) candidate x skill incidence matrix
+
+    Profiles are tokenized once at encode time; scoring against any number of
+    jobs afterwards is pure NumPy.
+    """
+
+    def __init__(self, vocabulary: Optional[SkillVocabulary] = None):
+        self.vocabulary = vocabulary or SkillVocabulary()
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.years = np.zeros(0, dtype=np.float32)  # NaN when not stated
+        self.rows = np.zeros(0, dtype=np.int32)
+
+    @classmethod
+    def encode(
+        cls,
+        candidates: Sequence[CandidateProfile],
+        vocabulary: Optional[SkillVocabulary] = None
+    ) -> "CandidateSkillMatrix":
+        matrix = cls(vocabulary)
+        matrix.extend(candidates)
+        return matrix
+
+    def extend(self, candidates: Sequence[CandidateProfile]):
+        """Append profiles as new rows"""
+        add = self.vocabulary.add
+        lengths = np.empty(len(candidates), dtype=np.int64)
+        indices: List[int] = []
+        years = np.empty(len(candidates), dtype=np.float32)
+
+        for row, candidate in enumerate(candidates):
+            skill_ids = [add(skill) for skill in normalize_skills(candidate.skills + candidate.certifications)]
+            indices.extend(skill_ids)
+            lengths[row] = len(skill_ids)
+            years[row] = np.nan if candidate.years_of_experience is None else candidate.years_of_experience
+
+        first_row = len(self)
+        self.indptr = np.concatenate([self.indptr, self.indptr[-1] + np.cumsum(lengths)])
+        self.indices = np.concatenate([self.indices, np.asarray(indices, dtype=np.int32)])
+        self.years = np.concatenate([self.years, years])
+        self.rows = np.concatenate([
+            self.rows,
+            np.repeat(np.arange(first_row, first_row + len(candidates), dtype=np.int32), lengths)
+        ])
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+
+@dataclass
+class RankScores:
+    """Per-candidate scores, aligned with the rows of the scored matrix"""
+    skill_match_percentage: np.ndarray
+    required_coverage: np.ndarray
+    experience_gap: np.ndarray
+    fit_score: np.ndarray
+
+    def take(self, rows: np.ndarray) -> "RankScores":
+        """Scores of the given rows only, in that order"""
+        return RankScores(
+            skill_match_percentage=self.skill_match_percentage[rows],
+            required_coverage=self.required_coverage[rows],
+            experience_gap=self.experience_gap[rows],
+            fit_score=self.fit_score[rows]
+        )
+
+    def top_k(self, k: Optional[int] = None) -> np.ndarray:
+        """Row ids of the best candidates, highest fit score first"""
+        k = len(self.fit_score) if k is None else min(k, len(self.fit_score))
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        if k < len(self.fit_score):
+            candidates = np.argpartition(-self.fit_score, k - 1)[:k]
+        else:
+            candidates = np.arange(len(self.fit_score))
+        return candidates[np.argsort(-self.fit_score[candidates], kind="stable")]
+
+
+class JobIndex:
+    """
+    A JobDescription compiled into weighted skill vectors over a vocabulary
+
+    Skills are weighted exactly as skill_matcher.prescore counts them: every
+    listed entry counts, so duplicates and skills listed as both required and
+    preferred score the same way in both.
+    """
+
+    def __init__(self, job_description: JobDescription, vocabulary: SkillVocabulary):
+        self.job_description = job_description
+        self.vocabulary = vocabulary
+
+        required = [normalize_skill(s) for s in job_description.required_skills]
+        preferred = [normalize_skill(s) for s in job_description.preferred_skills]
+        self.required_total = len(required)
+
+        # Skills no candidate has yet can never match; they only count in the totals
+        self.required_ids = np.array([i for i in map(vocabulary.get, required) if i >= 0], dtype=np.int64)
+        self.preferred_ids = np.array([i for i in map(vocabulary.get, preferred) if i >= 0], dtype=np.int64)
+
+        required_weight = REQUIRED_WEIGHT if preferred else 1.0
+        self.required_weight = required_weight / len(required) if required else 0.0
+        self.preferred_weight = PREFERRED_WEIGHT / len(preferred) if preferred else 0.0
+        # A job without required skills counts as full required coverage
+        self.base_score = 0.0 if required else required_weight
+
+    def _column_vectors(self, width: int):
+        """Dense weight and required-count vectors over the vocabulary"""
+        weights = np.zeros(width, dtype=np.float64)
+        required = np.zeros(width, dtype=np.float64)
+        np.add.at(weights, self.required_ids, self.required_weight)
+        np.add.at(weights, self.preferred_ids, self.preferred_weight)
+        np.add.at(required, self.required_ids, 1.0)
+        return weights, required
+
+    def score(self, matrix: CandidateSkillMatrix, rows: Optional[np.ndarray] = None) -> RankScores:
+        """Score every row of the matrix at once (or only the given rows)"""
+        count = len(matrix)
+        weights, required = self._column_vectors(len(matrix.vocabulary))
+
+        # Sparse matrix-vector products via bincount over the CSR row ids
+        skill_score = self.base_score + np.bincount(matrix.rows, weights=weights[matrix.indices], minlength=count)
+        required_hits = np.bincount(matrix.rows, weights=required[matrix.indices], minlength=count)
+        years = matrix.years
+        if rows is not None:
+            skill_score, required_hits, years = skill_score[rows], required_hits[rows], years[rows]
+            count = len(rows)
+
+        required_coverage = (
+            required_hits / self.required_total if self.required_total else np.ones(count)
+        )
+
+        experience_gap = np.zeros(count, dtype=np.float32)
+        if self.job_description.experience_required:
+            # Unknown experience (NaN) is not penalized, matching skill_matcher.prescore
+            gap = self.job_description.experience_required - years
+            experience_gap = np.where(np.isnan(gap), 0, np.maximum(gap, 0)).astype(np.float32)
+
+        skill_match = np.round(100 * skill_score, 1)
+        fit_score = np.maximum(skill_match - EXPERIENCE_GAP_PENALTY * experience_gap, 0)
+
+        return RankScores(
+            skill_match_percentage=skill_match,
+            required_coverage=required_coverage,
+            experience_gap=experience_gap,
+            fit_score=fit_score
+        )
+
+
+def rank_candidates(
+    job_description: JobDescription,
+    candidates: Sequence[CandidateProfile],
+    top_k: Optional[int] = None
+):
+    """Encode candidates, compile the job and return (row ids, scores) best first"""
+    matrix = CandidateSkillMatrix.encode(candidates)
+    scores = JobIndex(job_description, matrix.vocabulary).score(matrix)
+    return scores.top_k(top_k), scores
@@ -0,0 +1,189 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set
+from models import CandidateProfile, JobDescription, DecisionOutput
+import config
+
+
+# Canonical skill name -> aliases, compared after folding (see _fold)
+SKILL_SYNONYMS = {
+    "javascript": ["js", "ecmascript", "es6", "vanillajs"],
+    "typescript": ["ts"],
+    "python": ["py", "python3"],
+    "golang": ["go"],
+    "nodejs": ["node", "nodejs"],
+    "react": ["reactjs", "reactjsx"],
+    "vue": ["vuejs"],
+    "angular": ["angularjs"],
+    "nextjs": ["next"],
+    "postgresql": ["postgres", "psql", "pgsql"],
+    "mongodb": ["mongo"],
+    "kubernetes": ["k8s"],
+    "amazonwebservices": ["aws"],
+    "googlecloudplatform": ["gcp", "googlecloud"],
+    "microsoftazure": ["azure"],
+    "machinelearning": ["ml"],
+    "deeplearning": ["dl"],
+    "artificialintelligence": ["ai"],
+    "naturallanguageprocessing": ["nlp"],
+    "scikitlearn": ["sklearn"],
+    "cicd": ["continuousintegration", "continuousdelivery", "continuousdeployment"],
+    "dotnet": ["netcore", "aspnet"],
+    "csharp": ["c#"],
+    "cplusplus": ["c++", "cpp"],
+    "restapi": ["rest", "restful", "restapis", "restfulapi", "restfulapis"],
+    "graphql": ["gql"],
+    "sql": ["structuredquerylanguage"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "userinterface": ["ui"],
+    "userexperience": ["ux"],
+}
+
+# Aliases only recognized as the whole entry, before punctuation is folded away
+# (".NET" folds to "net", which is also networking)
+EXACT_ALIASES = {".net": "dotnet"}
+
+_ALIASES = {
+    alias: canonical
+    for canonical, aliases in SKILL_SYNONYMS.items()
+    for alias in aliases + [canonical]
+}
+
+# Score weights shared with the vectorized engine in skill_index.py
+REQUIRED_WEIGHT = 0.8
+PREFERRED_WEIGHT = 0.2
+EXPERIENCE_GAP_PENALTY = 10  # points per missing year
+
+# Separators used to split compound entries like "Python (Django, Flask)"
+_SPLIT_PATTERN = re.compile(r"[,;/|()\[\]]|\band\b|&", re.IGNORECASE)
+# Everything except letters, digits, '+' and '#' is folded away
+_FOLD_PATTERN = re.compile(r"[^a-z0-9+#]")
+
+
+def _fold(skill: str) -> str:
+    """Case and punctuation folding: 'Node.js' -> 'nodejs', 'C#' -> 'c#'"""
+    return _FOLD_PATTERN.sub("", skill.lower())
+
+
+@lru_cache(maxsize=65536)
+def normalize_skill(skill: str) -> str:
+    """Fold a skill name and map it to its canonical synonym"""
+    exact = EXACT_ALIASES.get(skill.strip().lower())
+    if exact:
+        return exact
+    folded = _fold(skill)
+    return _ALIASES.get(folded, folded)
+
+
+@lru_cache(maxsize=65536)
+def _expand_skill(skill: str) -> tuple:
+    """A skill entry plus the parts of compound entries, normalized"""
+    parts = {normalize_skill(skill)}
+    for part in _SPLIT_PATTERN.split(skill):
+        if part and part.strip():
+            parts.add(normalize_skill(part))
+    parts.discard("")
+    return tuple(parts)
+
+
+def normalize_skills(skills: Iterable[str]) -> Set[str]:
+    """Normalized skill set, including the parts of compound entries"""
+    normalized = set()
+    for skill in skills:
+        normalized.update(_expand_skill(skill))
+    return normalized
+
+
+@dataclass
+class PreScore:
+    """Deterministic skill and experience match of a candidate against a job"""
+    required_matched: List[str] = field(default_factory=list)
+    required_missing: List[str] = field(default_factory=list)
+    preferred_matched: List[str] = field(default_factory=list)
+    required_coverage: float = 1.0
+    preferred_coverage: Optional[float] = None
+    experience_gap: int = 0
+    candidate_years: Optional[int] = None
+
+    @property
+    def skill_match_percentage(self) -> float:
+        """Required skills weighted 80%, preferred 20% (when the job lists any)"""
+        if self.preferred_coverage is None:
+            return round(100 * self.required_coverage, 1)
+        return round(100 * (
+            REQUIRED_WEIGHT * self.required_coverage + PREFERRED_WEIGHT * self.preferred_coverage
+        ), 1)
+
+    @property
+    def fit_score(self) -> float:
+        """Skill match less a fixed penalty per missing year of experience"""
+        return max(0.0, self.skill_match_percentage - EXPERIENCE_GAP_PENALTY * self.experience_gap)
+
+    @property
+    def is_clear_reject(self) -> bool:
+        """Below the configured thresholds the LLM decision can be skipped"""
+        if self.required_matched or self.required_missing:
+            if 100 * self.required_coverage < config.PRESCORE_MIN_REQUIRED_MATCH:
+                return True
+        return self.experience_gap >= config.PRESCORE_MAX_EXPERIENCE_GAP
+
+
+def prescore(candidate_profile: CandidateProfile, job_description: JobDescription) -> PreScore:
+    """Match candidate skills and experience against the job without an LLM"""
+    candidate_skills = normalize_skills(candidate_profile.skills + candidate_profile.certifications)
+
+    required_matched = [s for s in job_description.required_skills if normalize_skill(s) in candidate_skills]
+    required_missing = [s for s in job_description.required_skills if normalize_skill(s) not in candidate_skills]
+    preferred_matched = [s for s in job_description.preferred_skills if normalize_skill(s) in candidate_skills]
+
+    required_total = len(job_description.required_skills)
+    preferred_total = len(job_description.preferred_skills)
+
+    # Unknown experience is left to the LLM rather than counted as zero
+    experience_gap = 0
+    if job_description.experience_required and candidate_profile.years_of_experience is not None:
+        experience_gap = max(0, job_description.experience_required - candidate_profile.years_of_experience)
+
+    return PreScore(
+        required_matched=required_matched,
+        required_missing=required_missing,
+        preferred_matched=preferred_matched,
+        required_coverage=len(required_matched) / required_total if required_total else 1.0,
+        preferred_coverage=len(preferred_matched) / preferred_total if preferred_total else None,
+        experience_gap=experience_gap,
+        candidate_years=candidate_profile.years_of_experience
+    )
+
+
+def build_reject_decision(score: PreScore, job_description: JobDescription) -> DecisionOutput:
+    """DecisionOutput for a candidate triaged out by pre-scoring"""
+    advantages = [f"Has {skill}" for skill in score.required_matched + score.preferred_matched]
+    disadvantages = [f"Missing required skill: {skill}" for skill in score.required_missing]
+
+    required_years = job_description.experience_required
+    if not required_years:
+        experience_match = "No experience requirement specified"
+    elif score.candidate_years is None:
+        experience_match = f"Experience not stated ({required_years} years required)"
+    elif score.experience_gap:
+        experience_match = f"Below requirements ({score.candidate_years} years vs {required_years} required)"
+        disadvantages.append(f"{score.experience_gap} years short of required experience")
+    else:
+        experience_match = f"Meets requirements ({score.candidate_years} years vs {required_years} required)"
+
+    return DecisionOutput(
+        confidence_score=score.fit_score,
+        recommendation="reject",
+        advantages=advantages,
+        disadvantages=disadvantages,
+        skill_match_percentage=score.skill_match_percentage,
+        experience_match=experience_match,
+        summary=(
+            f"Automatically screened out: matches {len(score.required_matched)} of "
+            f"{len(score.required_matched) + len(score.required_missing)} required skills"
+            + (f" and is {score.experience_gap} years short of the experience requirement" if score.experience_gap else "")
+            + "."
+        )
+    )
@@ -0,0 +1,40 @@
+import os
+import sqlite3
+from typing import Sequence
+
+
+def connect(path: str, timeout: float = 30) -> sqlite3.Connection:
+    """Autocommit SQLite connection in WAL mode, usable from several threads and processes"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=timeout)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SQLiteDatabase:
+    """
+    Process-local SQLite connection that is reopened after a fork
+
+    A connection must not be used by two processes, and serve.py forks its
+    workers after the app (and its caches) have been created.
+    """
+
+    def __init__(self, path: str, schema: Sequence[str] = (), timeout: float = 30):
+        self.path = path
+        self.schema = schema
+        self.timeout = timeout
+        self._conn = None
+        self._pid = None
+        self.conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            self._conn = connect(self.path, self.timeout)
+            self._pid = os.getpid()
+            for statement in self.schema:
+                self._conn.execute(statement)
+        return self._conn
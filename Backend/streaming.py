@@ -0,0 +1,121 @@
+import json
+from typing import AsyncIterator, Tuple
+from langchain_core.utils.json import parse_partial_json
+from models import ScreeningResponse
+
+
+# Graph nodes whose LLM output is parsed incrementally, and the partial objects they produce
+PARTIAL_FIELDS = {
+    "parse_resume": {"profile_partial": None},
+    "decision": {"decision_partial": None},
+    "screen": {"profile_partial": "candidate_profile", "decision_partial": "decision"}
+}
+# Nodes whose raw tokens are forwarded as "token" events
+TOKEN_NODES = ("decision", "screen")
+
+
+def _chunk_text(chunk) -> str:
+    """Text delta of a message chunk: content or tool-call argument fragments"""
+    content = chunk.content if isinstance(chunk.content, str) else "".join(
+        part.get("text", "") for part in chunk.content if isinstance(part, dict)
+    )
+    tool_args = "".join(call.get("args") or "" for call in getattr(chunk, "tool_call_chunks", []))
+    return content + tool_args
+
+
+class _PartialJSON:
+    """Accumulates each LLM call's output and reports newly parsed fields"""
+
+    def __init__(self):
+        # Per run_id: the text so far and the fields already sent per event, so a
+        # repair or a hedged duplicate interleaved with it never resets another run
+        self.runs = {}
+
+    def feed(self, run_id: str, text: str) -> dict:
+        run = self.runs.setdefault(run_id, {"buffer": "", "sent": {}})
+        run["buffer"] += text
+        try:
+            parsed = parse_partial_json(run["buffer"])
+        except Exception:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def completed(self, run_id: str, event: str, fields: dict) -> dict:
+        """Fields followed by another key (so finished), if more than last time for this run"""
+        sent = self.runs[run_id]["sent"]
+        done = dict(list(fields.items())[:-1])
+        if not done or len(done) <= len(sent.get(event, {})):
+            return {}
+        sent[event] = done
+        return done
+
+
+async def screening_events(graph_stream) -> AsyncIterator[Tuple[str, dict]]:
+    """
+    Translate a ResumeScreeningGraph.astream into (event, data) pairs
+
+    Events: stage (extraction/caching progress, resumption and node completion),
+    profile_partial / decision_partial (the fields completed so far in the
+    streaming LLM output), token (decision text as it arrives), profile,
+    decision, then a final result or error.
+    """
+    partials = {}
+    state = {}
+    async for mode, payload in graph_stream:
+        if mode == "custom":
+            yield "stage", payload
+
+        elif mode == "resumed":
+            state.update(payload)
+            yield "stage", {"stage": "resumed"}
+            yield "profile", payload["candidate_profile"].model_dump()
+
+        elif mode == "error":
+            state.update(payload)
+
+        elif mode == "messages":
+            chunk, metadata = payload
+            node = metadata.get("langgraph_node")
+            text = _chunk_text(chunk)
+            if not text or node not in PARTIAL_FIELDS:
+                continue
+            if node in TOKEN_NODES:
+                yield "token", {"node": node, "text": text}
+            tracker = partials.setdefault(node, _PartialJSON())
+            parsed = tracker.feed(chunk.id, text)
+            for event, key in PARTIAL_FIELDS[node].items():
+                fields = parsed.get(key) if key else parsed
+                if isinstance(fields, dict):
+                    done = tracker.completed(chunk.id, event, fields)
+                    if done:
+                        yield event, done
+
+        elif mode == "updates":
+            for node, update in payload.items():
+                if not update:
+                    continue
+                state.update(update)
+                yield "stage", {"stage": "node_complete", "node": node}
+                if update.get("error"):
+                    continue
+                if node in ("parse_resume", "screen") and update.get("candidate_profile"):
+                    yield "profile", update["candidate_profile"].model_dump()
+                if update.get("decision") is not None:
+                    yield "decision", update["decision"].model_dump()
+
+    if state.get("error"):
+        yield "error", {"detail": state["error"]}
+    elif state.get("candidate_profile") and state.get("decision"):
+        result = ScreeningResponse(
+            candidate_profile=state["candidate_profile"],
+            decision=state["decision"],
+            mode=state.get("effective_mode"),
+            status="success"
+        )
+        yield "result", result.model_dump()
+    else:
+        yield "error", {"detail": "Screening ended without a decision"}
+
+
+def encode_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -0,0 +1,159 @@
+import json
+from typing import Type
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+from llm_clients import with_retries
+from rate_limiter import get_governor, estimate_tokens
+from metrics import track_llm_call, record_llm_usage
+from resilience import get_breaker
+import config
+
+
+# Re-prompt used when output fails validation: only the error and the bad output are sent
+REPAIR_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """Your previous answer did not match the required schema.
+    Return the corrected JSON object only, changing nothing except what the error requires.
+
+    {format_instructions}"""),
+    ("user", "Validation error:\n{error}\n\nPrevious output:\n{output}")
+])
+
+
+class StructuredChain:
+    """
+    prompt | llm returning a validated Pydantic model
+
+    Uses the provider's native structured output (JSON schema or tool calling,
+    see config.STRUCTURED_OUTPUT_METHODS) when the chat model supports it, so
+    no format instructions are sent. Otherwise the prompt carries the
+    PydanticOutputParser instructions. Either way, output that fails
+    validation gets a short repair call instead of a full retry.
+    """
+
+    def __init__(
+        self,
+        prompt: ChatPromptTemplate,
+        llm,
+        schema: Type[BaseModel],
+        provider: str = None,
+        agent: str = None
+    ):
+        self.prompt = prompt
+        self.schema = schema
+        self.provider = provider or config.MODEL_PROVIDER
+        self.agent = agent or schema.__name__
+        self.parser = PydanticOutputParser(pydantic_object=schema)
+        self.method = config.STRUCTURED_OUTPUT_METHODS.get(self.provider) if config.STRUCTURED_OUTPUT_ENABLED else None
+        self.llm = None
+        if self.method:
+            try:
+                self.llm = llm.with_structured_output(schema, method=self.method, include_raw=True)
+            except NotImplementedError:
+                self.method = None
+        if self.llm is None:
+            self.llm = llm
+        self.llm = with_retries(self.llm, self.provider)
+
+    @property
+    def format_instructions(self) -> str:
+        return "" if self.method else self.parser.get_format_instructions()
+
+    def _unpack(self, response):
+        """(raw message, parsed model or None, error or None) from either output style"""
+        if self.method:
+            parsed, error = response["parsed"], response["parsing_error"]
+            if parsed is None and error is None:
+                error = ValueError("No structured output returned")
+            return response["raw"], parsed, error
+        try:
+            return response, self.parser.parse(response.content), None
+        except Exception as e:
+            return response, None, e
+
+    @staticmethod
+    def _raw_text(raw) -> str:
+        tool_calls = getattr(raw, "tool_calls", None)
+        if tool_calls:
+            return json.dumps(tool_calls[0]["args"])
+        return raw.content if isinstance(raw.content, str) else json.dumps(raw.content)
+
+    def _repair_inputs(self, raw, error) -> dict:
+        return {
+            "error": str(error),
+            "output": self._raw_text(raw),
+            "format_instructions": self.format_instructions
+        }
+
+    def _record(self, lease, response):
+        raw = response["raw"] if self.method else response
+        lease.record(raw)
+        record_llm_usage(self.agent, self.provider, raw)
+
+    def _call(self, prompt_value, tokens: int):
+        breaker = get_breaker(self.provider)
+        trial = breaker.check()
+        settled = False
+        try:
+            with get_governor(self.provider).slot_sync(tokens) as lease:
+                with track_llm_call(self.agent, self.provider):
+                    try:
+                        response = self.llm.invoke(prompt_value)
+                    except Exception:
+                        settled = True
+                        breaker.record_failure()
+                        raise
+                settled = True
+                breaker.record_success()
+                self._record(lease, response)
+        finally:
+            if not settled:
+                breaker.record_cancelled(trial)
+        return self._unpack(response)
+
+    async def _acall(self, prompt_value, tokens: int):
+        # Fail fast, before queueing for a rate limiter slot, while the provider's circuit is open
+        breaker = get_breaker(self.provider)
+        trial = breaker.check()
+        settled = False
+        try:
+            async with get_governor(self.provider).slot(tokens) as lease:
+                with track_llm_call(self.agent, self.provider):
+                    try:
+                        response = await self.llm.ainvoke(prompt_value)
+                    except Exception:
+                        settled = True
+                        breaker.record_failure()
+                        raise
+                settled = True
+                breaker.record_success()
+                self._record(lease, response)
+        finally:
+            # Cancelled while queued for a slot or mid-call (a hedge loser, a client disconnect)
+            if not settled:
+                breaker.record_cancelled(trial)
+        return self._unpack(response)
+
+    def invoke(self, inputs: dict) -> BaseModel:
+        inputs = {**inputs, "format_instructions": self.format_instructions}
+        raw, parsed, error = self._call(self.prompt.invoke(inputs), estimate_tokens(inputs))
+        for _ in range(config.STRUCTURED_OUTPUT_REPAIR_ATTEMPTS):
+            if parsed is not None:
+                break
+            repair_inputs = self._repair_inputs(raw, error)
+            raw, parsed, error = self._call(REPAIR_PROMPT.invoke(repair_inputs), estimate_tokens(repair_inputs))
+        if parsed is None:
+            raise ValueError(f"Invalid {self.schema.__name__} output: {error}")
+        return parsed
+
+    async def ainvoke(self, inputs: dict) -> BaseModel:
+        inputs = {**inputs, "format_instructions": self.format_instructions}
+        raw, parsed, error = await self._acall(self.prompt.invoke(inputs), estimate_tokens(inputs))
+        for _ in range(config.STRUCTURED_OUTPUT_REPAIR_ATTEMPTS):
+            if parsed is not None:
+                break
+            repair_inputs = self._repair_inputs(raw, error)
+            raw, parsed, error = await self._acall(REPAIR_PROMPT.invoke(repair_inputs), estimate_tokens(repair_inputs))
+        if parsed is None:
+            raise ValueError(f"Invalid {self.schema.__name__} output: {error}")
+        return parsed
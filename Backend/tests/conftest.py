@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Offline defaults, set before config is first imported
+os.environ.setdefault("MODEL_PROVIDER", "fake")
+os.environ.setdefault("FAKE_LLM_LATENCY_SECONDS", "0")
+os.environ.setdefault("SHARED_STATE_DIR", "")
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+import config
+from benchmarks.synthetic import make_resume
+from models import JobDescription
+
+JOB = JobDescription(
+    title="Backend Engineer", description="Python APIs",
+    required_skills=["Python", "FastAPI"], preferred_skills=["Docker"], experience_required=3
+)
+
+
+@pytest.fixture
+def graph(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CANDIDATE_INDEX_DIR", str(tmp_path / "index"))
+    monkeypatch.setattr(config, "PROFILE_CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "PROFILE_CACHE_DB_PATH", "")
+    monkeypatch.setattr(config, "CHECKPOINT_BACKEND", "none")
+    from agent_graph import ResumeScreeningGraph
+    return ResumeScreeningGraph()
+
+
+def _resume(tmp_path):
+    filename, data, _ = make_resume(1, "small", "docx")
+    path = tmp_path / filename
+    path.write_bytes(data)
+    return str(path), filename
+
+
+def test_profile_cache_hits_do_not_reindex(graph, tmp_path, monkeypatch):
+    path, filename = _resume(tmp_path)
+    adds = []
+    add = graph.candidate_index.add
+    monkeypatch.setattr(graph.candidate_index, "add", lambda *args: adds.append(args) or add(*args))
+
+    async def screen_twice():
+        first = await graph.arun(path, filename, JOB)
+        second = await graph.arun(path, filename, JOB)
+        return first, second
+
+    first, second = asyncio.run(screen_twice())
+    assert first["decision"] is not None and second["decision"] is not None
+    assert len(adds) == 1
+    assert len(graph.candidate_index) == 1
+
+
+def test_single_call_reports_the_mode_that_ran(graph, tmp_path):
+    path, filename = _resume(tmp_path)
+
+    async def screen_twice():
+        first = await graph.arun(path, filename, JOB, mode="single_call")
+        second = await graph.arun(path, filename, JOB, mode="single_call")
+        return first, second
+
+    first, second = asyncio.run(screen_twice())
+    assert first["decision"] is not None and second["decision"] is not None
+    assert first["effective_mode"] == "single_call"
+    # The profile cached by the first run sends the second down the two-stage path
+    assert second["effective_mode"] == "two_stage"
+    assert graph.run(path, filename, JOB, mode="two_stage")["effective_mode"] == "two_stage"
@@ -0,0 +1,89 @@
+import config
+import time
+from cache import DecisionCache, MemoryCache, ProfileCache
+from models import CandidateProfile, DecisionOutput, JobDescription
+
+JOB = JobDescription(title="Backend", description="", required_skills=["Python"], experience_required=None)
+PROFILE = CandidateProfile(
+    name="A", email=None, phone=None, summary="", skills=["Python"],
+    experience=[], education=[], years_of_experience=3
+)
+DECISION = DecisionOutput(
+    confidence_score=80, recommendation="interview", advantages=[], disadvantages=[],
+    skill_match_percentage=100, experience_match="", summary=""
+)
+
+
+def test_invalidation_reaches_other_processes_sharing_the_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DECISION_CACHE_DB_PATH", str(tmp_path / "decisions.db"))
+    worker_a, worker_b = DecisionCache("1"), DecisionCache("1")
+
+    worker_a.set(PROFILE, JOB, DECISION)
+    assert worker_b.get(PROFILE, JOB) == DECISION
+    assert worker_a.get(PROFILE, JOB) == DECISION
+
+    assert worker_b.invalidate_job(JOB) == 1
+    assert worker_a.get(PROFILE, JOB) is None
+
+
+def test_memory_only_cache_without_a_database(monkeypatch):
+    monkeypatch.setattr(config, "DECISION_CACHE_DB_PATH", "")
+    cache = DecisionCache("1")
+    cache.set(PROFILE, JOB, DECISION)
+    assert cache.get(PROFILE, JOB) == DECISION
+    assert cache.cache.stats()["memory_entries"] == 1
+    assert cache.invalidate_job(JOB) == 1
+    assert cache.get(PROFILE, JOB) is None
+
+
+def test_profile_cache_hits_by_resume_hash_and_prompt_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "PROFILE_CACHE_DB_PATH", str(tmp_path / "profiles.db"))
+    cache = ProfileCache("1")
+    cache.set("sha-a", PROFILE)
+
+    assert cache.get("sha-a") == PROFILE
+    assert cache.get("sha-b") is None
+    assert ProfileCache("2").get("sha-a") is None
+    stats = cache.cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_profile_cache_disk_tier_survives_a_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "PROFILE_CACHE_DB_PATH", str(tmp_path / "profiles.db"))
+    ProfileCache("1").set("sha-a", PROFILE)
+    restarted = ProfileCache("1")
+    assert restarted.cache.stats()["memory_entries"] == 0
+    assert restarted.get("sha-a") == PROFILE
+    assert restarted.cache.stats()["memory_entries"] == 1
+
+
+def test_memory_tier_evicts_least_recently_used_and_expired_entries():
+    cache = MemoryCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
+
+    expiring = MemoryCache(max_entries=2, ttl_seconds=0.01)
+    expiring.set("a", "1")
+    time.sleep(0.02)
+    assert expiring.get("a") is None
+
+
+def test_decision_hits_for_equal_content_only(monkeypatch):
+    monkeypatch.setattr(config, "DECISION_CACHE_DB_PATH", "")
+    cache = DecisionCache("1")
+    cache.set(PROFILE, JOB, DECISION)
+
+    assert cache.get(PROFILE.model_copy(deep=True), JobDescription(**JOB.model_dump())) == DECISION
+    assert cache.get(PROFILE, JOB.model_copy(update={"experience_required": 5})) is None
+    assert cache.get(PROFILE.model_copy(update={"skills": ["Go"]}), JOB) is None
+
+
+def test_decision_key_includes_the_decision_model(monkeypatch):
+    monkeypatch.setattr(config, "DECISION_CACHE_DB_PATH", "")
+    cache = DecisionCache("1")
+    cache.set(PROFILE, JOB, DECISION)
+    monkeypatch.setitem(config.MODEL_NAMES, config.MODEL_PROVIDER, "another-model")
+    assert cache.get(PROFILE, JOB) is None
@@ -0,0 +1,81 @@
+import multiprocessing
+import pytest
+from candidate_index import CandidateIndex, HashingEmbedder
+from models import CandidateProfile, JobDescription
+
+JOB = JobDescription(
+    title="Backend engineer", description="Python APIs", required_skills=["Python", "FastAPI"],
+    experience_required=None
+)
+
+
+def _profile(i: int, skills=("Python", "FastAPI")) -> CandidateProfile:
+    return CandidateProfile(
+        name=f"Candidate {i}", email=None, phone=None, summary=f"Engineer number {i}",
+        skills=list(skills), experience=[], education=[], years_of_experience=3
+    )
+
+
+def _open(directory) -> CandidateIndex:
+    return CandidateIndex(str(directory), embedder=HashingEmbedder(64))
+
+
+def _add_range(directory, start: int, count: int):
+    index = _open(directory)
+    for i in range(start, start + count):
+        index.add(f"c{i}", _profile(i))
+
+
+def test_search_sees_changes_made_through_another_handle(tmp_path):
+    reader, writer = _open(tmp_path), _open(tmp_path)
+    writer.add("python", _profile(1))
+    writer.add("java", _profile(2, skills=("Java", "Spring")))
+    assert [candidate_id for candidate_id, _, _ in reader.search(JOB, top_k=1)] == ["python"]
+
+    writer.delete("python")
+    assert "python" not in reader
+    assert [candidate_id for candidate_id, _, _ in reader.search(JOB)] == ["java"]
+    stored, _ = reader.rank(JOB)
+    assert [candidate_id for candidate_id, _ in stored] == ["java"]
+
+    reader.add("go", _profile(3, skills=("Go",)))
+    stored, _ = writer.rank(JOB)
+    assert sorted(candidate_id for candidate_id, _ in stored) == ["go", "java"]
+
+
+def test_search_remaps_vectors_grown_by_another_handle(tmp_path):
+    reader, writer = _open(tmp_path), _open(tmp_path)
+    assert reader.search(JOB) == []
+    for i in range(1100):
+        writer.add(f"c{i}", _profile(i, skills=("Go",)))
+    writer.add("best", _profile(9999))
+    assert reader.search(JOB, top_k=1)[0][0] == "best"
+
+
+def test_deleted_rows_are_reused(tmp_path):
+    index = _open(tmp_path)
+    for i in range(3):
+        index.add(f"c{i}", _profile(i))
+    index.delete("c1")
+    index.add("c3", _profile(3))
+    rows = dict(index._conn.execute("SELECT candidate_id, row FROM candidates").fetchall())
+    assert rows == {"c0": 0, "c2": 2, "c3": 1}
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_processes_writing_one_directory_get_distinct_rows(tmp_path):
+    _open(tmp_path)
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_add_range, args=(tmp_path, start, 40)) for start in (0, 40, 80)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+        assert process.exitcode == 0
+
+    index = _open(tmp_path)
+    rows = [row for (row,) in index._conn.execute("SELECT row FROM candidates")]
+    assert len(index) == 120
+    assert sorted(rows) == list(range(120))
+    results = index.search(JOB, top_k=200)
+    assert len(results) == 120 and all(score > 0 for _, score, _ in results)
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+import cascade
+from cascade import ModelCascade
+from decision_agent import DecisionAgent
+from fake_llm import fake_payload
+from models import DecisionOutput
+from resilience import CircuitOpenError
+
+TIERS = [("ollama", "small"), ("openai", "medium"), ("openai", "large")]
+
+
+def _decision(score: float) -> DecisionOutput:
+    return DecisionOutput(**{**fake_payload("DecisionOutput", "x"), "confidence_score": score})
+
+
+class ScriptedChain:
+    def __init__(self, tier, outcomes, calls):
+        self.tier, self.outcomes, self.calls = tier, outcomes, calls
+
+    def invoke(self, inputs):
+        self.calls.append(self.tier)
+        outcome = self.outcomes[self.tier]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def ainvoke(self, inputs):
+        return self.invoke(inputs)
+
+
+@pytest.fixture
+def make_cascade(monkeypatch):
+    monkeypatch.setattr(cascade, "get_llm", lambda temperature, provider, model: model)
+
+    def make(outcomes):
+        calls, built = [], []
+
+        def build_chain(model, provider):
+            built.append(model)
+            return ScriptedChain(model, outcomes, calls)
+
+        return ModelCascade("decision", TIERS, 0.3, build_chain, DecisionAgent._is_uncertain), calls, built
+
+    return make
+
+
+def test_confident_first_tier_answers_alone(make_cascade):
+    models, calls, built = make_cascade({"small": _decision(95)})
+    assert models.invoke({}).confidence_score == 95
+    assert calls == built == ["small"]
+
+
+def test_uncertain_results_escalate_and_the_last_tier_is_final(make_cascade):
+    models, calls, _ = make_cascade({"small": _decision(60), "medium": _decision(50), "large": _decision(55)})
+    assert models.invoke({}).confidence_score == 55
+    assert calls == ["small", "medium", "large"]
+
+
+def test_failures_escalate_and_the_last_error_is_raised(make_cascade):
+    models, calls, _ = make_cascade({
+        "small": ValueError("invalid output"),
+        "medium": CircuitOpenError("openai"),
+        "large": TimeoutError("large timed out")
+    })
+    with pytest.raises(TimeoutError, match="large timed out"):
+        asyncio.run(models.ainvoke({}))
+    assert calls == ["small", "medium", "large"]
+
+
+def test_tier_chains_are_built_once(make_cascade):
+    models, calls, built = make_cascade({"small": _decision(60), "medium": _decision(20), "large": _decision(90)})
+    for _ in range(3):
+        assert models.invoke({}).confidence_score == 20
+    assert built == ["small", "medium"]
+    assert len(calls) == 6
@@ -0,0 +1,107 @@
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+import pytest
+from langgraph.graph import END, START, StateGraph
+import config
+from benchmarks.synthetic import make_resume
+from checkpoints import TTLSqliteSaver
+from models import JobDescription
+
+JOB = JobDescription(
+    title="Backend Engineer", description="Python APIs",
+    required_skills=["Python", "FastAPI"], preferred_skills=["Docker"], experience_required=3
+)
+
+
+class StepState(TypedDict):
+    steps: Annotated[list, operator.add]
+
+
+def _step_graph(saver):
+    workflow = StateGraph(StepState)
+    workflow.add_node("first", lambda state: {"steps": ["first"]})
+    workflow.add_node("second", lambda state: {"steps": ["second"]})
+    workflow.add_edge(START, "first")
+    workflow.add_edge("first", "second")
+    workflow.add_edge("second", END)
+    return workflow.compile(checkpointer=saver, interrupt_before=["second"])
+
+
+def test_graph_resumes_after_an_interrupt(tmp_path):
+    saver = TTLSqliteSaver(str(tmp_path / "checkpoints.db"), ttl_seconds=3600)
+    graph, thread = _step_graph(saver), {"configurable": {"thread_id": "t1"}}
+
+    assert graph.invoke({"steps": []}, thread) == {"steps": ["first"]}
+    assert graph.get_state(thread).next == ("second",)
+
+    # A second saver on the same file stands in for another worker process
+    resumed = _step_graph(TTLSqliteSaver(str(tmp_path / "checkpoints.db"), ttl_seconds=3600))
+    assert resumed.invoke(None, thread) == {"steps": ["first", "second"]}
+    assert resumed.get_state(thread).next == ()
+
+
+def test_async_graph_resumes_after_an_interrupt(tmp_path):
+    graph = _step_graph(TTLSqliteSaver(str(tmp_path / "checkpoints.db"), ttl_seconds=3600))
+    thread = {"configurable": {"thread_id": "t1"}}
+
+    async def run():
+        assert await graph.ainvoke({"steps": []}, thread) == {"steps": ["first"]}
+        assert (await graph.aget_state(thread)).next == ("second",)
+        assert await graph.ainvoke(None, thread) == {"steps": ["first", "second"]}
+        assert len([checkpoint async for checkpoint in graph.checkpointer.alist(thread)]) >= 3
+        await graph.checkpointer.adelete_thread("t1")
+        assert (await graph.aget_state(thread)).values == {}
+
+    asyncio.run(run())
+
+
+def test_stale_threads_are_evicted(tmp_path):
+    saver = TTLSqliteSaver(str(tmp_path / "checkpoints.db"), ttl_seconds=0)
+    graph = _step_graph(saver)
+    graph.invoke({"steps": []}, {"configurable": {"thread_id": "old"}})
+    saver._puts = 100  # the next put runs an eviction pass
+    graph.invoke({"steps": []}, {"configurable": {"thread_id": "new"}})
+    threads = {row[0] for row in saver.conn.execute("SELECT DISTINCT thread_id FROM checkpoints")}
+    assert threads == {"new"}
+
+
+@pytest.fixture
+def screening_graph(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CHECKPOINT_BACKEND", "sqlite")
+    monkeypatch.setattr(config, "CHECKPOINT_DB_PATH", str(tmp_path / "checkpoints.db"))
+    monkeypatch.setattr(config, "NODE_RETRY_MAX_ATTEMPTS", 1)
+    monkeypatch.setattr(config, "PROFILE_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "CANDIDATE_INDEX_DIR", "")
+    from agent_graph import ResumeScreeningGraph
+    return ResumeScreeningGraph()
+
+
+def test_failed_decision_resumes_without_parsing_again(screening_graph, tmp_path, monkeypatch):
+    filename, data, _ = make_resume(1, "small", "docx")
+    path = tmp_path / filename
+    path.write_bytes(data)
+    parser, agent = screening_graph.resume_parser, screening_graph.decision_agent
+    parses = []
+    aparse_text = parser.aparse_text
+    monkeypatch.setattr(parser, "aparse_text", lambda text: parses.append(text) or aparse_text(text))
+    aevaluate = agent.aevaluate_candidate
+
+    async def failing_evaluate(*args):
+        raise TimeoutError("decision model timed out")
+
+    async def run():
+        monkeypatch.setattr(agent, "aevaluate_candidate", failing_evaluate)
+        failed = await screening_graph.arun(str(path), filename, JOB, mode="two_stage")
+        assert failed["decision"] is None and "timed out" in failed["error"]
+        assert failed["candidate_profile"] is not None
+
+        monkeypatch.setattr(agent, "aevaluate_candidate", aevaluate)
+        retried = await screening_graph.arun(
+            str(path), filename, JOB, mode="two_stage", screening_id=failed["screening_id"]
+        )
+        assert retried["error"] is None and retried["decision"] is not None
+        assert retried["candidate_profile"] == failed["candidate_profile"]
+
+    asyncio.run(run())
+    assert len(parses) == 1
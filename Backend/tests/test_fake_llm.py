@@ -0,0 +1,23 @@
+import asyncio
+from langchain_core.messages import HumanMessage
+from fake_llm import FakeChatModel
+from models import CandidateProfile, DecisionOutput
+
+
+def test_same_prompt_gives_the_same_decision():
+    model = FakeChatModel(latency_seconds=0)
+    prompt = [HumanMessage(content="Job: Backend\nCandidate: Python, Docker\nGive a recommendation")]
+    first, second = model.invoke(prompt), model.invoke(prompt)
+    assert first.content == second.content
+    assert DecisionOutput.model_validate_json(first.content)
+    assert first.usage_metadata["total_tokens"] > 0
+
+
+def test_structured_output_matches_the_schema():
+    structured = FakeChatModel(latency_seconds=0).with_structured_output(CandidateProfile, include_raw=True)
+    result = asyncio.run(structured.ainvoke([HumanMessage(content="jane@example.com\nPython, FastAPI\n2015 2021")]))
+    profile = result["parsed"]
+    assert result["parsing_error"] is None
+    assert profile.email == "jane@example.com"
+    assert {"Python", "FastAPI"} <= set(profile.skills)
+    assert profile.years_of_experience == 6
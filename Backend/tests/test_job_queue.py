@@ -0,0 +1,82 @@
+import time
+import pytest
+import config
+from job_queue import JobQueue, QUEUED, RUNNING, SUCCEEDED, FAILED
+from models import CandidateProfile, DecisionOutput, JobDescription
+
+JOB = JobDescription(
+    title="Backend", description="", required_skills=["Python"], experience_required=None
+)
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "JOB_LEASE_SECONDS", 0.2)
+    monkeypatch.setattr(config, "JOB_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(config, "JOB_RETRY_BACKOFF_SECONDS", 0)
+    return JobQueue(str(tmp_path / "queue"))
+
+
+def _enqueue(queue, tmp_path, name="resume.pdf"):
+    path = tmp_path / name
+    path.write_bytes(b"%PDF")
+    return queue.enqueue(str(path), name, "sha", JOB)
+
+
+def test_claimed_job_is_not_claimed_again_while_leased(queue, tmp_path):
+    job_id = _enqueue(queue, tmp_path)
+    job = queue.claim()
+    assert job["id"] == job_id and job["attempts"] == 1
+    assert queue.get(job_id)["status"] == RUNNING
+    assert queue.claim() is None
+
+
+def test_expired_lease_is_claimed_again(queue, tmp_path):
+    job_id = _enqueue(queue, tmp_path)
+    queue.claim()
+    time.sleep(0.3)
+    job = queue.claim()
+    assert job["id"] == job_id and job["attempts"] == 2
+
+
+def test_expired_lease_on_last_attempt_fails_the_job(queue, tmp_path):
+    job_id = _enqueue(queue, tmp_path)
+    queue.claim()
+    time.sleep(0.3)
+    queue.claim()
+    time.sleep(0.3)
+    assert queue.claim() is None
+    job = queue.get(job_id)
+    assert job["status"] == FAILED
+    assert job["error"] == "Worker lease expired"
+
+
+def test_failed_attempt_is_requeued_then_failed(queue, tmp_path):
+    job_id = _enqueue(queue, tmp_path)
+    job = queue.claim()
+    queue.fail(job_id, "boom", job["attempts"], job["max_attempts"])
+    assert queue.get(job_id)["status"] == QUEUED
+
+    job = queue.claim()
+    queue.fail(job_id, "boom again", job["attempts"], job["max_attempts"])
+    assert queue.get(job_id)["status"] == FAILED
+    assert queue.claim() is None
+
+
+def test_complete_stores_the_result(queue, tmp_path):
+    job_id = _enqueue(queue, tmp_path)
+    job = queue.claim()
+    profile = CandidateProfile(
+        name="A", email=None, phone=None, summary="", skills=["Python"],
+        experience=[], education=[], years_of_experience=3
+    )
+    decision = DecisionOutput(
+        confidence_score=80, recommendation="interview", advantages=[], disadvantages=[],
+        skill_match_percentage=100, experience_match="", summary=""
+    )
+    queue.complete(job_id, profile, decision)
+
+    stored = queue.get(job_id)
+    assert stored["status"] == SUCCEEDED
+    assert stored["decision"].recommendation == "interview"
+    assert queue.stats() == {SUCCEEDED: 1}
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+from metrics import COALESCED_CALLS, REQUESTS_IN_PROGRESS, render_metrics
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_metrics_render_in_the_text_format():
+    COALESCED_CALLS.inc(flight="render-test")
+    with REQUESTS_IN_PROGRESS.track_in_progress(method="PATCH"):
+        text = render_metrics().decode()
+    assert 'coalesced_calls_total{flight="render-test"} 1.0' in text
+    assert 'http_requests_in_progress{method="PATCH"} 1.0' in text
+
+
+def _run(code: str, metrics_dir) -> str:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(metrics_dir)}
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND, env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_scrapes_aggregate_every_worker_process(tmp_path):
+    for _ in range(2):
+        _run("from metrics import COALESCED_CALLS; COALESCED_CALLS.inc(flight='screenings')", tmp_path)
+    text = _run("from metrics import render_metrics; print(render_metrics().decode())", tmp_path)
+    assert 'coalesced_calls_total{flight="screenings"} 2.0' in text
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import pytest
+from rate_limiter import BATCH, ProviderGovernor, SharedLimits, TokenBucket, llm_priority
+
+
+def test_interactive_calls_overtake_queued_batch_calls():
+    governor = ProviderGovernor("fake", 0, 0, max_in_flight=1)
+    order = []
+
+    async def call(name, priority=None):
+        if priority is None:
+            lease = await governor.acquire(10)
+        else:
+            with llm_priority(priority):
+                lease = await governor.acquire(10)
+        order.append(name)
+        await asyncio.sleep(0.01)
+        governor.release(lease)
+
+    async def run():
+        first = await governor.acquire(10)
+        tasks = [asyncio.create_task(call(f"batch{i}", BATCH)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        tasks.append(asyncio.create_task(call("interactive")))
+        await asyncio.sleep(0.01)
+        assert governor.stats()["queue_depth_batch"] == 2
+        governor.release(first)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert order == ["interactive", "batch0", "batch1"]
+    assert governor.stats()["in_flight"] == 0
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(per_minute=60)
+    assert bucket.wait_time(60, now=bucket.updated) == 0
+    bucket.consume(60)
+    assert bucket.wait_time(1, now=bucket.updated) == pytest.approx(1.0)
+    assert bucket.wait_time(1, now=bucket.updated + 1) == 0
+
+
+@pytest.fixture
+def shared(tmp_path):
+    return SharedLimits(str(tmp_path / "limits.db"), lease_seconds=60)
+
+
+def _leases(shared):
+    return shared._db.conn.execute("SELECT COUNT(*) FROM leases").fetchone()[0]
+
+
+def test_in_flight_limit_spans_governors_sharing_the_database(shared):
+    first = ProviderGovernor("fake", 0, 0, max_in_flight=1, shared=shared)
+    second = ProviderGovernor("fake", 0, 0, max_in_flight=1, shared=shared)
+
+    async def run():
+        lease = await first.acquire(10)
+        waiting = asyncio.create_task(second.acquire(10))
+        await asyncio.sleep(0.2)
+        assert not waiting.done()
+        await first.arelease(lease)
+        await first.arelease(await asyncio.wait_for(waiting, 1))
+
+    asyncio.run(run())
+    assert _leases(shared) == 0
+
+
+def test_shared_transactions_run_off_the_event_loop(shared):
+    governor = ProviderGovernor("fake", 0, 0, max_in_flight=4, shared=shared)
+    loop_thread = threading.get_ident()
+    threads = []
+    try_acquire, release = shared.try_acquire, shared.release
+    shared.try_acquire = lambda *args: threads.append(threading.get_ident()) or try_acquire(*args)
+    shared.release = lambda *args: threads.append(threading.get_ident()) or release(*args)
+
+    async def run():
+        async with governor.slot(10):
+            pass
+
+    asyncio.run(run())
+    assert len(threads) == 2 and loop_thread not in threads
+
+
+def test_cancelled_acquire_gives_back_its_shared_lease(shared):
+    governor = ProviderGovernor("fake", 0, 0, max_in_flight=4, shared=shared)
+    started, finish = threading.Event(), threading.Event()
+    try_acquire = shared.try_acquire
+
+    def slow_try_acquire(*args):
+        started.set()
+        finish.wait(1)
+        return try_acquire(*args)
+
+    shared.try_acquire = slow_try_acquire
+
+    async def run():
+        task = asyncio.create_task(governor.acquire(10))
+        await asyncio.to_thread(started.wait, 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        finish.set()
+        for _ in range(50):
+            await asyncio.sleep(0.02)
+            if governor.in_flight == 0 and _leases(shared) == 0:
+                break
+
+    asyncio.run(run())
+    assert governor.in_flight == 0
+    assert _leases(shared) == 0
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import pytest
+from resilience import CircuitBreaker, CircuitOpenError
+
+
+def _open_breaker(reset_seconds: float = 0.05) -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_seconds=reset_seconds)
+    for _ in range(3):
+        breaker.check()
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_seconds=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_half_open_trial_success_closes_the_breaker():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    breaker.check()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.check()  # one trial at a time
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.check()
+
+
+def test_half_open_trial_failure_opens_it_again():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    breaker.check()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    time.sleep(0.06)
+    breaker.check()
+    assert breaker.state == "half_open"
+
+
+def test_zero_threshold_disables_the_breaker():
+    breaker = CircuitBreaker("test", failure_threshold=0, reset_seconds=60)
+    for _ in range(10):
+        breaker.record_failure()
+        breaker.check()
+    assert breaker.state == "closed"
+
+
+def test_cancelled_trial_lets_the_next_call_trial_again():
+    breaker = _open_breaker()
+    time.sleep(0.06)
+    assert breaker.check() is True
+    breaker.record_cancelled(trial=True)
+    assert breaker.state == "open"
+
+    assert breaker.check() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_cancelling_a_half_open_call_does_not_wedge_the_circuit(monkeypatch):
+    import resilience
+    import config
+    from langchain_core.prompts import ChatPromptTemplate
+    from fake_llm import FakeChatModel
+    from models import DecisionOutput
+    from structured_output import StructuredChain
+
+    monkeypatch.setattr(resilience, "_breakers", {})
+    monkeypatch.setattr(config, "BREAKER_FAILURE_THRESHOLD", 1)
+    monkeypatch.setattr(config, "BREAKER_RESET_SECONDS", 0.05)
+    breaker = resilience.get_breaker("fake")
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    chain = StructuredChain(
+        ChatPromptTemplate.from_messages([("user", "{text}")]),
+        FakeChatModel(latency_seconds=5),
+        DecisionOutput,
+        provider="fake",
+        agent="test"
+    )
+
+    async def cancel_trial():
+        call = asyncio.create_task(chain.ainvoke({"text": "evaluate"}))
+        await asyncio.sleep(0.05)
+        assert breaker.state == "half_open"
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+    asyncio.run(cancel_trial())
+    assert breaker.state == "open"
+    assert breaker.check() is True
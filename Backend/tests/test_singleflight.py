@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+import pytest
+from singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+    started = threading.Event()
+
+    def work():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return 42
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", work)))
+    leader.start()
+    started.wait()
+    waiters = [threading.Thread(target=lambda: results.append(flight.do("key", work))) for _ in range(4)]
+    for thread in waiters:
+        thread.start()
+    for thread in [leader] + waiters:
+        thread.join()
+
+    assert results == [42] * 5
+    assert len(calls) == 1
+
+
+def test_errors_are_shared_and_not_remembered():
+    flight = SingleFlight("test")
+
+    async def main():
+        calls = []
+
+        async def fail():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.ado("key", fail) for _ in range(3)), return_exceptions=True)
+        assert [type(r) for r in results] == [ValueError] * 3
+        assert len(calls) == 1
+
+        async def succeed():
+            return "ok"
+
+        assert await flight.ado("key", succeed) == "ok"
+
+    asyncio.run(main())
+
+
+def test_waiter_takes_over_when_leader_is_cancelled():
+    flight = SingleFlight("test")
+
+    async def main():
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return len(calls)
+
+        leader = asyncio.create_task(flight.ado("key", work))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(flight.ado("key", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await waiter == 2
+        assert len(calls) == 2
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_leaves_the_shared_call_running():
+    flight = SingleFlight("test")
+
+    async def main():
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(flight.ado("key", work))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(flight.ado("key", work))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+
+        assert await leader == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+import random
+import pytest
+from models import CandidateProfile, JobDescription
+from skill_index import CandidateSkillMatrix, JobIndex, rank_candidates
+from skill_matcher import prescore
+
+SKILLS = [
+    "Python", "python3", "FastAPI", "Django", "JavaScript", "JS", "TypeScript", "React.js",
+    "Node.js", "Docker", "Kubernetes", "k8s", "AWS", "PostgreSQL", "Postgres", "Go",
+    "Python (Django, Flask)", "C#", "C++", "REST APIs", "GraphQL", "Redis"
+]
+
+
+def _candidates(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        CandidateProfile(
+            name=f"Candidate {i}", email=None, phone=None, summary="",
+            experience=[], education=[],
+            skills=rng.sample(SKILLS, rng.randint(0, 8)),
+            certifications=rng.sample(["AWS", "Kubernetes", "Scrum"], rng.randint(0, 1)),
+            years_of_experience=rng.choice([None, 0, 1, 3, 5, 8])
+        )
+        for i in range(count)
+    ]
+
+
+JOBS = [
+    JobDescription(
+        title="Backend", description="",
+        required_skills=["Python", "FastAPI", "PostgreSQL", "Docker"],
+        preferred_skills=["Kubernetes", "AWS"], experience_required=5
+    ),
+    JobDescription(
+        title="Frontend", description="",
+        required_skills=["JavaScript", "TypeScript", "React"], preferred_skills=[],
+        experience_required=None
+    ),
+    JobDescription(
+        title="Generalist", description="",
+        required_skills=[], preferred_skills=["Go", "Redis", "GraphQL"], experience_required=2
+    ),
+    JobDescription(
+        title="Overlapping", description="",
+        required_skills=["Python", "python3", "JS", "JavaScript", ""],
+        preferred_skills=["Python", "Docker"], experience_required=3
+    ),
+    JobDescription(
+        title="Anyone", description="", required_skills=[], preferred_skills=[],
+        experience_required=None
+    ),
+]
+
+
+@pytest.mark.parametrize("job", JOBS, ids=[job.title for job in JOBS])
+def test_rank_candidates_matches_prescore(job):
+    candidates = _candidates(200)
+    order, scores = rank_candidates(job, candidates)
+
+    for row, candidate in enumerate(candidates):
+        expected = prescore(candidate, job)
+        assert scores.skill_match_percentage[row] == pytest.approx(expected.skill_match_percentage, abs=0.05)
+        assert scores.required_coverage[row] == pytest.approx(expected.required_coverage)
+        assert scores.experience_gap[row] == expected.experience_gap
+        assert scores.fit_score[row] == pytest.approx(expected.fit_score, abs=0.05)
+
+    fit = [scores.fit_score[row] for row in order]
+    assert fit == sorted(fit, reverse=True)
+
+
+def test_top_k_returns_best_rows():
+    candidates = _candidates(50)
+    order, scores = rank_candidates(JOBS[0], candidates, top_k=5)
+    assert len(order) == 5
+    assert scores.fit_score[order[-1]] >= sorted(scores.fit_score, reverse=True)[4]
+
+
+def test_extended_matrix_scores_like_a_fresh_one():
+    candidates = _candidates(40)
+    matrix = CandidateSkillMatrix.encode(candidates[:25])
+    matrix.extend(candidates[25:])
+    fresh = CandidateSkillMatrix.encode(candidates)
+
+    extended_scores = JobIndex(JOBS[0], matrix.vocabulary).score(matrix)
+    fresh_scores = JobIndex(JOBS[0], fresh.vocabulary).score(fresh)
+    assert list(extended_scores.fit_score) == list(fresh_scores.fit_score)
+
+
+def test_candidate_index_rank_tracks_adds_replacements_and_deletes(tmp_path):
+    from candidate_index import CandidateIndex, HashingEmbedder
+
+    index = CandidateIndex(str(tmp_path), embedder=HashingEmbedder(64))
+    candidates = _candidates(30)
+    for i, candidate in enumerate(candidates[:20]):
+        index.add(f"c{i}", candidate)
+    index.rank(JOBS[0])  # builds the matrix
+
+    for i, candidate in enumerate(candidates[20:], start=20):
+        index.add(f"c{i}", candidate)
+    index.add("c0", candidates[29])
+    index.delete("c1")
+
+    expected = {f"c{i}": candidate for i, candidate in enumerate(candidates)}
+    expected["c0"] = candidates[29]
+    del expected["c1"]
+
+    stored, scores = index.rank(JOBS[0])
+    assert sorted(candidate_id for candidate_id, _ in stored) == sorted(expected)
+    for position, (candidate_id, name) in enumerate(stored):
+        assert name == expected[candidate_id].name
+        assert scores.fit_score[position] == pytest.approx(prescore(expected[candidate_id], JOBS[0]).fit_score, abs=0.05)
+
+    top, top_scores = index.rank(JOBS[0], top_k=3)
+    assert len(top) == 3
+    assert list(top_scores.fit_score) == list(scores.fit_score[:3])
+
+
+def test_rank_endpoint_caps_inline_candidates(monkeypatch):
+    from fastapi import HTTPException
+    import config
+    import main
+    from models import RankRequest
+
+    monkeypatch.setattr(config, "RANK_MAX_INLINE_CANDIDATES", 3)
+    request = RankRequest(job_description=JOBS[0], candidates=_candidates(4), top_k=2)
+    with pytest.raises(HTTPException) as excinfo:
+        main.rank(request)
+    assert excinfo.value.status_code == 400
+
+    request = RankRequest(job_description=JOBS[0], candidates=_candidates(3), top_k=2)
+    assert len(main.rank(request).results) == 2
@@ -0,0 +1,25 @@
+import pytest
+from skill_matcher import normalize_skill, normalize_skills
+
+
+@pytest.mark.parametrize("alias, canonical", [
+    ("JS", "javascript"),
+    ("Node.js", "nodejs"),
+    ("k8s", "kubernetes"),
+    ("C#", "csharp"),
+    (".NET", "dotnet"),
+    ("ASP.NET", "dotnet"),
+    (".NET Core", "dotnet"),
+])
+def test_aliases_fold_to_canonical_names(alias, canonical):
+    assert normalize_skill(alias) == canonical
+
+
+@pytest.mark.parametrize("ambiguous", ["TF", "CV", "net", "Net"])
+def test_ambiguous_abbreviations_are_not_expanded(ambiguous):
+    assert normalize_skill(ambiguous) == ambiguous.lower()
+    assert normalize_skill(ambiguous) not in {"tensorflow", "terraform", "computervision", "dotnet"}
+
+
+def test_compound_entries_are_split():
+    assert normalize_skills(["Python (Django, Flask)"]) >= {"python", "django", "flask"}
@@ -0,0 +1,34 @@
+import asyncio
+from langchain_core.messages import AIMessageChunk
+from streaming import screening_events
+
+DECISION = ['{"recommendation": "hire", ', '"confidence_score": 0.9, ', '"summary": "Strong", ', '"fit": 1}']
+
+
+def _events(chunks):
+    async def stream():
+        for run_id, text in chunks:
+            yield "messages", (AIMessageChunk(content=text, id=run_id), {"langgraph_node": "decision"})
+
+    async def collect():
+        return [item async for item in screening_events(stream())]
+
+    return asyncio.run(collect())
+
+
+def _partials(events):
+    return [data for event, data in events if event == "decision_partial"]
+
+
+def test_interleaved_runs_do_not_re_emit_fields():
+    single = _partials(_events([("a", text) for text in DECISION]))
+    assert [list(fields) for fields in single] == [
+        ["recommendation"],
+        ["recommendation", "confidence_score"],
+        ["recommendation", "confidence_score", "summary"]
+    ]
+
+    # A hedged duplicate streaming alongside: each run reports its own fields once
+    interleaved = [(run_id, text) for text in DECISION for run_id in ("a", "b")]
+    assert _partials(_events(interleaved)) == [fields for fields in single for _ in range(2)]
+
@@ -0,0 +1,51 @@
+import asyncio
+import json
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import ChatPromptTemplate
+import config
+from fake_llm import fake_payload
+from models import DecisionOutput
+from structured_output import StructuredChain
+
+PROMPT = ChatPromptTemplate.from_messages([("user", "Assess the candidate.\n{format_instructions}")])
+VALID = json.dumps(fake_payload("DecisionOutput", "candidate"))
+MISSING_FIELD = json.dumps({key: value for key, value in json.loads(VALID).items() if key != "summary"})
+
+
+class RecordingModel(FakeListChatModel):
+    """Scripted replies, keeping the prompts it was sent"""
+    prompts: list = []
+
+    def _call(self, messages, *args, **kwargs):
+        self.prompts.append("\n".join(message.content for message in messages))
+        return super()._call(messages, *args, **kwargs)
+
+
+def _chain(responses):
+    # A provider without native structured output, so the text parser and repair prompt are used
+    model = RecordingModel(responses=responses, prompts=[])
+    return StructuredChain(PROMPT, model, DecisionOutput, provider="scripted"), model
+
+
+def test_invalid_output_is_repaired_with_a_short_prompt():
+    chain, model = _chain([MISSING_FIELD, VALID])
+    decision = chain.invoke({})
+    assert decision == DecisionOutput.model_validate_json(VALID)
+    assert len(model.prompts) == 2
+    assert "Validation error" in model.prompts[1] and "summary" in model.prompts[1]
+    assert "Assess the candidate" not in model.prompts[1]
+
+
+def test_async_repair_loop_gives_up_after_the_configured_attempts(monkeypatch):
+    monkeypatch.setattr(config, "STRUCTURED_OUTPUT_REPAIR_ATTEMPTS", 2)
+    chain, model = _chain(["not json", MISSING_FIELD, "{}", VALID])
+    with pytest.raises(ValueError, match="Invalid DecisionOutput output"):
+        asyncio.run(chain.ainvoke({}))
+    assert len(model.prompts) == 3
+
+
+def test_valid_output_needs_no_repair():
+    chain, model = _chain([VALID])
+    assert chain.invoke({}).summary
+    assert len(model.prompts) == 1
@@ -0,0 +1,70 @@
+from text_preprocessing import PAGE_BREAK, extract_contacts, preprocess_resume, remove_noise, truncate_to_budget
+
+
+def test_remove_noise_drops_page_numbers_rules_and_boilerplate():
+    lines = ["Jane Doe", "Page 2 of 3", "-----", "Curriculum Vitae", "Python developer", "Python developer"]
+    assert remove_noise(lines) == ["Jane Doe", "Python developer"]
+
+
+def test_remove_noise_keeps_content():
+    lines = ["Acme Corp", "Senior Engineer", "- Built APIs in Python", "References"]
+    assert remove_noise(lines) == lines
+
+
+def test_repeated_header_is_kept_once_on_the_first_page():
+    body = ["Acme Corp", "Senior Engineer", "Built billing APIs", "Led a team of four", "Mentored interns"]
+    pages = [
+        "\n".join(["Jane Doe - Resume", "jane@example.com"] + [f"{line} {i}" for line in body] + [f"Page {i + 1}"])
+        for i in range(3)
+    ]
+    cleaned = preprocess_resume(PAGE_BREAK.join(pages)).text
+    assert cleaned.startswith("Jane Doe - Resume\njane@example.com\nAcme Corp 0")
+    assert cleaned.count("Jane Doe - Resume") == 1
+    assert cleaned.count("jane@example.com") == 1
+    assert "Built billing APIs 2" in cleaned
+
+
+def test_contacts_survive_a_contact_block_repeated_on_every_page():
+    header = "Jane Smith\njane@smith.dev | +1 555 123 4567"
+    pages = [
+        f"{header}\nSUMMARY\nBackend engineer\nSKILLS\nPython, Go\nMore detail",
+        f"{header}\nEXPERIENCE\nAcme Corp\nBuilt APIs\nLed a team",
+    ]
+    result = preprocess_resume(PAGE_BREAK.join(pages))
+    assert result.text.startswith(header)
+    assert result.contacts.emails == ["jane@smith.dev"]
+    assert result.contacts.phones == ["+1 555 123 4567"]
+
+
+def test_truncation_keeps_later_sections_that_still_fit():
+    sections = [
+        ("header", ["Jane Doe"]),
+        ("experience", ["Experience"] + [f"Project {i}: " + "built billing APIs in Python " * 8 for i in range(3)]),
+        ("languages", ["Languages", "English"]),
+    ]
+    text = truncate_to_budget(sections, budget=100)
+    assert "Project 0" in text and "Project 2" not in text
+    assert text.endswith("Languages\nEnglish")
+
+
+def test_remove_noise_keeps_years_and_dates():
+    lines = ["Acme Corp", "2019", "06/2019", "2015 - 2019", "Page 2 of 3"]
+    assert remove_noise(lines) == ["Acme Corp", "2019", "06/2019", "2015 - 2019"]
+
+
+def test_bare_page_numbers_are_dropped_only_at_page_edges():
+    pages = [
+        "Jane Doe\nSenior Engineer\nAcme Corp\n2019\nBuilt billing APIs\n1",
+        "Education\nBSc Computer Science\n2015\n- 2 -",
+        "3\nProjects\nOpen source work\n2021",
+    ]
+    cleaned = preprocess_resume(PAGE_BREAK.join(pages)).text.split("\n")
+    assert "1" not in cleaned and "- 2 -" not in cleaned and "3" not in cleaned
+    assert {"2019", "2015", "2021"} <= set(cleaned)
+
+
+def test_extract_contacts_does_not_join_lines():
+    contacts = extract_contacts("jane@example.com\n+1 (555) 123-4567\n2015 - 2019\nlinkedin.com/in/jane")
+    assert contacts.emails == ["jane@example.com"]
+    assert contacts.phones == ["+1 (555) 123-4567"]
+    assert contacts.urls == ["linkedin.com/in/jane"]
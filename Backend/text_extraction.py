@@ -0,0 +1,129 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from io import BytesIO
+from typing import BinaryIO, Iterator, Optional, Union
+from ingestion import open_mapped
+from text_preprocessing import PAGE_BREAK
+import config
+
+
+# Optional process pool for extracting the pages of large PDFs in parallel
+_page_pool = None
+
+
+def get_page_pool() -> Optional[ProcessPoolExecutor]:
+    """Lazy initialization of the PDF page process pool (None when disabled)"""
+    global _page_pool
+    if _page_pool is None and config.EXTRACTION_PROCESSES > 0:
+        _page_pool = ProcessPoolExecutor(max_workers=config.EXTRACTION_PROCESSES)
+    return _page_pool
+
+
+def _deadline() -> float:
+    return time.monotonic() + config.EXTRACTION_TIME_BUDGET_SECONDS
+
+
+def _join_within_budget(chunks: Iterator[str], max_chars: int, separator: str = "\n") -> str:
+    """Collect chunks until the character budget is spent, then join once"""
+    parts = []
+    total = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if total + len(chunk) >= max_chars:
+            parts.append(chunk[:max_chars - total])
+            break
+        parts.append(chunk)
+        total += len(chunk) + 1
+    return separator.join(parts).strip()
+
+
+def iter_pdf_pages(reader: "PyPDF2.PdfReader", start: int, stop: int, deadline: float) -> Iterator[str]:
+    """
+    Yield page texts in order, starting no new page once the deadline passes
+
+    The deadline is only checked between pages; a page being extracted is
+    not interrupted.
+    """
+    for index in range(start, stop):
+        if time.monotonic() > deadline:
+            return
+        yield reader.pages[index].extract_text() or ""
+
+
+def _extract_pdf_range(source: Union[str, bytes], start: int, stop: int, deadline_seconds: float) -> str:
+    """Process pool worker: extract a contiguous range of pages from a path or bytes"""
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(open_mapped(source) if isinstance(source, str) else BytesIO(source))
+    deadline = time.monotonic() + deadline_seconds
+    return PAGE_BREAK.join(iter_pdf_pages(reader, start, stop, deadline))
+
+
+def _iter_parallel_chunks(source: Union[str, bytes], page_count: int, deadline: float) -> Iterator[str]:
+    """
+    Yield page-range texts in document order from the process pool
+
+    At the deadline the remaining ranges are abandoned; workers already
+    running one stop at their next page boundary.
+    """
+    pool = get_page_pool()
+    chunk_size = max(1, -(-page_count // config.EXTRACTION_PROCESSES))
+    futures = [
+        pool.submit(
+            _extract_pdf_range, source, start, min(start + chunk_size, page_count),
+            max(0.0, deadline - time.monotonic())
+        )
+        for start in range(0, page_count, chunk_size)
+    ]
+    try:
+        for future in futures:
+            remaining = deadline - time.monotonic()
+            done, _ = wait([future], timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+            if not done:
+                return
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def extract_pdf_text(file: BinaryIO, path: Optional[str] = None) -> str:
+    """
+    Extract PDF text within the configured page, character and time budgets
+
+    The time budget is checked between pages, so one pathological page can
+    overrun it.
+
+    When the document is on disk, pass its path so process pool workers map
+    the file themselves instead of receiving a pickled copy.
+    """
+    import PyPDF2
+
+    deadline = _deadline()
+    reader = PyPDF2.PdfReader(file)
+    page_count = min(len(reader.pages), config.EXTRACTION_MAX_PAGES)
+
+    if get_page_pool() is not None and page_count >= config.EXTRACTION_PARALLEL_MIN_PAGES:
+        if path is None:
+            file.seek(0)
+        chunks = _iter_parallel_chunks(path or file.read(), page_count, deadline)
+    else:
+        chunks = iter_pdf_pages(reader, 0, page_count, deadline)
+
+    # Pages are separated by PAGE_BREAK so preprocessing can find repeated headers/footers
+    text = _join_within_budget(chunks, config.EXTRACTION_MAX_CHARS, PAGE_BREAK)
+    if not text and time.monotonic() > deadline:
+        raise ValueError("PDF text extraction ran out of its time budget")
+    return text
+
+
+def extract_docx_text(file: BinaryIO) -> str:
+    """Extract DOCX paragraph text within the configured character budget"""
+    import docx
+
+    document = docx.Document(file)
+    return _join_within_budget(
+        (paragraph.text for paragraph in document.paragraphs),
+        config.EXTRACTION_MAX_CHARS
+    )
@@ -0,0 +1,265 @@
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import config
+
+
+logger = logging.getLogger(__name__)
+
+# Page separator emitted by text_extraction for multi-page documents
+PAGE_BREAK = "\f"
+
+_EMAIL = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE = re.compile(r"(?<![\w/])\+?\(?\d[\d \t().-]{5,}\d(?![\w/])")
+_YEAR_RANGE = re.compile(r"^(?:19|20)\d\d\s*[-.]\s*(?:19|20)\d\d$")
+_URL = re.compile(
+    r"(?:https?://|www\.)[^\s<>()]+|(?:linkedin\.com|github\.com|gitlab\.com)/[^\s<>()]+",
+    re.IGNORECASE
+)
+_PAGE_NUMBER = re.compile(r"^\s*page\s*\d+\s*(?:(?:of|/)\s*\d+)?\s*$", re.IGNORECASE)
+# Bare "2", "- 2 -" or "2/3": only dropped as the first or last line of a page,
+# since years and dates ("2019", "06/2019") often stand on their own line
+_BARE_PAGE_NUMBER = re.compile(r"^\s*[-\u2013]?\s*\d{1,3}\s*(?:(?:of|/)\s*\d{1,3})?\s*[-\u2013]?\s*$", re.IGNORECASE)
+_SEPARATOR_LINE = re.compile(r"^\s*[-=_*~.|\u2022\u00b7]{3,}\s*$")
+_BOILERPLATE = re.compile(
+    r"^\s*(?:curriculum vitae|resume|résumé|cv|references (?:are )?available (?:up)?on request\.?)\s*$",
+    re.IGNORECASE
+)
+
+# Section headings in priority order: earlier sections survive truncation first
+SECTION_PRIORITY = [
+    ("summary", r"summary|professional summary|profile|objective|about me"),
+    ("skills", r"skills|technical skills|core competencies|technologies|tech stack"),
+    ("experience", r"experience|work experience|professional experience|employment(?: history)?|work history"),
+    ("education", r"education|academic background|qualifications"),
+    ("certifications", r"certifications?|licenses?(?: and certifications)?|courses"),
+    ("projects", r"projects|personal projects|key projects"),
+    ("achievements", r"achievements|awards|honou?rs|publications"),
+    ("languages", r"languages"),
+    ("other", r"volunteer(?:ing)?|activities|leadership"),
+    ("interests", r"interests|hobbies"),
+    ("references", r"references"),
+]
+_SECTION_HEADING = re.compile(
+    r"^\s*(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in SECTION_PRIORITY) + r")\s*:?\s*$",
+    re.IGNORECASE
+)
+_SECTION_RANK = {name: rank for rank, (name, _) in enumerate(SECTION_PRIORITY)}
+
+
+@dataclass
+class ContactInfo:
+    """Contact details found with regular expressions"""
+    emails: List[str] = field(default_factory=list)
+    phones: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+
+    def as_prompt_text(self) -> str:
+        lines = []
+        if self.emails:
+            lines.append(f"Email: {', '.join(self.emails)}")
+        if self.phones:
+            lines.append(f"Phone: {', '.join(self.phones)}")
+        if self.urls:
+            lines.append(f"Links: {', '.join(self.urls)}")
+        return "\n".join(lines) or "None found"
+
+    def apply_to(self, profile):
+        """Fill in contact details the LLM left out of a CandidateProfile"""
+        if not profile.email and self.emails:
+            profile.email = self.emails[0]
+        if not profile.phone and self.phones:
+            profile.phone = self.phones[0]
+        return profile
+
+
+@dataclass
+class PreprocessedResume:
+    """Cleaned resume text ready for the parsing prompt"""
+    text: str
+    contacts: ContactInfo
+    tokens_before: int
+    tokens_after: int
+
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken when available, else ~4 characters per token"""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return len(text) // 4
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines, keeping page breaks"""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = re.sub(r"[ \t\u00a0\u2000-\u200b]+", " ", text)
+    text = re.sub(r" *\n *", "\n", text)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def _line_key(line: str) -> str:
+    """Header/footer identity ignoring page numbers (years are kept, so dates differ)"""
+    return re.sub(r"(?<!\d)\d{1,3}(?!\d)", "#", line.strip().lower())
+
+
+def remove_repeated_margins(pages: List[List[str]], margin: int = 3) -> List[List[str]]:
+    """
+    Drop lines repeated in the top or bottom margin of most pages
+
+    The first copy is kept, since a header repeated on every page is often
+    the candidate's name and contact block.
+    """
+    if len(pages) < 2:
+        return pages
+    counts = Counter()
+    for lines in pages:
+        counts.update({_line_key(line) for line in lines[:margin] + lines[-margin:] if line.strip()})
+    threshold = max(2, (len(pages) + 1) // 2)
+    repeated = {key for key, count in counts.items() if count >= threshold}
+
+    seen = set()
+
+    def keep(line: str) -> bool:
+        key = _line_key(line)
+        if key not in repeated:
+            return True
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    cleaned = []
+    for lines in pages:
+        head = [line for line in lines[:margin] if keep(line)]
+        body = lines[margin:-margin] if len(lines) > 2 * margin else []
+        tail_start = max(margin, len(lines) - margin)
+        tail = [line for line in lines[tail_start:] if keep(line)]
+        cleaned.append(head + body + tail)
+    return cleaned
+
+
+def remove_page_numbers(pages: List[List[str]]) -> List[List[str]]:
+    """Drop bare page numbers on the first or last line of each page"""
+    cleaned = []
+    for lines in pages:
+        lines = list(lines)
+        if lines and _BARE_PAGE_NUMBER.match(lines[-1]):
+            lines.pop()
+        if lines and _BARE_PAGE_NUMBER.match(lines[0]):
+            lines.pop(0)
+        cleaned.append(lines)
+    return cleaned
+
+
+def remove_noise(lines: List[str]) -> List[str]:
+    """Drop "Page N" lines, separator rules, boilerplate and consecutive duplicates"""
+    kept = []
+    for line in lines:
+        if _PAGE_NUMBER.match(line) or _SEPARATOR_LINE.match(line) or _BOILERPLATE.match(line):
+            continue
+        if kept and line.strip() and line.strip() == kept[-1].strip():
+            continue
+        kept.append(line)
+    return kept
+
+
+def extract_contacts(text: str) -> ContactInfo:
+    """Pre-extract emails, phone numbers and links so the LLM need not"""
+    def unique(values):
+        return list(dict.fromkeys(value.strip().rstrip(".,;") for value in values))
+
+    emails = unique(_EMAIL.findall(text))
+    text_without_emails = _EMAIL.sub(" ", text)
+    urls = unique(_URL.findall(text_without_emails))
+    text_without_urls = _URL.sub(" ", text_without_emails)
+    phones = [
+        phone for phone in unique(_PHONE.findall(text_without_urls))
+        if 7 <= sum(ch.isdigit() for ch in phone) <= 15 and not _YEAR_RANGE.match(phone)
+    ]
+    return ContactInfo(emails=emails[:3], phones=phones[:3], urls=urls[:5])
+
+
+def split_sections(lines: List[str]) -> List[Tuple[str, List[str]]]:
+    """Split lines into (section name, lines) at recognised headings"""
+    sections = [("header", [])]
+    for line in lines:
+        match = _SECTION_HEADING.match(line) if len(line) < 60 else None
+        if match:
+            sections.append((match.lastgroup, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, body) for name, body in sections if any(l.strip() for l in body)]
+
+
+def truncate_to_budget(sections: List[Tuple[str, List[str]]], budget: int) -> str:
+    """
+    Keep sections by priority until the token budget is spent
+
+    The header (name and contact block) always comes first, then sections in
+    SECTION_PRIORITY order; a section that overflows is cut at a line
+    boundary and smaller sections after it are still kept if they fit.
+    Surviving sections keep their original document order.
+    """
+    order = sorted(
+        range(len(sections)),
+        key=lambda i: (-1 if sections[i][0] == "header" else _SECTION_RANK.get(sections[i][0], len(_SECTION_RANK)), i)
+    )
+    kept = {}
+    remaining = budget
+    for index in order:
+        name, body = sections[index]
+        section_text = "\n".join(body)
+        tokens = count_tokens(section_text)
+        if tokens <= remaining:
+            kept[index] = section_text
+            remaining -= tokens
+            continue
+        partial = []
+        for line in body:
+            line_tokens = count_tokens(line) + 1
+            if line_tokens > remaining:
+                break
+            partial.append(line)
+            remaining -= line_tokens
+        if len(partial) > 1 or (partial and name == "header"):
+            kept[index] = "\n".join(partial)
+        else:
+            remaining += sum(count_tokens(line) + 1 for line in partial)
+    return "\n".join(kept[index] for index in sorted(kept))
+
+
+def preprocess_resume(text: str, token_budget: Optional[int] = None) -> PreprocessedResume:
+    """Clean extracted resume text and fit it to the prompt token budget"""
+    token_budget = token_budget or config.RESUME_TOKEN_BUDGET
+    tokens_before = count_tokens(text)
+
+    # Contacts come from the full text, before any header or footer line is dropped
+    contacts = extract_contacts(normalize_whitespace(text.replace(PAGE_BREAK, "\n")))
+
+    pages = [normalize_whitespace(page).split("\n") for page in text.split(PAGE_BREAK)]
+    pages = remove_page_numbers(remove_repeated_margins(pages))
+    lines = remove_noise([line for page in pages for line in page])
+    cleaned = normalize_whitespace("\n".join(lines))
+    if count_tokens(cleaned) > token_budget:
+        cleaned = truncate_to_budget(split_sections(cleaned.split("\n")), token_budget)
+
+    tokens_after = count_tokens(cleaned)
+    logger.info(
+        "Resume preprocessing: %d -> %d tokens (%.0f%% saved)",
+        tokens_before,
+        tokens_after,
+        100 * (1 - tokens_after / tokens_before) if tokens_before else 0
+    )
+    return PreprocessedResume(cleaned, contacts, tokens_before, tokens_after)
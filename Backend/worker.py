@@ -0,0 +1,130 @@
+"""
+Background screening workers for the durable job queue
+
+Usage: python worker.py [--processes N] [--concurrency M]
+
+Each process claims jobs from JOB_QUEUE_DIR and runs up to M screenings at
+once. Workers scale independently of the API processes that enqueue jobs.
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+from agent_graph import ResumeScreeningGraph
+from job_queue import JobQueue, get_job_queue
+from rate_limiter import llm_priority, BATCH
+import config
+
+
+logger = logging.getLogger("worker")
+
+
+async def run_job(graph: ResumeScreeningGraph, queue: JobQueue, job: dict):
+    """Run one claimed job, checkpointing the parsed profile before the decision"""
+    state = {}
+    try:
+        stream = graph.astream(
+            resume_path=job["resume_path"],
+            filename=job["filename"],
+            job_description=job["job_description"],
+            resume_sha256=job["resume_sha256"],
+            mode=job["mode"],
+            candidate_profile=job["candidate_profile"],
+            stream_mode=["updates"],
+            screening_id=job["id"]
+        )
+        async for mode, update in stream:
+            if mode != "updates":
+                state.update(update)
+                continue
+            for node, node_state in update.items():
+                if not node_state:
+                    continue
+                state.update(node_state)
+                if node in ("parse_resume", "screen") and node_state.get("candidate_profile"):
+                    await asyncio.to_thread(queue.checkpoint, job["id"], node_state["candidate_profile"])
+        error = state.get("error") or (None if state.get("decision") else "Screening ended without a decision")
+    except Exception as e:
+        error = f"Internal error: {str(e)}"
+
+    if error:
+        logger.warning("Job %s attempt %d failed: %s", job["id"], job["attempts"], error)
+        await asyncio.to_thread(queue.fail, job["id"], error, job["attempts"], job["max_attempts"])
+    else:
+        logger.info("Job %s succeeded", job["id"])
+        await asyncio.to_thread(queue.complete, job["id"], state["candidate_profile"], state["decision"])
+
+
+async def work(concurrency: int):
+    """Claim and run jobs until SIGTERM/SIGINT, then finish the jobs in flight"""
+    queue = get_job_queue()
+    graph = ResumeScreeningGraph()
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = set()
+    # Queued work yields to interactive /screen calls at the LLM rate limiter
+    with llm_priority(BATCH):
+        while not stopping.is_set():
+            await semaphore.acquire()
+            job = await asyncio.to_thread(queue.claim)
+            if job is None:
+                semaphore.release()
+                try:
+                    await asyncio.wait_for(stopping.wait(), timeout=config.JOB_POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(run_job(graph, queue, job))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda _: semaphore.release())
+
+        if tasks:
+            logger.info("Finishing %d running jobs", len(tasks))
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_process(concurrency: int):
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [{os.getpid()}] %(message)s")
+    asyncio.run(work(concurrency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background screening workers")
+    parser.add_argument("--processes", type=int, default=config.JOB_WORKER_PROCESSES)
+    parser.add_argument("--concurrency", type=int, default=config.JOB_WORKER_CONCURRENCY)
+    args = parser.parse_args()
+
+    if not config.JOB_QUEUE_DIR:
+        raise SystemExit("JOB_QUEUE_DIR is not set")
+
+    if args.processes <= 1:
+        run_process(args.concurrency)
+        return
+
+    processes = [
+        multiprocessing.Process(target=run_process, args=(args.concurrency,), name=f"worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, _frame):
+        for process in processes:
+            if process.is_alive():
+                os.kill(process.pid, signum)
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,32 @@ export interface ScreeningResponse {
   status: string;
 }
 
+export interface BatchScreeningResult {
+  index: number;
+  filename: string;
+  status: 'success' | 'error';
+  candidate_profile?: CandidateProfile;
+  decision?: DecisionOutput;
+  error?: string;
+}
+
+export interface BatchScreeningSummary {
+  total: number;
+  succeeded: number;
+  failed: number;
+  status: string;
+}
+
+export type ScreeningStreamEvent =
+  | { event: 'stage'; data: { stage: string; [key: string]: unknown } }
+  | { event: 'profile_partial'; data: Partial<CandidateProfile> }
+  | { event: 'decision_partial'; data: Partial<DecisionOutput> }
+  | { event: 'token'; data: { node: string; text: string } }
+  | { event: 'profile'; data: CandidateProfile }
+  | { event: 'decision'; data: DecisionOutput }
+  | { event: 'result'; data: ScreeningResponse }
+  | { event: 'error'; data: { detail: string } };
+
 export interface JobData {
   title: string;
   description: string;
@@ -106,6 +132,126 @@ export const api = {
 
     return response.json();
   },
+
+  // Screen resume, streaming progress and partial results as Server-Sent Events
+  async screenResumeStream(
+    resumeFile: File,
+    jobData: JobData,
+    onEvent: (event: ScreeningStreamEvent) => void,
+    mode?: 'two_stage' | 'single_call'
+  ): Promise<ScreeningResponse> {
+    const formData = new FormData();
+    formData.append('resume', resumeFile);
+    formData.append('job_data', JSON.stringify(jobData));
+
+    if (mode) {
+      formData.append('mode', mode);
+    }
+
+    const response = await fetch(`${API_BASE_URL}/screen-stream`, {
+      method: 'POST',
+      body: formData,
+    });
+
+    if (!response.ok || !response.body) {
+      const errorData = await response.json();
+      throw new Error(errorData.detail || 'Failed to screen resume');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result: ScreeningResponse | null = null;
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const messages = buffer.split('\n\n');
+      buffer = messages.pop() ?? '';
+
+      for (const message of messages) {
+        let event = 'message';
+        let data = '';
+        for (const line of message.split('\n')) {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          else if (line.startsWith('data: ')) data += line.slice(6);
+        }
+        if (!data) continue;
+
+        const parsed = { event, data: JSON.parse(data) } as ScreeningStreamEvent;
+        onEvent(parsed);
+        if (parsed.event === 'result') {
+          result = parsed.data;
+        } else if (parsed.event === 'error') {
+          throw new Error(parsed.data.detail || 'Failed to screen resume');
+        }
+      }
+    }
+
+    if (!result) {
+      throw new Error('Screening stream ended unexpectedly');
+    }
+
+    return result;
+  },
+
+  // Screen many resumes against one job, streaming NDJSON results as they finish
+  async screenResumesBatch(
+    resumeFiles: File[],
+    jobData: JobData,
+    onResult: (result: BatchScreeningResult) => void,
+    concurrency?: number
+  ): Promise<BatchScreeningSummary> {
+    const formData = new FormData();
+    resumeFiles.forEach(file => formData.append('resumes', file));
+    formData.append('job_data', JSON.stringify(jobData));
+
+    if (concurrency) {
+      formData.append('concurrency', String(concurrency));
+    }
+
+    const response = await fetch(`${API_BASE_URL}/screen-batch`, {
+      method: 'POST',
+      body: formData,
+    });
+
+    if (!response.ok || !response.body) {
+      const errorData = await response.json();
+      throw new Error(errorData.detail || 'Failed to screen resumes');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let summary: BatchScreeningSummary | null = null;
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop() ?? '';
+
+      for (const line of lines) {
+        if (!line.trim()) continue;
+        const record = JSON.parse(line);
+        if ('index' in record) {
+          onResult(record as BatchScreeningResult);
+        } else {
+          summary = record as BatchScreeningSummary;
+        }
+      }
+    }
+
+    if (!summary) {
+      throw new Error('Batch screening ended unexpectedly');
+    }
+
+    return summary;
+  },
 };
 
 // Utility functions